@@ -0,0 +1,76 @@
+"""bench_address_info.py
+
+Measures memory per instance and construction time of `BlockchainAddressInfo`,
+compared with its original representation: a plain dataclass with a per-instance `__dict__`.
+
+Usage:
+    python -m benchmarks.bench_address_info
+"""
+
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from traitkeyless import AddressType, BlockchainAddressInfo, decode_address, encode_transactional_addresses
+
+INSTANCES = 100_000
+ACCOUNT_ID = "0x7b00000002c801000033399aeb61b087f1a20a58c41ea5ff1b7bfb2fda27bfc0"
+ACCOUNT_ID_BYTES = bytes.fromhex(ACCOUNT_ID[2:])
+ADDRESS = "ttowKp8AmjjQh4GoN7xMiQWwVyyrU1Pu7GRf5HxFmV5t43TXG"
+
+
+@dataclass
+class OriginalBlockchainAddressInfo:
+    address: str
+    account_id: str
+    address_type: AddressType
+    app_agent_id: int | None
+    ta_id: int | None
+    address_name: str | None
+
+
+def measure_memory(create: Callable[[int], object]) -> float:
+    """Return memory allocated per instance, excluding the shared field values."""
+    tracemalloc.start()
+    instances = [create(ta_id) for ta_id in range(INSTANCES)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Memory of the list holding the instances isn't a part of instances
+    return (allocated - 8 * len(instances)) / len(instances)
+
+
+def measure_time(create: Callable[[int], object]) -> float:
+    """Return construction time per instance, in microseconds."""
+    return timeit.timeit(lambda: create(1), number=INSTANCES) / INSTANCES * 1e6
+
+
+def main() -> None:
+    constructors: dict[str, Callable[[int], object]] = {
+        "original dataclass": lambda ta_id: OriginalBlockchainAddressInfo(
+            ADDRESS, ACCOUNT_ID, AddressType.Transactional, 123, ta_id, None
+        ),
+        "BlockchainAddressInfo": lambda ta_id: BlockchainAddressInfo(
+            ADDRESS, ACCOUNT_ID, AddressType.Transactional, 123, ta_id, None
+        ),
+        "BlockchainAddressInfo.from_account_id_bytes": lambda ta_id: BlockchainAddressInfo.from_account_id_bytes(
+            address=ADDRESS,
+            account_id_bytes=ACCOUNT_ID_BYTES,
+            address_type=AddressType.Transactional,
+            app_agent_id=123,
+            ta_id=ta_id,
+            address_name=None,
+        ),
+    }
+
+    for name, create in constructors.items():
+        print(f"{name:<44} {measure_memory(create):7.1f} bytes {measure_time(create):7.3f} us per instance")
+
+    addresses = encode_transactional_addresses(123, range(INSTANCES // 10))
+    seconds = timeit.timeit(lambda: [decode_address(address) for address in addresses], number=1)
+    print(f"{'decode_address':<44} {seconds / len(addresses) * 1e6:19.3f} us per address")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""bench_app_agent_table.py
+
+Measures the startup cost and the memory per entry of `AppAgentAddressTable`, and compares its encoding
+and decoding with `KeylessCodec`.
+
+Usage:
+    python -m benchmarks.bench_app_agent_table
+"""
+
+import time
+import timeit
+
+from traitkeyless import KeylessCodec
+from traitkeyless.table import AppAgentAddressTable
+
+ITERATIONS = 100_000
+TABLE_SIZES = (1_000, 10_000, 100_000)
+
+
+def main() -> None:
+    codec = KeylessCodec()
+    for size in TABLE_SIZES:
+        started = time.perf_counter()
+        table = AppAgentAddressTable(size - 1)
+        startup_seconds = time.perf_counter() - started
+
+        app_agent_id = size // 2
+        address = codec.encode_app_agent_address(app_agent_id)
+        timings = {
+            "encode, codec": timeit.timeit(lambda: codec.encode_app_agent_address(app_agent_id), number=ITERATIONS),  # noqa: B023
+            "encode, table": timeit.timeit(lambda: table.encode_app_agent_address(app_agent_id), number=ITERATIONS),  # noqa: B023
+            "decode, codec": timeit.timeit(lambda: codec.decode_app_agent_address(address), number=ITERATIONS),  # noqa: B023
+            "decode, table": timeit.timeit(lambda: table.decode_app_agent_address(address), number=ITERATIONS),  # noqa: B023
+        }
+
+        print(f"Table of {size} AppAgents:")
+        print(f"  {'startup':<22} {startup_seconds * 1e3:8.1f} ms")
+        print(f"  {'memory per entry':<22} {table.memory_footprint() / len(table):8.1f} bytes")
+        for name, seconds in timings.items():
+            print(f"  {name:<22} {seconds / ITERATIONS * 1e6:8.3f} us per address")
+
+
+if __name__ == "__main__":
+    main()
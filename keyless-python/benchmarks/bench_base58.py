@@ -0,0 +1,38 @@
+"""bench_base58.py
+
+Compares the Base58 codec of `traitkeyless.ss58`, specialized for addresses of 32 bytes account IDs,
+with the generic `base58` package.
+
+Usage:
+    python -m benchmarks.bench_base58
+"""
+
+import timeit
+
+import base58
+
+from traitkeyless.ss58 import b58decode, b58encode, ss58_format_to_bytes
+
+ITERATIONS = 100_000
+ACCOUNT_ID = bytes.fromhex("7b00000001293833058fc7db52fc03f6ce344bca98bd7825ff747743f1ff63e2")
+
+
+def main() -> None:
+    for ss58_format in [42, 5335]:
+        payload = ss58_format_to_bytes(ss58_format) + ACCOUNT_ID + b"\x00\x00"
+        address = b58encode(payload)
+
+        timings = {
+            "encode, base58": timeit.timeit(lambda: base58.b58encode(payload).decode(), number=ITERATIONS),  # noqa: B023
+            "encode, traitkeyless": timeit.timeit(lambda: b58encode(payload), number=ITERATIONS),  # noqa: B023
+            "decode, base58": timeit.timeit(lambda: base58.b58decode(address), number=ITERATIONS),  # noqa: B023
+            "decode, traitkeyless": timeit.timeit(lambda: b58decode(address), number=ITERATIONS),  # noqa: B023
+        }
+
+        print(f"SS58 format {ss58_format}, {len(address)} chars:")
+        for name, seconds in timings.items():
+            print(f"  {name:<22} {seconds / ITERATIONS * 1e6:8.3f} us per address")
+
+
+if __name__ == "__main__":
+    main()
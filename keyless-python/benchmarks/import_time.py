@@ -0,0 +1,166 @@
+"""import_time.py
+
+Measures the time of importing `traitkeyless` in fresh interpreters, and checks it against a budget.
+
+Every statement is run by a new interpreter with `python -X importtime`, and the time is the sum of the
+cumulative times of the modules it imports, without the modules imported by the interpreter startup.
+The median of several runs is compared with the budget of the statement, in microseconds,
+saved in `import_budget.json`. Releases are checked against the budget on a quiet machine, and the budget
+is changed only together with the change that justifies it.
+
+Absolute times depend on the machine, so on shared machines, e.g. in CI, the statements are compared
+with another copy of the package instead, e.g. a checkout of the target branch, measured in the same run:
+the runs of the two copies alternate, and a statement fails if its median is slower than the median
+of the other copy by more than the threshold. Statements the other copy can't run are skipped.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --repeat 21 --budget benchmarks/import_budget.json
+    python -m benchmarks.import_time --baseline ../main/keyless-python --threshold 0.2
+    python -X importtime -c "import traitkeyless"  # to see what is imported
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BUDGET_PATH = Path(__file__).with_name("import_budget.json")
+
+
+def _imports(statement: str, path: Path | None = None) -> dict[str, int]:
+    """
+    Run a statement in a new interpreter and collect the top-level imports it reports.
+
+    Args:
+        statement (str): Statement to run.
+        path (Path | None): Directory of the package to import, the current directory by default.
+
+    Returns:
+        dict[str, int]: Cumulative import time of every top-level module, in microseconds.
+    """
+    # The directory of `-c` statements is the first one on `sys.path`, before the installed packages
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=path,
+    )
+
+    imports = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Modules imported by other modules are indented by two more spaces
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+
+    return imports
+
+
+def _import_time(statement: str, startup: set[str], path: Path | None = None) -> int:
+    """Measure the time of the imports done by a statement once, in microseconds."""
+    return sum(microseconds for name, microseconds in _imports(statement, path).items() if name not in startup)
+
+
+def measure(statement: str, repeat: int) -> int:
+    """
+    Measure the import time of a statement.
+
+    Returns:
+        int: Median time of the imports done by the statement, in microseconds.
+    """
+    startup = set(_imports("pass"))
+    times = [_import_time(statement, startup) for _ in range(repeat)]
+
+    return int(statistics.median(times))
+
+
+def measure_against(statement: str, repeat: int, baseline: Path) -> tuple[int, int | None]:
+    """
+    Measure the import time of a statement, and of the same statement importing the package from another directory.
+
+    The runs of the two packages alternate, so that both are measured under the same load of the machine.
+
+    Returns:
+        tuple[int, int | None]: Median times of the imports done by the statement, in microseconds,
+        the second one is None if the statement fails with the other package.
+    """
+    startup = set(_imports("pass"))
+    times = []
+    baseline_times: list[int] | None = []
+    for _ in range(repeat):
+        times.append(_import_time(statement, startup))
+        if baseline_times is not None:
+            try:
+                baseline_times.append(_import_time(statement, startup, baseline))
+            except subprocess.CalledProcessError:
+                baseline_times = None
+
+    return int(statistics.median(times)), int(statistics.median(baseline_times)) if baseline_times else None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time", description=__doc__.splitlines()[2])
+    parser.add_argument("--budget", default=BUDGET_PATH, help="JSON file with the budget of every statement")
+    parser.add_argument("--repeat", type=int, default=11, help="number of interpreters run for a statement")
+    parser.add_argument(
+        "--baseline", type=Path, help="directory of another copy of the package to compare with, instead of the budget"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="relative slowdown against the baseline reported (default: 0.2)"
+    )
+    arguments = parser.parse_args(argv)
+
+    with Path(arguments.budget).open(encoding="utf-8") as file:
+        budget: dict[str, int] = json.load(file)
+
+    if arguments.baseline is not None:
+        return _compare(budget, arguments.repeat, arguments.baseline, arguments.threshold)
+
+    over_budget = []
+    print(f"{'statement':<56} {'budget':>10} {'median':>10}")
+    for statement, budget_microseconds in budget.items():
+        microseconds = measure(statement, arguments.repeat)
+        flag = ""
+        if microseconds > budget_microseconds:
+            over_budget.append(statement)
+            flag = "  OVER BUDGET"
+        print(f"{statement:<56} {budget_microseconds:8} us {microseconds:7} us{flag}")
+
+    if over_budget:
+        print(f"{len(over_budget)} statements are over the import time budget")
+        return 1
+
+    return 0
+
+
+def _compare(budget: dict[str, int], repeat: int, baseline: Path, threshold: float) -> int:
+    """Compare the statements of the budget with the same statements importing another copy of the package."""
+    slower = []
+    print(f"{'statement':<56} {'baseline':>10} {'median':>10}")
+    for statement in budget:
+        microseconds, baseline_microseconds = measure_against(statement, repeat, baseline)
+        if baseline_microseconds is None:
+            print(f"{statement:<56} {'n/a':>10} {microseconds:7} us")
+            continue
+
+        flag = ""
+        if microseconds > baseline_microseconds * (1 + threshold):
+            slower.append(statement)
+            flag = "  SLOWER"
+        print(f"{statement:<56} {baseline_microseconds:7} us {microseconds:7} us{flag}")
+
+    if slower:
+        print(f"{len(slower)} statements are slower than the baseline by more than {threshold:.0%}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
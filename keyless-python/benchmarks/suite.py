@@ -0,0 +1,339 @@
+"""suite.py
+
+Measures every encoding and decoding path of `traitkeyless`, and compares the results with a saved baseline.
+
+Covered paths: encoding and decoding of every address type, `ss58_encode` and `ss58_decode`,
+SS58 formats encoded in 1 byte (42) and in 2 bytes (5335), valid and invalid input,
+and batch functions with batches of 1 to 10^6 addresses.
+Results are reported in microseconds per address and can be saved as JSON.
+
+The full run with batches of up to 10^6 addresses takes several minutes,
+pass `--max-batch-size 10000` for a quick run.
+
+Usage:
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.1
+    python -m benchmarks.suite --filter "decode_.*ss58=42" --max-batch-size 10000
+"""
+
+import argparse
+import json
+import platform
+import re
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+from functools import partial
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+import traitkeyless
+from traitkeyless import KeylessCodec
+from traitkeyless.ss58 import get_ss58_format, ss58_decode, ss58_encode, transcode_addresses
+
+SS58_FORMATS = (42, 5335)
+BATCH_SIZES = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+ACCOUNT_ID = "0x7b00000002c801000033399aeb61b087f1a20a58c41ea5ff1b7bfb2fda27bfc0"
+# Measurements of a benchmark are repeated only if a single measurement is shorter than this
+LONG_RUN_SECONDS = 2.0
+
+# Benchmark: name, function to measure, and number of addresses handled by one call of the function
+Benchmark = tuple[str, Callable[[], object], int]
+
+
+def _raises(function: Callable[..., object], *args: object) -> Callable[[], object]:
+    """Wrap a function that is expected to raise ValueError for the given arguments."""
+
+    def call() -> None:
+        try:
+            function(*args)
+        except ValueError:
+            pass
+        else:
+            msg = f"{function.__name__}{args} didn't fail"
+            raise AssertionError(msg)
+
+    return call
+
+
+def _corrupt(address: str) -> str:
+    """Replace the last character of an address, which breaks its SS58 checksum."""
+    return address[:-1] + ("q" if address[-1] != "q" else "r")
+
+
+def single_address_benchmarks(ss58_format: int) -> Iterator[Benchmark]:
+    """Benchmarks of functions that handle one address, in one SS58 format."""
+    suffix = f"ss58={ss58_format}"
+    app_agent_address = traitkeyless.encode_app_agent_address(123, ss58_format)
+    transactional_address = traitkeyless.encode_transactional_address(123, 456, ss58_format)
+    named_address = traitkeyless.encode_named_address(123, "hot-wallet", ss58_format)
+    regular_address = ss58_encode(ACCOUNT_ID[:-2] + "00", ss58_format)
+
+    yield (
+        f"encode_app_agent_address/{suffix}",
+        lambda: traitkeyless.encode_app_agent_address(123, ss58_format),
+        1,
+    )
+    yield (
+        f"encode_transactional_address/{suffix}",
+        lambda: traitkeyless.encode_transactional_address(123, 456, ss58_format),
+        1,
+    )
+    yield (
+        f"encode_named_address/{suffix}",
+        lambda: traitkeyless.encode_named_address(123, "hot-wallet", ss58_format),
+        1,
+    )
+    yield (
+        f"decode_app_agent_address/{suffix}",
+        lambda: traitkeyless.decode_app_agent_address(app_agent_address, ss58_format),
+        1,
+    )
+    yield (
+        f"decode_transactional_address/{suffix}",
+        lambda: traitkeyless.decode_transactional_address(transactional_address, ss58_format),
+        1,
+    )
+    yield (
+        f"decode_named_address/{suffix}",
+        lambda: traitkeyless.decode_named_address(named_address, ss58_format),
+        1,
+    )
+    yield (
+        f"decode_address/regular/{suffix}",
+        lambda: traitkeyless.decode_address(regular_address, ss58_format),
+        1,
+    )
+    for verify in ("ss58", "none"):
+        yield (
+            f"decode_address/verify={verify}/{suffix}",
+            partial(traitkeyless.decode_address, transactional_address, ss58_format, verify=verify),
+            1,
+        )
+    yield (
+        f"decode_address/detect_format/{suffix}",
+        lambda: traitkeyless.decode_address(transactional_address, None),
+        1,
+    )
+    yield (
+        f"get_ss58_format+decode_address/{suffix}",
+        lambda: traitkeyless.decode_address(transactional_address, get_ss58_format(transactional_address)),
+        1,
+    )
+    yield (f"ss58_encode/{suffix}", lambda: ss58_encode(ACCOUNT_ID, ss58_format), 1)
+    yield (f"ss58_decode/{suffix}", lambda: ss58_decode(transactional_address, ss58_format), 1)
+
+    # Invalid input
+    invalid_checksum = _corrupt(transactional_address)
+    invalid_character = transactional_address[:-1] + "0"
+    yield (
+        f"decode_address/invalid_checksum/{suffix}",
+        _raises(traitkeyless.decode_address, invalid_checksum, ss58_format),
+        1,
+    )
+    yield (
+        f"decode_address/invalid_character/{suffix}",
+        _raises(traitkeyless.decode_address, invalid_character, ss58_format),
+        1,
+    )
+    yield (
+        f"try_decode_address/invalid_checksum/{suffix}",
+        lambda: traitkeyless.try_decode_address(invalid_checksum, ss58_format),
+        1,
+    )
+    yield (
+        f"decode_app_agent_address/wrong_type/{suffix}",
+        _raises(traitkeyless.decode_app_agent_address, transactional_address, ss58_format),
+        1,
+    )
+
+
+def batch_benchmarks(ss58_format: int, batch_sizes: list[int]) -> Iterator[Benchmark]:
+    """Benchmarks of functions that handle many addresses, in one SS58 format."""
+    codec = KeylessCodec(ss58_format)
+    addresses = codec.encode_transactional_addresses(123, range(max(batch_sizes, default=0)))
+    account_ids = traitkeyless.encode_transactional_account_ids(123, range(max(batch_sizes, default=0)))
+
+    for batch_size in batch_sizes:
+        suffix = f"ss58={ss58_format}/batch={batch_size}"
+        ids = range(batch_size)
+        batch = addresses[:batch_size]
+
+        yield (
+            f"encode_app_agent_addresses/{suffix}",
+            partial(traitkeyless.encode_app_agent_addresses, ids, ss58_format),
+            batch_size,
+        )
+        yield (
+            f"encode_transactional_addresses/{suffix}",
+            partial(traitkeyless.encode_transactional_addresses, 123, ids, ss58_format),
+            batch_size,
+        )
+        yield (
+            f"iter_transactional_addresses/{suffix}",
+            partial(_encode_lazily, batch_size, ss58_format),
+            batch_size,
+        )
+        yield (
+            f"transcode_addresses/{suffix}",
+            partial(_transcode_all, batch, ss58_format, SS58_FORMATS[ss58_format == SS58_FORMATS[0]]),
+            batch_size,
+        )
+        yield (
+            f"encode_transactional_account_ids/{suffix}",
+            partial(traitkeyless.encode_transactional_account_ids, 123, ids),
+            batch_size,
+        )
+        yield (
+            f"decode_account_ids/{suffix}",
+            partial(traitkeyless.decode_account_ids, account_ids[: 32 * batch_size], ss58_format),
+            batch_size,
+        )
+        yield (
+            f"filter_by_app_agents/foreign/{suffix}",
+            partial(_filter_all, batch, ss58_format, [124]),
+            batch_size,
+        )
+        yield (
+            f"group_by_app_agent/{suffix}",
+            partial(traitkeyless.group_by_app_agent, batch, ss58_format),
+            batch_size,
+        )
+        yield (f"KeylessCodec.decode_address/{suffix}", partial(_decode_all, codec, batch), batch_size)
+        yield (f"classify_address/{suffix}", partial(_classify_all, codec, batch), batch_size)
+
+
+def _encode_lazily(batch_size: int, ss58_format: int) -> list[tuple[int, str]]:
+    return list(traitkeyless.iter_transactional_addresses(123, 0, batch_size, ss58_format))
+
+
+def _transcode_all(addresses: list[str], from_format: int, to_format: int) -> list[str]:
+    return list(transcode_addresses(addresses, from_format, to_format))
+
+
+def _filter_all(
+    addresses: list[str], ss58_format: int, app_agent_ids: list[int]
+) -> list[traitkeyless.BlockchainAddressInfo]:
+    return list(traitkeyless.filter_by_app_agents(addresses, app_agent_ids, ss58_format))
+
+
+def _decode_all(codec: KeylessCodec, addresses: list[str]) -> list[traitkeyless.BlockchainAddressInfo]:
+    return [codec.decode_address(address) for address in addresses]
+
+
+def _classify_all(codec: KeylessCodec, addresses: list[str]) -> list[traitkeyless.AddressType | None]:
+    return [codec.classify_address(address) for address in addresses]
+
+
+def measure(function: Callable[[], object], addresses: int, repeat: int) -> float:
+    """
+    Measure a function, taking the best of several measurements that last at least 0.2 s each.
+
+    Returns:
+        float: Time per address, in microseconds.
+    """
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    best = elapsed / number
+    if elapsed < LONG_RUN_SECONDS:
+        best = min(best, *(seconds / number for seconds in timer.repeat(repeat, number)))
+
+    return best / addresses * 1e6
+
+
+def _package_version() -> str:
+    try:
+        return version("traitkeyless")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def run(name_filter: str | None, max_batch_size: int, repeat: int) -> dict[str, Any]:
+    """Run the benchmarks and collect their results into a JSON-serializable report."""
+    pattern = re.compile(name_filter) if name_filter else None
+    batch_sizes = [batch_size for batch_size in BATCH_SIZES if batch_size <= max_batch_size]
+
+    results: dict[str, dict[str, float | int]] = {}
+    for ss58_format in SS58_FORMATS:
+        benchmarks = [*single_address_benchmarks(ss58_format), *batch_benchmarks(ss58_format, batch_sizes)]
+        for name, function, addresses in benchmarks:
+            if pattern is not None and not pattern.search(name):
+                continue
+
+            microseconds = measure(function, addresses, repeat)
+            results[name] = {"us_per_address": microseconds, "addresses": addresses}
+            print(f"{name:<72} {microseconds:10.3f} us per address", file=sys.stderr)
+
+    return {
+        "traitkeyless": _package_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Compare results with a baseline and print the ratios of times.
+
+    Returns:
+        list[str]: Names of the benchmarks that are slower than the baseline by more than the threshold.
+    """
+    regressions = []
+    print(f"{'benchmark':<72} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, result in report["results"].items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            continue
+
+        ratio = result["us_per_address"] / baseline_result["us_per_address"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<72} {baseline_result['us_per_address']:10.3f} {result['us_per_address']:10.3f} {ratio:7.2f}{flag}"
+        )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.splitlines()[2])
+    parser.add_argument("--output", help="save the results to a JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results with a saved JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative slowdown reported as a regression (default: 0.1)"
+    )
+    parser.add_argument("--filter", help="run only benchmarks with names matching a regular expression")
+    parser.add_argument("--max-batch-size", type=int, default=max(BATCH_SIZES), help="largest batch size to run")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements of a benchmark")
+    arguments = parser.parse_args(argv)
+
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as file:  # noqa: PTH123
+            baseline = json.load(file)
+
+    report = run(arguments.filter, arguments.max_batch_size, arguments.repeat)
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:  # noqa: PTH123
+            json.dump(report, file, indent=2)
+            file.write("\n")
+    elif baseline is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if baseline is not None:
+        regressions = compare(report, baseline, arguments.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmarks regressed by more than {arguments.threshold:.0%}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import pickle
+import unittest
+from collections.abc import Callable
+from typing import Any
+
+import traitkeyless
+from traitkeyless.ss58 import ss58_decode_bytes, ss58_encode
+
+
+class TestAccountIdEncoding(unittest.TestCase):
+    def test_single_account_ids(self: "TestAccountIdEncoding") -> None:
+        cases = [
+            (traitkeyless.encode_app_agent_account_id(123), traitkeyless.encode_app_agent_address(123)),
+            (
+                traitkeyless.encode_transactional_account_id(123, 456),
+                traitkeyless.encode_transactional_address(123, 456),
+            ),
+            (
+                traitkeyless.encode_named_account_id(123, "hot-wallet"),
+                traitkeyless.encode_named_address(123, "hot-wallet"),
+            ),
+        ]
+        for account_id_bytes, address in cases:
+            with self.subTest(address=address):
+                self.assertEqual(
+                    account_id_bytes,
+                    ss58_decode_bytes(address, traitkeyless.SS58_FORMAT__TRAIT_ASSET_HUB),
+                    "Account ID differs from the account ID of the encoded address.",
+                )
+
+    def test_batch_account_ids(self: "TestAccountIdEncoding") -> None:
+        ids = [0, 1, 123, 2**32 - 1]
+        cases: list[tuple[bytes, Callable[[Any], str], list[Any]]] = [
+            (traitkeyless.encode_app_agent_account_ids(ids), traitkeyless.encode_app_agent_address, ids),
+            (
+                traitkeyless.encode_transactional_account_ids(123, ids),
+                lambda ta_id: traitkeyless.encode_transactional_address(123, ta_id),
+                ids,
+            ),
+            (
+                traitkeyless.encode_named_account_ids(123, ["hot-wallet", "coldwallet"]),
+                lambda name: traitkeyless.encode_named_address(123, name),
+                ["hot-wallet", "coldwallet"],
+            ),
+        ]
+        for account_ids, encode, items in cases:
+            self.assertEqual(len(account_ids), 32 * len(items), "Account IDs aren't 32 bytes each.")
+            for index, item in enumerate(items):
+                with self.subTest(item=item):
+                    self.assertEqual(
+                        account_ids[32 * index : 32 * (index + 1)],
+                        ss58_decode_bytes(encode(item), traitkeyless.SS58_FORMAT__TRAIT_ASSET_HUB),
+                        "Batch account ID differs from the account ID of the encoded address.",
+                    )
+
+        self.assertEqual(traitkeyless.encode_app_agent_account_ids([]), b"", "Empty batch isn't empty.")
+
+    def test_invalid_name(self: "TestAccountIdEncoding") -> None:
+        with self.assertRaises(ValueError):
+            traitkeyless.encode_named_account_id(123, "wallet name")
+
+
+class TestAccountIdDecoding(unittest.TestCase):
+    def test_decode_account_id(self: "TestAccountIdDecoding") -> None:
+        for ss58_format in [42, 5335]:
+            addresses = [
+                traitkeyless.encode_app_agent_address(123, ss58_format),
+                traitkeyless.encode_transactional_address(123, 456, ss58_format),
+                traitkeyless.encode_named_address(123, "hot-wallet", ss58_format),
+                ss58_encode("0x" + "ab" * 32, ss58_format),
+            ]
+            for address in addresses:
+                account_id_bytes = ss58_decode_bytes(address, ss58_format)
+                for buffer in (account_id_bytes, bytearray(account_id_bytes), memoryview(account_id_bytes)):
+                    with self.subTest(ss58_format=ss58_format, address=address, buffer=type(buffer).__name__):
+                        address_info = traitkeyless.decode_account_id(buffer, ss58_format)
+                        self.assertEqual(
+                            address_info,
+                            traitkeyless.decode_address(address, ss58_format),
+                            "Decoding of the account ID differs from decoding of the address.",
+                        )
+                        self.assertEqual(address_info.address, address, "Address is encoded incorrectly.")
+
+    def test_decode_account_ids(self: "TestAccountIdDecoding") -> None:
+        account_ids = traitkeyless.encode_transactional_account_ids(123, range(10))
+        address_infos = traitkeyless.decode_account_ids(memoryview(account_ids), 42)
+        self.assertEqual(
+            [(info.address_type, info.app_agent_id, info.ta_id) for info in address_infos],
+            [(traitkeyless.AddressType.Transactional, 123, ta_id) for ta_id in range(10)],
+            "Decoded account IDs differ from the encoded ones.",
+        )
+        self.assertEqual(
+            [info.address for info in address_infos],
+            traitkeyless.encode_transactional_addresses(123, range(10), 42),
+            "Addresses of decoded account IDs differ from the encoded addresses.",
+        )
+        self.assertEqual(traitkeyless.decode_account_ids(b""), [], "Empty buffer isn't decoded to no addresses.")
+
+    def test_lazy_address(self: "TestAccountIdDecoding") -> None:
+        address_info = traitkeyless.decode_account_id(traitkeyless.encode_app_agent_account_id(123))
+        restored = pickle.loads(pickle.dumps(address_info))  # noqa: S301
+        self.assertEqual(restored, address_info, "Pickled info differs from the original.")
+        self.assertEqual(
+            restored.address, traitkeyless.encode_app_agent_address(123), "Pickled info has incorrect address."
+        )
+        self.assertIn(traitkeyless.encode_app_agent_address(123), repr(address_info), "Address is missing in repr.")
+
+    def test_invalid_account_ids(self: "TestAccountIdDecoding") -> None:
+        with self.assertRaises(ValueError):
+            traitkeyless.decode_account_id(b"\x00" * 31)
+        with self.assertRaises(ValueError):
+            traitkeyless.decode_account_id(b"\x00" * 32, ss58_format=16384)
+        with self.assertRaises(ValueError):
+            traitkeyless.decode_account_ids(b"\x00" * 33)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+import traitkeyless
+from traitkeyless.aio import adecode_stream
+
+
+async def stream(addresses: Iterable[str], delay: float = 0.0) -> AsyncIterator[str]:
+    for address in addresses:
+        await asyncio.sleep(delay)
+        yield address
+
+
+class TestDecodeStream(unittest.IsolatedAsyncioTestCase):
+    async def test_order(self: "TestDecodeStream") -> None:
+        addresses = traitkeyless.encode_transactional_addresses(123, range(100))
+        addresses += [traitkeyless.encode_named_address(123, "hot-wallet"), traitkeyless.encode_app_agent_address(7)]
+
+        ###
+
+        addresses_info = [address_info async for address_info in adecode_stream(stream(addresses), batch_size=8)]
+
+        self.assertEqual(
+            addresses_info,
+            [traitkeyless.decode_address(address) for address in addresses],
+            "Decoded stream differs from decoding of single addresses.",
+        )
+
+    async def test_slow_stream(self: "TestDecodeStream") -> None:
+        addresses = traitkeyless.encode_app_agent_addresses(range(3))
+        decoded = adecode_stream(stream(addresses, delay=0.01), batch_size=1000)
+
+        ###
+
+        # The first address is decoded without waiting for a full batch
+        first = await asyncio.wait_for(anext(decoded), timeout=5)
+        self.assertEqual(first.app_agent_id, 0, "Wrong first address.")
+        self.assertEqual([address_info.app_agent_id async for address_info in decoded], [1, 2], "Wrong addresses.")
+
+    async def test_process_pool(self: "TestDecodeStream") -> None:
+        addresses = traitkeyless.encode_transactional_addresses(123, range(50))
+
+        ###
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            addresses_info = [
+                address_info
+                async for address_info in adecode_stream(stream(addresses), executor=executor, batch_size=10)
+            ]
+
+        self.assertEqual([address_info.ta_id for address_info in addresses_info], list(range(50)), "Wrong order.")
+
+    async def test_backpressure(self: "TestDecodeStream") -> None:
+        read = 0
+
+        async def counted() -> AsyncIterator[str]:
+            nonlocal read
+            for address in traitkeyless.encode_app_agent_addresses(range(1000)):
+                read += 1
+                yield address
+
+        decoded = adecode_stream(counted(), batch_size=10, max_pending_batches=2)
+
+        ###
+
+        await anext(decoded)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        self.assertLess(read, 100, "Stream is read ahead of decoding without bound.")
+        await decoded.aclose()  # type: ignore[attr-defined]
+
+    async def test_errors(self: "TestDecodeStream") -> None:
+        addresses = traitkeyless.encode_app_agent_addresses(range(5))
+        invalid = addresses[2][:-1] + ("q" if addresses[2][-1] != "q" else "r")
+
+        ###
+
+        decoded = []
+        with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+            async for address_info in adecode_stream(stream([*addresses[:2], invalid, *addresses[3:]]), batch_size=1):
+                decoded.append(address_info.app_agent_id)
+        self.assertEqual(decoded, [0, 1], "Addresses before the invalid one weren't yielded.")
+
+        for executor in [None, ProcessPoolExecutor(max_workers=2)]:
+            with self.subTest(executor=executor):
+                decoded = []
+                with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+                    async for address_info in adecode_stream(
+                        stream([*addresses[:2], invalid, *addresses[3:]]), executor=executor, batch_size=4
+                    ):
+                        decoded.append(address_info.app_agent_id)
+                self.assertEqual(decoded, [0, 1], "Addresses of the batch before the invalid one weren't yielded.")
+                self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()}, "Tasks of the stream weren't awaited.")
+                if executor is not None:
+                    executor.shutdown()
+
+        async def failing() -> AsyncIterator[str]:
+            yield addresses[0]
+            msg = "Stream failed"
+            raise RuntimeError(msg)
+
+        with self.assertRaisesRegex(RuntimeError, "^Stream failed$"):
+            async for _ in adecode_stream(failing()):
+                pass
+
+        with self.assertRaisesRegex(ValueError, "^Batch size must be positive$"):
+            await anext(adecode_stream(stream(addresses), batch_size=0))
+
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            await anext(adecode_stream(stream(addresses), 46))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+import traitkeyless
+
+
+class TestKeylessAddresses(unittest.TestCase):
+    # Tests check that batch encoding matches encoding of single addresses
+
+    def test_app_agent_addresses(self: "TestKeylessAddresses") -> None:
+        app_agent_ids = [0, 1, 123, 2**32 - 1]
+
+        for ss58_format in [42, 5335]:
+            with self.subTest(ss58_format=ss58_format):
+                self.assertEqual(
+                    traitkeyless.encode_app_agent_addresses(app_agent_ids, ss58_format),
+                    [
+                        traitkeyless.encode_app_agent_address(app_agent_id, ss58_format)
+                        for app_agent_id in app_agent_ids
+                    ],
+                    "Batch encoding of AppAgent addresses differs from encoding of single addresses.",
+                )
+
+        self.assertEqual(
+            traitkeyless.encode_app_agent_addresses(iter([123])),
+            ["ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp"],
+            "Batch encoding of AppAgent addresses doesn't accept iterators.",
+        )
+
+    def test_transactional_addresses(self: "TestKeylessAddresses") -> None:
+        app_agent_id = 123
+        ta_ids = range(450, 460)
+
+        for ss58_format in [42, 5335]:
+            with self.subTest(ss58_format=ss58_format):
+                self.assertEqual(
+                    traitkeyless.encode_transactional_addresses(app_agent_id, ta_ids, ss58_format),
+                    [traitkeyless.encode_transactional_address(app_agent_id, ta_id, ss58_format) for ta_id in ta_ids],
+                    "Batch encoding of Transactional addresses differs from encoding of single addresses.",
+                )
+
+    def test_iter_transactional_addresses(self: "TestKeylessAddresses") -> None:
+        app_agent_id = 123
+
+        for ss58_format in [42, 5335]:
+            with self.subTest(ss58_format=ss58_format):
+                self.assertEqual(
+                    list(traitkeyless.iter_transactional_addresses(app_agent_id, 450, 460, ss58_format)),
+                    [
+                        (ta_id, traitkeyless.encode_transactional_address(app_agent_id, ta_id, ss58_format))
+                        for ta_id in range(450, 460)
+                    ],
+                    "Lazy encoding of Transactional addresses differs from encoding of single addresses.",
+                )
+
+        addresses = traitkeyless.iter_transactional_addresses(app_agent_id, 0, 2**32)
+        self.assertEqual(
+            next(addresses),
+            (0, traitkeyless.encode_transactional_address(app_agent_id, 0)),
+            "Lazy encoding of Transactional addresses doesn't start at the first ID.",
+        )
+        self.assertEqual(
+            list(traitkeyless.iter_transactional_addresses(app_agent_id, 5, 5)),
+            [],
+            "Lazy encoding of an empty range should produce no addresses.",
+        )
+
+        with self.assertRaises(OverflowError):
+            list(traitkeyless.iter_transactional_addresses(app_agent_id, 2**32 - 1, 2**32 + 1))
+
+    def test_named_addresses(self: "TestKeylessAddresses") -> None:
+        app_agent_id = 123
+        names = ["example123", "hot-wallet", "name-#test"]
+
+        for ss58_format in [42, 5335]:
+            with self.subTest(ss58_format=ss58_format):
+                self.assertEqual(
+                    traitkeyless.encode_named_addresses(app_agent_id, names, ss58_format),
+                    [traitkeyless.encode_named_address(app_agent_id, name, ss58_format) for name in names],
+                    "Batch encoding of Named addresses differs from encoding of single addresses.",
+                )
+
+        with self.assertRaises(ValueError):
+            traitkeyless.encode_named_addresses(app_agent_id, ["example123", "short"])
+
+    def test_invalid_ss58_format(self: "TestKeylessAddresses") -> None:
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            traitkeyless.encode_app_agent_addresses([123], 46)
+
+        self.assertEqual(
+            traitkeyless.encode_app_agent_addresses([], 42),
+            [],
+            "Batch encoding of no AppAgent IDs should produce no addresses.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import dataclasses
+import unittest
+
+import traitkeyless
+
+
+class TestDecodeCache(unittest.TestCase):
+    app_agent_address = "ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp"
+    transactional_address = "ttowKp8AmjjQh4GoN7xMiQWwVyyrU1Pu7GRf5HxFmV5t43TXG"
+    named_address = "ttowKp8Amrt2FQ2eNdsbMsW2EEeEsEmsT8KHLvPhVppp9zs8k"
+
+    def test_hits_and_misses(self: "TestDecodeCache") -> None:
+        decode_cache = traitkeyless.DecodeCache(maxsize=10)
+
+        address_info = decode_cache.decode_address(self.app_agent_address)
+        self.assertEqual(address_info, traitkeyless.decode_address(self.app_agent_address))
+        self.assertIs(decode_cache.decode_address(self.app_agent_address), address_info, "Cached result isn't reused.")
+
+        self.assertEqual(decode_cache.decode_app_agent_address(self.app_agent_address), 123)
+        self.assertEqual(decode_cache.decode_transactional_address(self.transactional_address), (123, 456))
+        self.assertEqual(decode_cache.decode_named_address(self.named_address), (123, "example123"))
+
+        self.assertEqual(
+            decode_cache.cache_info(),
+            traitkeyless.DecodeCacheInfo(hits=2, misses=3, evictions=0, maxsize=10, currsize=3),
+        )
+
+        decode_cache.cache_clear()
+        self.assertEqual(
+            decode_cache.cache_info(),
+            traitkeyless.DecodeCacheInfo(hits=0, misses=0, evictions=0, maxsize=10, currsize=0),
+        )
+
+    def test_lru_eviction(self: "TestDecodeCache") -> None:
+        decode_cache = traitkeyless.DecodeCache(maxsize=2)
+
+        decode_cache.decode_address(self.app_agent_address)
+        decode_cache.decode_address(self.transactional_address)
+        decode_cache.decode_address(self.app_agent_address)
+        decode_cache.decode_address(self.named_address)
+
+        # Transactional address was the least recently used one
+        decode_cache.decode_address(self.app_agent_address)
+        decode_cache.decode_address(self.transactional_address)
+
+        self.assertEqual(
+            decode_cache.cache_info(),
+            traitkeyless.DecodeCacheInfo(hits=2, misses=4, evictions=2, maxsize=2, currsize=2),
+        )
+
+    def test_key_includes_ss58_format(self: "TestDecodeCache") -> None:
+        decode_cache = traitkeyless.DecodeCache()
+
+        decode_cache.decode_address(self.app_agent_address, 5335)
+        with self.assertRaisesRegex(ValueError, "^Invalid SS58 format$"):
+            decode_cache.decode_address(self.app_agent_address, 42)
+
+        self.assertEqual(decode_cache.cache_info().currsize, 1, "Failed decoding shouldn't be cached.")
+
+        with self.assertRaisesRegex(ValueError, "^Size of decode cache must be positive$"):
+            traitkeyless.DecodeCache(maxsize=0)
+
+    def test_verify(self: "TestDecodeCache") -> None:
+        decode_cache = traitkeyless.DecodeCache()
+        corrupted_address = self.app_agent_address[:-1] + "q"
+
+        ###
+
+        self.assertEqual(
+            decode_cache.decode_app_agent_address(corrupted_address, verify="none"),
+            123,
+            "Checksum is verified with verify='none'.",
+        )
+        self.assertEqual(decode_cache.cache_info().currsize, 0, "Result of reduced verification is cached.")
+        with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+            decode_cache.decode_address(corrupted_address)
+
+        address_info = decode_cache.decode_address(self.app_agent_address)
+        self.assertIs(
+            decode_cache.decode_address(self.app_agent_address, verify="none"),
+            address_info,
+            "Fully verified result isn't reused with reduced verification.",
+        )
+
+        with self.assertRaisesRegex(ValueError, "^Invalid value for verify$"):
+            decode_cache.decode_address(self.app_agent_address, verify="some")  # type: ignore[arg-type]
+
+    def test_results_are_immutable(self: "TestDecodeCache") -> None:
+        decode_cache = traitkeyless.DecodeCache()
+        address_info = decode_cache.decode_address(self.app_agent_address)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            address_info.app_agent_id = 124  # type: ignore[misc]
+
+        self.assertEqual(decode_cache.decode_app_agent_address(self.app_agent_address), 123)
+
+
+if __name__ == "__main__":
+    unittest.main()
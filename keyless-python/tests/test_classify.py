@@ -0,0 +1,78 @@
+import unittest
+
+import traitkeyless
+
+
+class TestClassifyAddress(unittest.TestCase):
+    app_agent_address = "ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp"
+    transactional_address = "ttowKp8AmjjQh4GoN7xMiQWwVyyrU1Pu7GRf5HxFmV5t43TXG"
+    named_address = "ttowKp8Amrt2FQ2eNdsbMsW2EEeEsEmsT8KHLvPhVppp9zs8k"
+    regular_address = "ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4"
+    # Named account IDs of AppAgent 123 with the keyless checksum of names b"\xff" * 10 and b"hot wallet"
+    crafted_named_addresses = (
+        "ttowKp8AmytuM6CQB7ouCnyJ4EqZwX2L4ZBGeRVWs69Cntqwm",
+        "ttowKp8Ams1q52xx3Zr2kQbq7UYEaoGaqTMKqfnBcLts6MK3Y",
+    )
+
+    def test_classify_address(self: "TestClassifyAddress") -> None:
+        codec = traitkeyless.KeylessCodec()
+        expected_address_types = {
+            self.app_agent_address: traitkeyless.AddressType.AppAgent,
+            self.transactional_address: traitkeyless.AddressType.Transactional,
+            self.named_address: traitkeyless.AddressType.Named,
+            self.regular_address: traitkeyless.AddressType.Regular,
+            # Invalid checksum, length, character and SS58 format
+            self.app_agent_address[:-1] + "q": None,
+            self.app_agent_address[:-1]: None,
+            self.app_agent_address[:-1] + "0": None,
+            "5EqykH6EjAZ513RNK37NMagT2KPL4xr2vJXxGCRucbXqBSA7": None,
+            "": None,
+        }
+
+        for address, address_type in expected_address_types.items():
+            with self.subTest(address=address):
+                self.assertIs(traitkeyless.classify_address(address), address_type)
+                self.assertIs(codec.classify_address(address), address_type)
+
+    def test_try_decode_address(self: "TestClassifyAddress") -> None:
+        codec = traitkeyless.KeylessCodec()
+
+        for address in [self.app_agent_address, self.transactional_address, self.named_address, self.regular_address]:
+            with self.subTest(address=address):
+                expected_result = (traitkeyless.DecodeStatus.Ok, traitkeyless.decode_address(address))
+                self.assertEqual(traitkeyless.try_decode_address(address), expected_result)
+                self.assertEqual(codec.try_decode_address(address), expected_result)
+
+        expected_statuses = {
+            self.app_agent_address[:-1] + "q": traitkeyless.DecodeStatus.InvalidChecksum,
+            self.app_agent_address[:-1]: traitkeyless.DecodeStatus.InvalidLength,
+            "": traitkeyless.DecodeStatus.InvalidLength,
+            self.app_agent_address[:-1] + "0": traitkeyless.DecodeStatus.InvalidCharacter,
+            "5EqykH6EjAZ513RNK37NMagT2KPL4xr2vJXxGCRucbXqBSA7": traitkeyless.DecodeStatus.InvalidFormat,
+        }
+
+        for address, status in expected_statuses.items():
+            with self.subTest(address=address):
+                self.assertEqual(traitkeyless.try_decode_address(address), (status, None))
+                self.assertEqual(codec.try_decode_address(address), (status, None))
+
+        self.assertEqual(
+            traitkeyless.try_decode_address("5EqykH6EjAZ513RNK37NMagT2KPL4xr2vJXxGCRucbXqBSA7", 42)[0],
+            traitkeyless.DecodeStatus.Ok,
+        )
+
+    def test_crafted_named_address(self: "TestClassifyAddress") -> None:
+        for address in self.crafted_named_addresses:
+            with self.subTest(address=address):
+                # Names of characters other than the allowed ones can't be encoded, so the addresses are Regular ones
+                self.assertIs(traitkeyless.classify_address(address), traitkeyless.AddressType.Regular)
+                address_info = traitkeyless.decode_address(address)
+                self.assertIs(address_info.address_type, traitkeyless.AddressType.Regular)
+                self.assertEqual(traitkeyless.try_decode_address(address), (traitkeyless.DecodeStatus.Ok, address_info))
+                self.assertIs(
+                    traitkeyless.decode_address(address, verify="none").address_type, traitkeyless.AddressType.Regular
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import csv
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import traitkeyless
+from traitkeyless.__main__ import main
+
+
+def run_main(argv: list[str], stdin: str = "") -> tuple[int, str, str]:
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with patch("sys.stdin", io.StringIO(stdin)), redirect_stdout(stdout), redirect_stderr(stderr):
+        status = main(argv)
+
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+class TestCommandLine(unittest.TestCase):
+    def test_decode_lines(self: "TestCommandLine") -> None:
+        addresses = [
+            traitkeyless.encode_app_agent_address(123),
+            traitkeyless.encode_transactional_address(123, 456),
+            traitkeyless.encode_named_address(123, "hot-wallet"),
+            "ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4",
+        ]
+
+        ###
+
+        status, stdout, stderr = run_main(["decode", "--batch-size", "3"], "\n".join(addresses) + "\n\n")
+
+        self.assertEqual(status, 0, "Decoding failed.")
+        rows = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual([row["address"] for row in rows], addresses, "Addresses differ from the input.")
+        self.assertEqual(
+            [row["address_type"] for row in rows],
+            ["AppAgent", "Transactional", "Named", "Regular"],
+            "Wrong address types.",
+        )
+        self.assertEqual(rows[1]["ta_id"], 456, "Wrong Transactional address ID.")
+        self.assertEqual(rows[2]["address_name"], "hot-wallet", "Wrong address name.")
+        self.assertIsNone(rows[3]["app_agent_id"], "Regular address has AppAgent ID.")
+        self.assertIn("Decoded 4 addresses", stderr, "No throughput summary.")
+
+    def test_decode_columns(self: "TestCommandLine") -> None:
+        addresses = traitkeyless.encode_transactional_addresses(7, range(5))
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = Path(directory) / "export.csv"
+            csv_path.write_text("id,account\n" + "".join(f"{i},{a}\n" for i, a in enumerate(addresses)))
+            jsonl_path = Path(directory) / "export.jsonl"
+            jsonl_path.write_text("".join(json.dumps({"account": address}) + "\n" for address in addresses))
+
+            ###
+
+            status, stdout, _ = run_main(
+                ["decode", "--input-format", "csv", "--column", "account", "--output-format", "csv", str(csv_path)]
+            )
+            self.assertEqual(status, 0, "Decoding of CSV failed.")
+            rows = list(csv.DictReader(io.StringIO(stdout)))
+            self.assertEqual([row["ta_id"] for row in rows], ["0", "1", "2", "3", "4"], "Wrong CSV output.")
+            self.assertEqual(rows[0]["address_name"], "", "Missing value isn't empty in CSV output.")
+
+            status, stdout, _ = run_main(["decode", "--input-format", "jsonl", "--column", "account", "-q", "-"], "")
+            self.assertEqual((status, stdout), (0, ""), "Empty input produced output.")
+
+            status, stdout, _ = run_main(
+                ["decode", "--input-format", "jsonl", "--column", "account", str(jsonl_path), str(jsonl_path)]
+            )
+            self.assertEqual(status, 0, "Decoding of JSONL failed.")
+            self.assertEqual(len(stdout.splitlines()), 10, "Not all input files were decoded.")
+
+            status, _, stderr = run_main(["decode", "--input-format", "csv", "--column", "address", str(csv_path)])
+            self.assertEqual(status, 1, "Missing column didn't fail.")
+            self.assertIn("Column 'address' not found", stderr, "Wrong error of missing column.")
+
+            csv_path.write_text(f"id,account\n0,{addresses[0]}\n1\n")
+            status, stdout, stderr = run_main(["decode", "--input-format", "csv", "--column", "account", str(csv_path)])
+            self.assertEqual(status, 1, "Row with too few columns didn't fail.")
+            self.assertIn("Missing value of column 'account' in row 2", stderr, "Wrong error of row with few columns.")
+            self.assertNotIn('"None"', stdout, "Missing value was decoded as an address.")
+
+    def test_decode_workers(self: "TestCommandLine") -> None:
+        addresses = traitkeyless.encode_app_agent_addresses(range(40))
+
+        ###
+
+        status, stdout, _ = run_main(
+            ["decode", "--workers", "2", "--batch-size", "30", "--skip-invalid"],
+            "\n".join([*addresses, "invalid"]),
+        )
+
+        self.assertEqual(status, 0, "Parallel decoding failed.")
+        rows = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual([row["app_agent_id"] for row in rows], list(range(40)), "Wrong parallel decoding.")
+
+        hex_account_id = "0x" + "00" * 32
+        status, stdout, stderr = run_main(
+            ["decode", "--workers", "2", "--batch-size", "30"], "\n".join([*addresses, hex_account_id, "invalid"])
+        )
+        self.assertEqual(status, 1, "Invalid address didn't fail parallel decoding.")
+        self.assertIn("Invalid address 'invalid'", stderr, "Wrong error of invalid address.")
+        rows = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual(len(rows), 30, "Batch before the invalid address wasn't written.")
+
+        status, stdout, _ = run_main(["decode", "--workers", "2"], f"{addresses[0]}\n{hex_account_id}\n")
+        self.assertEqual(status, 0, "Parallel decoding of hex account ID failed.")
+        rows = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual(
+            [row["address_type"] for row in rows], ["AppAgent", "Regular"], "Wrong parallel decoding of hex account ID."
+        )
+
+    def test_decode_invalid(self: "TestCommandLine") -> None:
+        valid = traitkeyless.encode_app_agent_address(1)
+        invalid = valid[:-1] + ("q" if valid[-1] != "q" else "r")
+
+        ###
+
+        status, _, stderr = run_main(["decode"], f"{valid}\n{invalid}\n")
+        self.assertEqual(status, 1, "Invalid address didn't fail.")
+        self.assertIn(f"Invalid address '{invalid}'", stderr, "Wrong error of invalid address.")
+
+        status, stdout, _ = run_main(["decode", "--skip-invalid"], f"{valid}\n{invalid}\n")
+        self.assertEqual(status, 0, "Invalid address wasn't skipped.")
+        self.assertEqual(len(stdout.splitlines()), 1, "Invalid address wasn't skipped.")
+
+    def test_encode(self: "TestCommandLine") -> None:
+        status, stdout, stderr = run_main(["encode", "transactional", "123", "10", "15", "--batch-size", "2"])
+
+        self.assertEqual(status, 0, "Encoding failed.")
+        rows = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual(
+            [row["address"] for row in rows],
+            traitkeyless.encode_transactional_addresses(123, range(10, 15)),
+            "Wrong Transactional addresses.",
+        )
+        self.assertIn("Encoded 5 addresses", stderr, "No throughput summary.")
+
+        status, stdout, _ = run_main(["encode", "app-agent", "0", "3", "--output-format", "csv", "-q"])
+
+        self.assertEqual(status, 0, "Encoding failed.")
+        rows = list(csv.DictReader(io.StringIO(stdout)))
+        self.assertEqual(
+            [row["address"] for row in rows], traitkeyless.encode_app_agent_addresses(range(3)), "Wrong CSV output."
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
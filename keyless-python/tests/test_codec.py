@@ -0,0 +1,91 @@
+import unittest
+
+import traitkeyless
+
+
+class TestKeylessCodec(unittest.TestCase):
+    # Tests check that the codec bound to an SS58 format matches the module level functions
+
+    def test_encoding(self: "TestKeylessCodec") -> None:
+        for ss58_format in [42, 5335]:
+            codec = traitkeyless.KeylessCodec(ss58_format)
+            with self.subTest(ss58_format=ss58_format):
+                self.assertEqual(
+                    codec.encode_app_agent_address(123),
+                    traitkeyless.encode_app_agent_address(123, ss58_format),
+                    "Codec encodes AppAgent address differently.",
+                )
+                self.assertEqual(
+                    codec.encode_transactional_address(123, 456),
+                    traitkeyless.encode_transactional_address(123, 456, ss58_format),
+                    "Codec encodes Transactional address differently.",
+                )
+                self.assertEqual(
+                    codec.encode_named_address(123, "hot-wallet"),
+                    traitkeyless.encode_named_address(123, "hot-wallet", ss58_format),
+                    "Codec encodes Named address differently.",
+                )
+
+    def test_decoding(self: "TestKeylessCodec") -> None:
+        codec = traitkeyless.KeylessCodec()
+        self.assertEqual(codec.ss58_format, traitkeyless.SS58_FORMAT__TRAIT_ASSET_HUB)
+        with self.assertRaises(AttributeError, msg="SS58 format of a codec can be changed."):
+            codec.ss58_format = 42  # type: ignore[misc]
+
+        app_agent_address = "ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp"
+        transactional_address = "ttowKp8AmjjQh4GoN7xMiQWwVyyrU1Pu7GRf5HxFmV5t43TXG"
+        named_address = "ttowKp8Amrt2FQ2eNdsbMsW2EEeEsEmsT8KHLvPhVppp9zs8k"
+        regular_address = "ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4"
+
+        self.assertEqual(codec.decode_app_agent_address(app_agent_address), 123)
+        self.assertEqual(codec.decode_transactional_address(transactional_address), (123, 456))
+        self.assertEqual(codec.decode_named_address(named_address), (123, "example123"))
+
+        for address in [app_agent_address, transactional_address, named_address, regular_address]:
+            with self.subTest(address=address):
+                self.assertEqual(
+                    codec.decode_address(address),
+                    traitkeyless.decode_address(address),
+                    "Codec decodes address differently.",
+                )
+
+        with self.assertRaisesRegex(
+            ValueError,
+            "^Provided address is not an AppAgent address but is instance of AddressType.Regular.$",
+        ):
+            codec.decode_app_agent_address(regular_address)
+
+    def test_decoding_errors(self: "TestKeylessCodec") -> None:
+        codec = traitkeyless.KeylessCodec(42)
+
+        with self.assertRaisesRegex(ValueError, "^Invalid SS58 format$"):
+            codec.decode_address("ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp")
+
+        with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+            codec.decode_address("5EqykH6EjAZ513RNK37NMagT2KPL4xr2vJXxGCRucbXqBSA8")
+
+        with self.assertRaisesRegex(ValueError, "^Empty address provided$"):
+            codec.decode_address("")
+
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            traitkeyless.KeylessCodec(47)
+
+    def test_batch_encoding(self: "TestKeylessCodec") -> None:
+        codec = traitkeyless.KeylessCodec()
+
+        self.assertEqual(
+            codec.encode_app_agent_addresses([1, 2]),
+            traitkeyless.encode_app_agent_addresses([1, 2]),
+        )
+        self.assertEqual(
+            codec.encode_transactional_addresses(123, [1, 2]),
+            traitkeyless.encode_transactional_addresses(123, [1, 2]),
+        )
+        self.assertEqual(
+            codec.encode_named_addresses(123, ["hot-wallet"]),
+            traitkeyless.encode_named_addresses(123, ["hot-wallet"]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
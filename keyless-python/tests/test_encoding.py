@@ -1,6 +1,8 @@
+import pickle
 import unittest
 
 import traitkeyless
+from traitkeyless.ss58 import ss58_encode
 
 
 class TestKeylessAddresses(unittest.TestCase):
@@ -168,6 +170,61 @@ class TestKeylessAddresses(unittest.TestCase):
             "Decoding of regular address to address info failed.",
         )
 
+    def test_ss58_format_detection(self: "TestKeylessAddresses") -> None:
+        for ss58_format in [0, 42, 5335]:
+            addresses = [
+                traitkeyless.encode_app_agent_address(123, ss58_format),
+                traitkeyless.encode_transactional_address(123, 456, ss58_format),
+                traitkeyless.encode_named_address(123, "hot-wallet", ss58_format),
+                ss58_encode("0x" + "ab" * 32, ss58_format),
+            ]
+            for address in addresses:
+                for verify in ("none", "ss58", "full"):
+                    with self.subTest(address=address, verify=verify):
+                        address_info = traitkeyless.decode_address(address, None, verify=verify)
+                        self.assertEqual(
+                            address_info,
+                            traitkeyless.decode_address(address, ss58_format),
+                            "Decoding with detected SS58 format differs from decoding with the given one.",
+                        )
+                        self.assertEqual(address_info.ss58_format, ss58_format, "SS58 format is detected incorrectly.")
+
+        self.assertEqual(
+            traitkeyless.decode_address(traitkeyless.encode_app_agent_address(123)).ss58_format,
+            traitkeyless.SS58_FORMAT__TRAIT_ASSET_HUB,
+            "Given SS58 format isn't reported.",
+        )
+
+        address = traitkeyless.encode_app_agent_address(123, 42)
+        corrupted_address = address[:-1] + ("1" if address[-1] != "1" else "2")
+        with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+            traitkeyless.decode_address(corrupted_address, None)
+        self.assertEqual(
+            traitkeyless.decode_address(corrupted_address, None, verify="none").app_agent_id,
+            123,
+            "Address is verified with verify='none'.",
+        )
+
+    def test_address_info_representation(self: "TestKeylessAddresses") -> None:
+        blockchain_address = "ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp"
+        expected_address_info = traitkeyless.BlockchainAddressInfo(
+            address=blockchain_address,
+            account_id="0x7b00000001293833058fc7db52fc03f6ce344bca98bd7825ff747743f1ff63e2",
+            address_type=traitkeyless.AddressType.AppAgent,
+            app_agent_id=123,
+            ta_id=None,
+            address_name=None,
+        )
+
+        ###
+
+        decoded_address_info = traitkeyless.decode_address(blockchain_address)
+        self.assertFalse(hasattr(decoded_address_info, "__dict__"), "Address info should be slotted.")
+        self.assertEqual(hash(decoded_address_info), hash(expected_address_info), "Address info should be hashable.")
+        self.assertEqual(len({decoded_address_info, expected_address_info}), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(decoded_address_info)), expected_address_info)  # noqa: S301
+        self.assertEqual(repr(decoded_address_info), repr(expected_address_info))
+
 
 if __name__ == "__main__":
     unittest.main()
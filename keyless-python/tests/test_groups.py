@@ -0,0 +1,104 @@
+import pickle
+import unittest
+from array import array
+from collections import Counter
+
+import traitkeyless
+from traitkeyless import AddressType, AppAgentGroups, group_by_app_agent
+from traitkeyless.keyless import _blake2_256
+from traitkeyless.ss58 import ss58_encode
+
+
+class TestGroupByAppAgent(unittest.TestCase):
+    def setUp(self: "TestGroupByAppAgent") -> None:
+        self.addresses = [
+            traitkeyless.encode_app_agent_address(123),
+            traitkeyless.encode_app_agent_address(123),
+            *traitkeyless.encode_transactional_addresses(123, [5, 3, 5, 1]),
+            traitkeyless.encode_named_address(123, "hot-wallet"),
+            traitkeyless.encode_named_address(123, "hot-wallet"),
+            traitkeyless.encode_named_address(123, "coldwallet"),
+            traitkeyless.encode_transactional_address(7, 2**32 - 1),
+            ss58_encode("0x" + "ab" * 32, 5335),
+            traitkeyless.encode_app_agent_address(123, 42),
+            "invalid",
+        ]
+
+    def test_groups(self: "TestGroupByAppAgent") -> None:
+        groups = group_by_app_agent(iter(self.addresses))
+
+        ###
+
+        self.assertEqual(list(groups), [123, 7], "AppAgents are grouped incorrectly.")
+        self.assertNotIn(124, groups, "Unseen AppAgent is grouped.")
+        self.assertEqual(
+            (groups.regular_count, groups.failed_count), (1, 2), "Other addresses are counted incorrectly."
+        )
+
+        app_agent_id = 123
+        group = groups[app_agent_id]
+        self.assertEqual(
+            group.counts(),
+            {AddressType.AppAgent: 2, AddressType.Transactional: 4, AddressType.Named: 3},
+            "Addresses are counted incorrectly.",
+        )
+        self.assertEqual(group.ta_ids, array("I", [1, 3, 5]), "Transactional address IDs aren't distinct and sorted.")
+        self.assertEqual(group.names, {"hot-wallet": 2, "coldwallet": 1}, "Named addresses are counted incorrectly.")
+        self.assertEqual(groups[7].ta_ids, array("I", [2**32 - 1]), "Largest Transactional address ID is lost.")
+
+        # Same aggregation as from decoded addresses
+        decoded = [traitkeyless.try_decode_address(address)[1] for address in self.addresses]
+        types = Counter(info.address_type for info in decoded if info is not None and info.app_agent_id == app_agent_id)
+        self.assertEqual(group.counts(), dict(types), "Counts differ from counts of decoded addresses.")
+
+    def test_crafted_named_address(self: "TestGroupByAppAgent") -> None:
+        # Named account ID with the keyless checksum of a name that isn't valid UTF-8
+        open_part = (123).to_bytes(4, byteorder="little") + b"\x03" + b"\xff" * 10
+        crafted_address = ss58_encode(open_part + _blake2_256(open_part)[15:], 5335)
+
+        ###
+
+        groups = group_by_app_agent([crafted_address, traitkeyless.encode_named_address(123, "hot-wallet")])
+
+        self.assertEqual(groups.regular_count, 1, "Address of an invalid name isn't counted as a Regular one.")
+        self.assertEqual(groups[123].names, {"hot-wallet": 1}, "Address of an invalid name is grouped.")
+
+    def test_compaction(self: "TestGroupByAppAgent") -> None:
+        addresses = traitkeyless.encode_transactional_addresses(123, range(100)) * 50
+        groups = group_by_app_agent(addresses)
+
+        ###
+
+        group = groups[123]
+        self.assertEqual(group.ta_count, 5000, "Transactional addresses are counted incorrectly.")
+        self.assertLess(len(group._ta_ids), 1200, "Duplicate IDs aren't removed as they come.")  # noqa: SLF001
+        self.assertEqual(group.ta_ids, array("I", range(100)), "Transactional address IDs are lost.")
+
+    def test_merge(self: "TestGroupByAppAgent") -> None:
+        expected = group_by_app_agent(self.addresses)
+
+        ###
+
+        parts = [group_by_app_agent(self.addresses[start : start + 4]) for start in range(0, len(self.addresses), 4)]
+        # Parts are sent from workers pickled
+        merged = AppAgentGroups()
+        for part in parts:
+            merged.merge(pickle.loads(pickle.dumps(part)))  # noqa: S301
+
+        self.assertEqual(list(merged.items()), list(expected.items()), "Merged groups differ from the groups.")
+        self.assertEqual(
+            (merged.regular_count, merged.failed_count),
+            (expected.regular_count, expected.failed_count),
+            "Merged counts differ from the counts.",
+        )
+
+        with self.assertRaisesRegex(ValueError, "^Groups of different SS58 formats can't be merged$"):
+            merged.merge(AppAgentGroups(42))
+
+    def test_errors(self: "TestGroupByAppAgent") -> None:
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            group_by_app_agent([], 46)
+
+
+if __name__ == "__main__":
+    unittest.main()
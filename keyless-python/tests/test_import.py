@@ -0,0 +1,99 @@
+import subprocess
+import sys
+import unittest
+
+import traitkeyless
+
+
+def imported_modules(statements: str) -> set[str]:
+    """Run statements in a new interpreter and return the modules imported by then."""
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"{statements}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(process.stdout.splitlines())
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_package(self: "TestLazyImport") -> None:
+        modules = imported_modules("import traitkeyless")
+
+        ###
+
+        self.assertIn("traitkeyless", modules, "Package wasn't imported.")
+        for module in ("traitkeyless.keyless", "dataclasses", "hashlib", "base58"):
+            self.assertNotIn(module, modules, f"{module} was imported by the package.")
+
+    def test_codec_functions(self: "TestLazyImport") -> None:
+        modules = imported_modules(
+            "from traitkeyless import decode_address, encode_transactional_address\n"
+            "decode_address(encode_transactional_address(123, 456))"
+        )
+
+        ###
+
+        self.assertIn("traitkeyless.keyless", modules, "Codec module wasn't imported.")
+        for module in ("traitkeyless.cache", "traitkeyless.index", "base58", "dataclasses", "threading", "_hashlib"):
+            self.assertNotIn(module, modules, f"{module} was imported for valid addresses.")
+
+    def test_encoders(self: "TestLazyImport") -> None:
+        modules = imported_modules(
+            "from traitkeyless import encode_app_agent_address, encode_transactional_addresses\n"
+            "encode_transactional_addresses(123, [encode_app_agent_address(123).count('1')])"
+        )
+
+        ###
+
+        self.assertIn("traitkeyless.encoders", modules, "Encoders module wasn't imported.")
+        for module in ("traitkeyless.keyless", "dataclasses", "_hashlib"):
+            self.assertNotIn(module, modules, f"{module} was imported for encoding.")
+
+    def test_encoders_address_types(self: "TestLazyImport") -> None:
+        from traitkeyless import encoders  # noqa: PLC0415
+
+        ###
+
+        self.assertEqual(
+            encoders._ADDRESS_TYPE_NAMES,  # noqa: SLF001
+            tuple(address_type.name for address_type in traitkeyless.AddressType),
+            "Names of address types of the encoders differ from AddressType.",
+        )
+        self.assertEqual(
+            (encoders._APP_AGENT_TYPE, encoders._TRANSACTIONAL_TYPE, encoders._NAMED_TYPE),  # noqa: SLF001
+            (
+                traitkeyless.AddressType.AppAgent.value,
+                traitkeyless.AddressType.Transactional.value,
+                traitkeyless.AddressType.Named.value,
+            ),
+            "Type bytes of the encoders differ from AddressType.",
+        )
+        self.assertIs(
+            traitkeyless.keyless.encode_app_agent_address,
+            traitkeyless.encode_app_agent_address,
+            "Encoders aren't exported by the keyless module.",
+        )
+
+    def test_attributes(self: "TestLazyImport") -> None:
+        self.assertIs(
+            traitkeyless.KeylessAddressIndex,
+            traitkeyless.index.KeylessAddressIndex,
+            "Wrong object of a lazily imported name.",
+        )
+        self.assertIs(
+            traitkeyless.decode_addresses_parallel,
+            traitkeyless.parallel.decode_addresses_parallel,
+            "Wrong object of a lazily imported name.",
+        )
+        for name in traitkeyless.__all__:
+            self.assertIn(name, dir(traitkeyless), f"{name} isn't listed by dir().")
+            self.assertTrue(hasattr(traitkeyless, name), f"{name} can't be imported.")
+
+        with self.assertRaisesRegex(AttributeError, "^module 'traitkeyless' has no attribute 'encode_address'$"):
+            _ = traitkeyless.encode_address  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+import unittest
+from unittest.mock import patch
+
+import traitkeyless
+from traitkeyless import KeylessAddressIndex, filter_by_app_agents
+from traitkeyless.keyless import _blake2_256
+from traitkeyless.ss58 import blake2b_continue, ss58_encode
+
+
+class TestKeylessAddressIndex(unittest.TestCase):
+    def test_lookup(self: "TestKeylessAddressIndex") -> None:
+        index = KeylessAddressIndex()
+        index.add_app_agent(123)
+        index.add_transactional_range(123, 100, 200)
+        index.add_named_addresses(123, ["hot-wallet"])
+        index.add_transactional_range(7, 0, 10)
+
+        ###
+
+        for address in [
+            traitkeyless.encode_app_agent_address(123),
+            traitkeyless.encode_transactional_address(123, 100),
+            traitkeyless.encode_transactional_address(123, 199),
+            traitkeyless.encode_transactional_address(7, 5),
+            traitkeyless.encode_named_address(123, "hot-wallet"),
+        ]:
+            with self.subTest(address=address):
+                self.assertEqual(
+                    index.lookup(address), traitkeyless.decode_address(address), "Lookup differs from decoding."
+                )
+                self.assertIn(address, index, "Indexed address isn't in the index.")
+
+        for address in [
+            traitkeyless.encode_app_agent_address(7),
+            traitkeyless.encode_app_agent_address(124),
+            traitkeyless.encode_transactional_address(123, 99),
+            traitkeyless.encode_transactional_address(123, 200),
+            traitkeyless.encode_transactional_address(124, 150),
+            traitkeyless.encode_named_address(123, "example123"),
+            traitkeyless.encode_app_agent_address(123, 42),
+            "ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4",
+            "0x7b00000001293833058fc7db52fc03f6ce344bca98bd7825ff747743f1ff63e2",
+            "invalid",
+        ]:
+            with self.subTest(address=address):
+                self.assertIsNone(index.lookup(address), "Address not in the index was found.")
+                self.assertNotIn(address, index, "Address not in the index was found.")
+
+        address = traitkeyless.encode_transactional_address(123, 150)
+        corrupted = address[:-1] + ("q" if address[-1] != "q" else "r")
+        self.assertIsNone(index.lookup(corrupted), "Address with invalid checksum was found.")
+
+    def test_lookup_account_id(self: "TestKeylessAddressIndex") -> None:
+        index = KeylessAddressIndex(42)
+        index.add_transactional_range(123, 0, 10)
+        address = traitkeyless.encode_transactional_address(123, 3, 42)
+        account_id_bytes = bytes.fromhex(traitkeyless.decode_address(address, 42).account_id[2:])
+
+        ###
+
+        self.assertEqual(
+            index.lookup_account_id(account_id_bytes),
+            traitkeyless.decode_address(address, 42),
+            "Lookup of account ID differs from decoding.",
+        )
+        self.assertIsNone(
+            index.lookup_account_id(account_id_bytes[:-1] + b"\0"), "Account ID with invalid checksum was found."
+        )
+        self.assertIsNone(index.lookup_account_id(account_id_bytes[:31]), "Short account ID was found.")
+
+    def test_incremental_adds(self: "TestKeylessAddressIndex") -> None:
+        index = KeylessAddressIndex()
+        self.assertEqual(len(index), 0, "Empty index isn't empty.")
+        empty_footprint = index.memory_footprint()
+
+        ###
+
+        index.add_transactional_range(123, 0, 10)
+        index.add_transactional_range(123, 20, 30)
+        index.add_transactional_range(123, 10, 15)
+        index.add_transactional_range(123, 5, 25)
+        index.add_transactional_range(123, 40, 40)
+        index.add_app_agent(123)
+        index.add_app_agent(123)
+        index.add_named_addresses(123, ["hot-wallet", "hot-wallet"])
+
+        self.assertEqual(len(index), 32, "Wrong number of addresses in the index.")
+        self.assertIsNotNone(
+            index.lookup(traitkeyless.encode_transactional_address(123, 29)), "Merged range lost an address."
+        )
+
+        index.add_transactional_range(123, 0, 1_000_000)
+        self.assertEqual(len(index), 1_000_002, "Wrong number of addresses in the index.")
+        self.assertLess(index.memory_footprint() - empty_footprint, 2000, "Range of addresses isn't stored compactly.")
+
+    def test_errors(self: "TestKeylessAddressIndex") -> None:
+        index = KeylessAddressIndex()
+
+        with self.assertRaisesRegex(ValueError, "^Invalid range of Transactional address IDs$"):
+            index.add_transactional_range(123, 10, 5)
+
+        with self.assertRaisesRegex(ValueError, "^Invalid range of Transactional address IDs$"):
+            index.add_transactional_range(123, 0, 2**32 + 1)
+
+        with self.assertRaisesRegex(ValueError, "^Named keyless address must be of 10 chars length$"):
+            index.add_named_addresses(123, ["hot-wallet", "short"])
+        self.assertEqual(len(index), 0, "Invalid names were partially added.")
+
+        with self.assertRaises(OverflowError):
+            index.add_app_agent(2**32)
+
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            KeylessAddressIndex(46)
+
+
+class TestFilterByAppAgents(unittest.TestCase):
+    def test_filter(self: "TestFilterByAppAgents") -> None:
+        kept_addresses = [
+            traitkeyless.encode_app_agent_address(123),
+            traitkeyless.encode_transactional_address(123, 456),
+            traitkeyless.encode_named_address(7, "hot-wallet"),
+        ]
+        addresses = [
+            traitkeyless.encode_app_agent_address(124),
+            kept_addresses[0],
+            traitkeyless.encode_transactional_address(124, 456),
+            kept_addresses[1],
+            traitkeyless.encode_transactional_address(123, 456, 42),
+            ss58_encode("0x7b000000" + "01" * 28),
+            kept_addresses[2][:-1] + ("q" if kept_addresses[2][-1] != "q" else "r"),
+            kept_addresses[2],
+            "0x7b00000001293833058fc7db52fc03f6ce344bca98bd7825ff747743f1ff63e2",
+            "invalid",
+        ]
+
+        ###
+
+        self.assertEqual(
+            list(filter_by_app_agents(iter(addresses), [123, 7])),
+            [traitkeyless.decode_address(address) for address in kept_addresses],
+            "Filtered addresses differ from the addresses of the AppAgents.",
+        )
+        self.assertEqual(list(filter_by_app_agents(addresses, [])), [], "Addresses are kept without AppAgents.")
+
+    def test_checksums_of_foreign_addresses(self: "TestFilterByAppAgents") -> None:
+        addresses = traitkeyless.encode_transactional_addresses(124, range(100))
+        addresses.append(traitkeyless.encode_transactional_address(123, 456))
+
+        ###
+
+        with (
+            patch("traitkeyless.index.blake2b_continue", wraps=blake2b_continue) as ss58_checksum,
+            patch("traitkeyless.keyless._blake2_256", wraps=_blake2_256) as keyless_checksum,
+        ):
+            address_infos = list(filter_by_app_agents(addresses, {123}))
+
+        self.assertEqual([info.ta_id for info in address_infos], [456], "Wrong addresses are kept.")
+        self.assertEqual(ss58_checksum.call_count, 1, "SS58 checksum is verified for foreign addresses.")
+        self.assertEqual(keyless_checksum.call_count, 1, "Keyless checksum is verified for foreign addresses.")
+
+    def test_crafted_named_address(self: "TestFilterByAppAgents") -> None:
+        # Named account ID of the AppAgent with the keyless checksum of a name that isn't valid UTF-8
+        open_part = (123).to_bytes(4, byteorder="little") + b"\x03" + b"\xff" * 10
+        crafted_address = ss58_encode(open_part + _blake2_256(open_part)[15:], 5335)
+        named_address = traitkeyless.encode_named_address(123, "hot-wallet")
+
+        ###
+
+        self.assertEqual(
+            [info.address for info in filter_by_app_agents([crafted_address, named_address], [123])],
+            [named_address],
+            "Address of an invalid name isn't skipped.",
+        )
+
+    def test_errors(self: "TestFilterByAppAgents") -> None:
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            filter_by_app_agents([], [123], 46)
+        with self.assertRaises(OverflowError):
+            filter_by_app_agents([], [2**32])
+
+
+if __name__ == "__main__":
+    unittest.main()
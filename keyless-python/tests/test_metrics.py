@@ -0,0 +1,91 @@
+import unittest
+
+import traitkeyless
+from traitkeyless import metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self: "TestMetrics") -> None:
+        metrics.reset()
+
+    def tearDown(self: "TestMetrics") -> None:
+        metrics.disable()
+        metrics.set_callback(None)
+        metrics.reset()
+
+    def test_disabled(self: "TestMetrics") -> None:
+        self.assertFalse(metrics.is_enabled(), "Metrics are enabled by default.")
+
+        ###
+
+        traitkeyless.decode_address(traitkeyless.encode_app_agent_address(123))
+
+        self.assertEqual(
+            metrics.stats(), metrics.KeylessStats({}, {}, {}, 0.0, 0.0), "Disabled metrics recorded values."
+        )
+
+    def test_counters(self: "TestMetrics") -> None:
+        codec = traitkeyless.KeylessCodec()
+        app_agent_address = traitkeyless.encode_app_agent_address(123)
+        transactional_address = traitkeyless.encode_transactional_address(123, 456)
+        invalid_checksum = transactional_address[:-1] + ("q" if transactional_address[-1] != "q" else "r")
+
+        metrics.enable()
+
+        ###
+
+        traitkeyless.encode_app_agent_address(123)
+        codec.encode_named_address(123, "hot-wallet")
+        list(traitkeyless.iter_transactional_addresses(123, 0, 3))
+
+        traitkeyless.decode_address(app_agent_address)
+        codec.decode_address(transactional_address)
+        traitkeyless.try_decode_address("ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4")
+        codec.classify_address(transactional_address)
+
+        for decode in [traitkeyless.decode_address, codec.decode_address]:
+            with self.assertRaises(ValueError):
+                decode(invalid_checksum)
+        with self.assertRaises(ValueError):
+            traitkeyless.decode_address(transactional_address[:-1] + "0")
+        with self.assertRaises(ValueError):
+            traitkeyless.decode_address(transactional_address, 42)
+        traitkeyless.try_decode_address("short")
+        codec.classify_address(invalid_checksum)
+
+        snapshot = metrics.stats(reset=True)
+
+        self.assertEqual(
+            snapshot.encoded, {"AppAgent": 1, "Named": 1, "Transactional": 3}, "Wrong counts of encoded addresses."
+        )
+        self.assertEqual(
+            snapshot.decoded, {"AppAgent": 1, "Transactional": 2, "Regular": 1}, "Wrong counts of decoded addresses."
+        )
+        self.assertEqual(
+            snapshot.failed,
+            {"InvalidChecksum": 3, "InvalidCharacter": 1, "InvalidFormat": 1, "InvalidLength": 1},
+            "Wrong counts of failures.",
+        )
+        self.assertGreater(snapshot.base58_seconds, 0, "Time of Base58 stage wasn't measured.")
+        self.assertGreater(snapshot.hashing_seconds, 0, "Time of hashing stage wasn't measured.")
+        self.assertEqual(metrics.stats(), metrics.KeylessStats({}, {}, {}, 0.0, 0.0), "Metrics weren't reset.")
+
+    def test_callback(self: "TestMetrics") -> None:
+        values: list[tuple[str, str, float]] = []
+        metrics.enable(lambda name, label, value: values.append((name, label, value)))
+
+        ###
+
+        traitkeyless.decode_address(traitkeyless.encode_app_agent_address(123))
+
+        self.assertIn(("encoded", "AppAgent", 1), values, "Callback didn't get the encoded address.")
+        self.assertIn(("decoded", "AppAgent", 1), values, "Callback didn't get the decoded address.")
+        self.assertEqual(
+            {label for name, label, _ in values if name == "seconds"},
+            {metrics.BASE58_STAGE, metrics.HASHING_STAGE},
+            "Callback didn't get the times of stages.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import traitkeyless
+from traitkeyless import metrics
+from traitkeyless.parallel import decode_addresses_parallel
+
+
+class TestParallelDecoding(unittest.TestCase):
+    def test_matches_decode_address(self: "TestParallelDecoding") -> None:
+        addresses = traitkeyless.encode_transactional_addresses(123, range(300))
+        addresses += traitkeyless.encode_named_addresses(123, ["hot-wallet", "example123"])
+        addresses += traitkeyless.encode_app_agent_addresses(range(50))
+        addresses += [
+            "ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4",
+            "0x7b00000001293833058fc7db52fc03f6ce344bca98bd7825ff747743f1ff63e2",
+        ]
+        expected = [traitkeyless.decode_address(address) for address in addresses]
+
+        ###
+
+        self.assertEqual(
+            list(decode_addresses_parallel(addresses, workers=3, chunk_size=100)),
+            expected,
+            "Parallel decoding differs from decoding of single addresses.",
+        )
+        self.assertEqual(
+            list(decode_addresses_parallel(addresses, workers=2)),
+            expected,
+            "Decoding in chunks derived from the number of workers differs from decoding of single addresses.",
+        )
+        self.assertEqual(
+            list(decode_addresses_parallel(addresses[:10], workers=1)),
+            expected[:10],
+            "Decoding in the calling process differs from decoding of single addresses.",
+        )
+
+    def test_lazy_results(self: "TestParallelDecoding") -> None:
+        addresses = traitkeyless.encode_transactional_addresses(123, range(20))
+
+        ###
+
+        addresses_info = decode_addresses_parallel(addresses, workers=2)
+
+        ###
+
+        self.assertEqual(len(addresses_info), 20, "Wrong number of results.")
+        self.assertEqual(addresses_info.statuses, bytes(20), "Statuses of valid addresses are not Ok.")
+        self.assertEqual(addresses_info[-1].ta_id, 19, "Wrong info about the last address.")
+        self.assertEqual([info.ta_id for info in addresses_info[2:5]], [2, 3, 4], "Wrong slice of results.")
+        with self.assertRaises(IndexError):
+            addresses_info[20]
+
+    def test_executor(self: "TestParallelDecoding") -> None:
+        batches = [traitkeyless.encode_app_agent_addresses(range(start, start + 5)) for start in (0, 5)]
+
+        ###
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = [decode_addresses_parallel(batch, executor=executor) for batch in batches]
+
+        ###
+
+        self.assertEqual(
+            [info.app_agent_id for addresses_info in results for info in addresses_info],
+            list(range(10)),
+            "Decoding with a given pool of processes differs from decoding of single addresses.",
+        )
+
+    def test_metrics(self: "TestParallelDecoding") -> None:
+        addresses = [*traitkeyless.encode_app_agent_addresses(range(6)), "0x" + "00" * 32]
+
+        metrics.reset()
+        metrics.enable()
+        self.addCleanup(metrics.reset)
+        self.addCleanup(metrics.disable)
+
+        ###
+
+        decode_addresses_parallel(addresses, workers=2)
+
+        ###
+
+        self.assertEqual(
+            metrics.stats().decoded, {"AppAgent": 6, "Regular": 1}, "Parallel decoding isn't counted in metrics."
+        )
+
+    def test_errors(self: "TestParallelDecoding") -> None:
+        addresses = traitkeyless.encode_app_agent_addresses(range(20))
+
+        with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+            decode_addresses_parallel([*addresses, addresses[0][:-1] + "q"], workers=2, chunk_size=10)
+
+        with self.assertRaisesRegex(ValueError, "^Invalid SS58 format$"):
+            decode_addresses_parallel(addresses, 42, workers=2, chunk_size=10)
+
+        with self.assertRaisesRegex(ValueError, "^Chunk size must be positive$"):
+            decode_addresses_parallel(addresses, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import traitkeyless
+from traitkeyless.persistent import PersistentAddressCache
+
+
+class TestPersistentAddressCache(unittest.TestCase):
+    def setUp(self: "TestPersistentAddressCache") -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "addresses.sqlite"
+
+    def tearDown(self: "TestPersistentAddressCache") -> None:
+        self.directory.cleanup()
+
+    def test_encoding(self: "TestPersistentAddressCache") -> None:
+        for ss58_format in [42, 5335]:
+            with self.subTest(ss58_format=ss58_format), PersistentAddressCache(self.path, ss58_format) as cache:
+                for _ in range(2):
+                    self.assertEqual(
+                        cache.encode_app_agent_address(123), traitkeyless.encode_app_agent_address(123, ss58_format)
+                    )
+                    self.assertEqual(
+                        cache.encode_transactional_address(123, 456),
+                        traitkeyless.encode_transactional_address(123, 456, ss58_format),
+                    )
+                    self.assertEqual(
+                        cache.encode_named_address(123, "hot-wallet"),
+                        traitkeyless.encode_named_address(123, "hot-wallet", ss58_format),
+                    )
+                self.assertEqual(len(cache), 3, "Addresses of the format weren't stored once each.")
+
+    def test_warm_start(self: "TestPersistentAddressCache") -> None:
+        with PersistentAddressCache(self.path) as cache:
+            cache.encode_app_agent_address(123)
+            cache.decode_address(traitkeyless.encode_transactional_address(123, 456))
+
+        ###
+
+        # A new process reads the addresses instead of encoding them
+        app_agent_address = traitkeyless.encode_app_agent_address(123)
+        transactional_address = traitkeyless.encode_transactional_address(123, 456)
+        for load in [False, True]:
+            with (
+                self.subTest(load=load),
+                PersistentAddressCache(self.path) as cache,
+                patch.object(traitkeyless.KeylessCodec, "_encode_address", side_effect=AssertionError("Encoded")),
+            ):
+                if load:
+                    self.assertEqual(cache.load(), 2, "Wrong number of loaded addresses.")
+                self.assertEqual(cache.encode_app_agent_address(123), app_agent_address)
+                self.assertEqual(cache.encode_transactional_address(123, 456), transactional_address)
+                self.assertEqual(cache.decode_address(transactional_address).ta_id, 456)
+
+    def test_decoding(self: "TestPersistentAddressCache") -> None:
+        addresses = [
+            traitkeyless.encode_app_agent_address(123),
+            traitkeyless.encode_transactional_address(123, 456),
+            traitkeyless.encode_named_address(123, "hot-wallet"),
+            "ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4",
+        ]
+        with PersistentAddressCache(self.path) as cache:
+            for address in addresses:
+                cache.encode_app_agent_address(123)
+                self.assertEqual(cache.decode_address(address), traitkeyless.decode_address(address))
+
+            with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+                cache.decode_address(addresses[1][:-1] + "1")
+
+        ###
+
+        with PersistentAddressCache(self.path) as cache:
+            for address in addresses:
+                address_info = cache.decode_address(address)
+                self.assertEqual(address_info, traitkeyless.decode_address(address), "Stored address decoded wrong.")
+                self.assertEqual(address_info.account_id, traitkeyless.decode_address(address).account_id)
+            self.assertEqual(len(cache), 3, "Regular address was stored.")
+
+    def test_preload(self: "TestPersistentAddressCache") -> None:
+        with PersistentAddressCache(self.path) as cache:
+            self.assertEqual(cache.preload_app_agent_addresses(range(10)), 10)
+            self.assertEqual(cache.preload_transactional_addresses(123, range(100)), 100)
+            self.assertEqual(cache.preload_transactional_addresses(123, range(50, 150)), 50)
+            self.assertEqual(cache.preload_named_addresses(123, ["hot-wallet", "hot-wallet"]), 1)
+
+        ###
+
+        with PersistentAddressCache(self.path) as cache:
+            self.assertEqual(len(cache), 161, "Preloaded addresses weren't stored.")
+            self.assertEqual(cache.preload_app_agent_addresses(range(10)), 0, "Stored addresses were encoded again.")
+            self.assertEqual(
+                cache.decode_address(cache.encode_transactional_address(123, 149)).ta_id, 149, "Wrong address."
+            )
+
+    def test_hex_account_id(self: "TestPersistentAddressCache") -> None:
+        app_agent_address = traitkeyless.encode_app_agent_address(123)
+        account_id = traitkeyless.decode_address(app_agent_address).account_id
+        with PersistentAddressCache(self.path) as cache:
+            self.assertEqual(cache.decode_address(account_id).app_agent_id, 123, "Wrong address.")
+            self.assertEqual(cache.encode_app_agent_address(123), app_agent_address, "Hex account ID was stored.")
+            self.assertEqual(cache.decode_address(account_id).address, account_id, "Wrong address.")
+
+        ###
+
+        with PersistentAddressCache(self.path) as cache:
+            self.assertEqual(cache.encode_app_agent_address(123), app_agent_address, "Hex account ID was stored.")
+
+    def test_size_limit(self: "TestPersistentAddressCache") -> None:
+        with PersistentAddressCache(self.path, max_entries=100) as cache:
+            cache.preload_transactional_addresses(123, range(150))
+            self.assertEqual(len(cache), 100, "Size limit isn't applied.")
+
+        with sqlite3.connect(self.path) as connection:
+            (first_ta_id,) = connection.execute("SELECT min(ta_id) FROM addresses").fetchone()
+        connection.close()
+        self.assertEqual(first_ta_id, 50, "Oldest addresses weren't removed.")
+
+        ###
+
+        # Memory is bounded as well, addresses dropped from memory are read from the database again
+        with PersistentAddressCache(self.path, max_entries=100) as cache:
+            cache.preload_transactional_addresses(123, range(150, 200))
+            self.assertLessEqual(len(cache._addresses), 100, "Size limit isn't applied to memory.")  # noqa: SLF001
+            with patch.object(traitkeyless.KeylessCodec, "_encode_address", side_effect=AssertionError("Encoded")):
+                for ta_id in range(100, 200):
+                    self.assertEqual(
+                        cache.encode_transactional_address(123, ta_id),
+                        traitkeyless.encode_transactional_address(123, ta_id),
+                    )
+            self.assertEqual(len(cache), 100, "Size limit isn't applied.")
+
+    def test_statements(self: "TestPersistentAddressCache") -> None:
+        with PersistentAddressCache(self.path) as cache:
+            cache.encode_app_agent_address(1)
+
+        statements: list[str] = []
+        connect = sqlite3.connect
+
+        def traced_connect(path: Path, *, timeout: float, check_same_thread: bool) -> sqlite3.Connection:
+            connection = connect(path, timeout=timeout, check_same_thread=check_same_thread)
+            connection.set_trace_callback(statements.append)
+            return connection
+
+        ###
+
+        # An existing database isn't written on open, and stored addresses are counted only on the first write
+        with patch("sqlite3.connect", traced_connect), PersistentAddressCache(self.path) as cache:
+            for app_agent_id in range(2, 5):
+                cache.encode_app_agent_address(app_agent_id)
+                cache.flush()
+            self.assertEqual(len(cache), 4, "Wrong number of stored addresses.")
+
+        self.assertFalse(
+            [statement for statement in statements if "journal_mode" in statement or "user_version =" in statement],
+            "Existing database is set up again.",
+        )
+        self.assertEqual(
+            sum(statement == "SELECT count(*) FROM addresses" for statement in statements),
+            1,
+            "Stored addresses are counted on every write.",
+        )
+
+    def test_concurrent_readers(self: "TestPersistentAddressCache") -> None:
+        with PersistentAddressCache(self.path) as writer, PersistentAddressCache(self.path) as reader:
+            writer.preload_app_agent_addresses(range(10))
+            self.assertEqual(reader.encode_app_agent_address(5), traitkeyless.encode_app_agent_address(5))
+            writer.encode_app_agent_address(10)
+            reader.encode_app_agent_address(10)
+
+        with PersistentAddressCache(self.path) as cache:
+            self.assertEqual(len(cache), 11, "Address stored by both processes is duplicated.")
+
+    def test_invalid_cache(self: "TestPersistentAddressCache") -> None:
+        self.path.write_bytes(b"not a database" * 100)
+
+        ###
+
+        with self.assertRaisesRegex(ValueError, "^Invalid persistent address cache$"):
+            PersistentAddressCache(self.path)
+        with self.assertRaisesRegex(ValueError, "^Size of persistent address cache must be positive$"):
+            PersistentAddressCache(self.path, max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,19 @@
 import unittest
 
+import base58
+
 import traitkeyless
+from traitkeyless.ss58 import (
+    ParsedSS58,
+    b58decode,
+    b58encode,
+    get_ss58_format,
+    ss58_decode,
+    ss58_decode_bytes,
+    ss58_encode,
+    ss58_parse,
+    transcode_addresses,
+)
 
 
 class TestKeylessAddresses(unittest.TestCase):
@@ -194,6 +207,136 @@ class TestKeylessAddresses(unittest.TestCase):
         ):
             traitkeyless.decode_address(blockchain_address, 42)
 
+    def test_ss58_decode_bytes(self: "TestKeylessAddresses") -> None:
+        account_id = "0x7b00000001293833058fc7db52fc03f6ce344bca98bd7825ff747743f1ff63e2"
+        blockchain_address = "ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp"
+
+        ###
+
+        self.assertEqual(
+            ss58_decode_bytes(blockchain_address, 5335),
+            bytes.fromhex(account_id[2:]),
+            "Decoding of SS58 address to account ID bytes failed.",
+        )
+        self.assertEqual(
+            ss58_decode(blockchain_address, 5335),
+            account_id,
+            "Decoding of SS58 address to hex account ID failed.",
+        )
+        self.assertEqual(
+            ss58_decode_bytes(account_id),
+            bytes.fromhex(account_id[2:]),
+            "Decoding of hex account ID to account ID bytes failed.",
+        )
+
+        with self.assertRaisesRegex(ValueError, "^Invalid SS58 format$"):
+            ss58_decode_bytes(blockchain_address, 42)
+
+        ###
+
+        decoded_address_info = traitkeyless.decode_address(blockchain_address)
+        with self.assertRaises(AttributeError, msg="Hex account ID is computed before it's read."):
+            # Read the slot of the account ID directly, without computing it
+            traitkeyless.BlockchainAddressInfo.account_id.__get__(decoded_address_info)  # type: ignore[misc, attr-defined]
+        self.assertEqual(decoded_address_info.account_id, account_id, "Hex account ID is computed incorrectly.")
+
+    def test_ss58_parse(self: "TestKeylessAddresses") -> None:
+        account_id_bytes = bytes.fromhex("7b00000001293833058fc7db52fc03f6ce344bca98bd7825ff747743f1ff63e2")
+        addresses = [ss58_encode(account_id_bytes, ss58_format) for ss58_format in [0, 2, 42, 5335, 16383]]
+        addresses.append(ss58_encode("0x01020304", 42))
+
+        ###
+
+        for address in addresses:
+            with self.subTest(address=address):
+                self.assertEqual(
+                    ss58_parse(address),
+                    ParsedSS58(get_ss58_format(address), ss58_decode_bytes(address), checksum_valid=True),
+                    "Parsing differs from detecting the SS58 format and decoding the address.",
+                )
+                self.assertIsNone(ss58_parse(address, verify_checksum=False).checksum_valid, "Checksum is verified.")
+
+        corrupted_address = addresses[3][:-1] + ("1" if addresses[3][-1] != "1" else "2")
+        self.assertEqual(
+            ss58_parse(corrupted_address),
+            ParsedSS58(5335, ss58_decode_bytes(corrupted_address[:-1] + addresses[3][-1]), checksum_valid=False),
+            "Invalid checksum isn't reported.",
+        )
+
+        with self.assertRaisesRegex(ValueError, "^Empty address provided$"):
+            ss58_parse("")
+        with self.assertRaisesRegex(ValueError, "^Invalid address length$"):
+            ss58_parse(b58encode(b"\x2a" + bytes(20)))
+        with self.assertRaisesRegex(ValueError, "^46 is a reserved SS58 format$"):
+            ss58_parse(b58encode(b"\x2e" + bytes(34)))
+
+    def test_base58(self: "TestKeylessAddresses") -> None:
+        account_id_bytes = bytes.fromhex("7b00000001293833058fc7db52fc03f6ce344bca98bd7825ff747743f1ff63e2")
+        payloads = [
+            b"\x2a" + account_id_bytes + b"\x00\x01",
+            b"\x75\xcd" + account_id_bytes + b"\xff\xff",
+            b"\x00" + account_id_bytes + b"\x00\x00",
+            b"\x00\x00" + bytes(34),
+            b"\x2a\x01\x02",
+        ]
+
+        ###
+
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                encoded_payload = b58encode(payload)
+                self.assertEqual(
+                    encoded_payload,
+                    base58.b58encode(payload).decode(),
+                    "Base58 encoding differs from the base58 package.",
+                )
+                self.assertEqual(b58decode(encoded_payload), payload, "Base58 decoding failed.")
+
+        with self.assertRaisesRegex(ValueError, "^Invalid character '0'$"):
+            b58decode("0" * 48)
+
+    def test_transcode_addresses(self: "TestKeylessAddresses") -> None:
+        addresses = [
+            *traitkeyless.encode_transactional_addresses(123, range(10)),
+            traitkeyless.encode_named_address(123, "hot-wallet"),
+            ss58_encode("0x" + "ab" * 32, 5335),
+        ]
+
+        ###
+
+        for batch_size in [1, 3, 1024]:
+            with self.subTest(batch_size=batch_size):
+                transcoded_addresses = list(transcode_addresses(iter(addresses), 5335, 42, batch_size))
+                self.assertEqual(
+                    transcoded_addresses,
+                    [ss58_encode(ss58_decode(address, 5335), 42) for address in addresses],
+                    "Transcoding differs from decoding and encoding.",
+                )
+                self.assertEqual(
+                    list(transcode_addresses(transcoded_addresses, 42, 5335, batch_size)),
+                    addresses,
+                    "Transcoding back doesn't restore the addresses.",
+                )
+
+        # Account index of 4 bytes, with a checksum of 1 byte
+        self.assertEqual(
+            list(transcode_addresses([ss58_encode("0x01020304", 42)], 42, 0)),
+            [ss58_encode("0x01020304", 0)],
+            "Transcoding of an account index failed.",
+        )
+
+        transcoded = transcode_addresses([addresses[0], addresses[0][:-1] + "1"], 5335, 42, batch_size=1)
+        self.assertEqual(next(transcoded), ss58_encode(ss58_decode(addresses[0]), 42), "Valid address isn't yielded.")
+        with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+            next(transcoded)
+
+        with self.assertRaisesRegex(ValueError, "^Invalid SS58 format$"):
+            list(transcode_addresses(addresses, 42, 5335))
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            transcode_addresses(addresses, 5335, 46)
+        with self.assertRaisesRegex(ValueError, "^Batch size must be positive$"):
+            transcode_addresses(addresses, 5335, 42, batch_size=0)
+
 
 if __name__ == "__main__":
     unittest.main()
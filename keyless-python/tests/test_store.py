@@ -0,0 +1,136 @@
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import traitkeyless
+from traitkeyless.store import AddressRecord, AddressStoreReader, AddressStoreWriter
+
+
+class TestAddressStore(unittest.TestCase):
+    def setUp(self: "TestAddressStore") -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "addresses.tkl"
+
+        self.addresses = [
+            traitkeyless.encode_app_agent_address(123),
+            *traitkeyless.encode_transactional_addresses(123, range(5)),
+            traitkeyless.encode_named_address(123, "hot-wallet"),
+            traitkeyless.encode_transactional_address(7, 2**32 - 1),
+            "ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4",
+            # Regular account ID that starts with bytes of AppAgent ID 123
+            "0x7b00000001" + "00" * 27,
+        ]
+        self.addresses_info = [traitkeyless.decode_address(address) for address in self.addresses[:-1]]
+
+    def tearDown(self: "TestAddressStore") -> None:
+        self.directory.cleanup()
+
+    def test_round_trip(self: "TestAddressStore") -> None:
+        with AddressStoreWriter(self.path) as writer:
+            writer.write(self.addresses_info[0])
+            writer.write_many(self.addresses_info[1:])
+
+        ###
+
+        with AddressStoreReader(self.path) as reader:
+            self.assertEqual(len(reader), len(self.addresses_info), "Wrong number of records.")
+            self.assertEqual(reader.ss58_format, traitkeyless.SS58_FORMAT__TRAIT_ASSET_HUB, "Wrong SS58 format.")
+
+            for index, address_info in enumerate(self.addresses_info):
+                with self.subTest(address=address_info.address):
+                    self.assertEqual(
+                        reader[index],
+                        AddressRecord(
+                            bytes.fromhex(address_info.account_id[2:]),
+                            address_info.address_type,
+                            address_info.app_agent_id,
+                            address_info.ta_id,
+                            address_info.address_name,
+                        ),
+                        "Record differs from the decoded address.",
+                    )
+                    self.assertEqual(reader.address(index), address_info.address, "Wrong encoded address.")
+                    self.assertEqual(reader.address_info(index), address_info, "Wrong info about the address.")
+
+            self.assertEqual(list(reader), [reader[index] for index in range(len(reader))], "Wrong iteration.")
+            self.assertEqual(reader[-1], reader[len(reader) - 1], "Wrong negative index.")
+            with self.assertRaisesRegex(IndexError, "^Address store index out of range$"):
+                reader[len(reader)]
+
+    def test_records_of_app_agent(self: "TestAddressStore") -> None:
+        addresses_info = [*self.addresses_info, traitkeyless.decode_address(self.addresses[-1])]
+        with AddressStoreWriter(self.path) as writer:
+            writer.write_many(addresses_info)
+
+        ###
+
+        with AddressStoreReader(self.path) as reader:
+            records = list(reader.records_of_app_agent(123))
+            self.assertEqual(
+                [(record.address_type, record.ta_id, record.address_name) for record in records],
+                [
+                    (traitkeyless.AddressType.AppAgent, None, None),
+                    *[(traitkeyless.AddressType.Transactional, ta_id, None) for ta_id in range(5)],
+                    (traitkeyless.AddressType.Named, None, "hot-wallet"),
+                ],
+                "Wrong records of AppAgent.",
+            )
+            self.assertEqual(len(list(reader.records_of_app_agent(7))), 1, "Wrong records of AppAgent.")
+            self.assertEqual(list(reader.records_of_app_agent(8)), [], "Records of unknown AppAgent found.")
+
+    def test_other_ss58_format(self: "TestAddressStore") -> None:
+        address_info = traitkeyless.decode_address(traitkeyless.encode_named_address(1, "example123", 42), 42)
+        with AddressStoreWriter(self.path, 42) as writer:
+            writer.write(address_info)
+
+        ###
+
+        with AddressStoreReader(self.path) as reader:
+            self.assertEqual(reader.address_info(0), address_info, "Wrong info about the address.")
+
+    def test_invalid_files(self: "TestAddressStore") -> None:
+        AddressStoreWriter(self.path).close()
+        with AddressStoreReader(self.path) as reader:
+            self.assertEqual(list(reader), [], "Empty store has records.")
+
+        for content in [b"", b"TKLSTORE", b"NOTSTORE" + bytes(8), self.path.read_bytes() + b"\0"]:
+            with self.subTest(content=content):
+                self.path.write_bytes(content)
+                with self.assertRaisesRegex(ValueError, "^Invalid address store file$"):
+                    AddressStoreReader(self.path)
+
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            AddressStoreWriter(self.path, 46)
+
+        self.path.write_bytes(b"TKLSTORE" + struct.pack("<HHH2x", 1, 46, 51))
+        with patch("traitkeyless.store.mmap.mmap") as mmap_mock:
+            with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+                AddressStoreReader(self.path)
+            mmap_mock.assert_not_called()
+
+    def test_constructed_address_info(self: "TestAddressStore") -> None:
+        decoded = self.addresses_info[1]
+        address_info = traitkeyless.BlockchainAddressInfo(
+            decoded.address,
+            decoded.account_id,
+            decoded.address_type,
+            decoded.app_agent_id,
+            decoded.ta_id,
+            decoded.address_name,
+        )
+
+        ###
+
+        with AddressStoreWriter(self.path) as writer:
+            writer.write(address_info)
+
+        ###
+
+        with AddressStoreReader(self.path) as reader:
+            self.assertEqual(reader.address_info(0), decoded, "Wrong info about a constructed address.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+import traitkeyless
+from traitkeyless.table import MAX_TABLE_SIZE, AppAgentAddressTable
+
+
+class TestAppAgentAddressTable(unittest.TestCase):
+    def test_encoding(self: "TestAppAgentAddressTable") -> None:
+        for ss58_format in [42, 5335]:
+            table = AppAgentAddressTable(100, ss58_format)
+            with self.subTest(ss58_format=ss58_format):
+                self.assertEqual(len(table), 101, "Wrong number of addresses in the table.")
+                self.assertEqual(
+                    [table.encode_app_agent_address(app_agent_id) for app_agent_id in range(101)],
+                    traitkeyless.encode_app_agent_addresses(range(101), ss58_format),
+                    "Table encodes AppAgent addresses differently.",
+                )
+
+    def test_decoding(self: "TestAppAgentAddressTable") -> None:
+        table = AppAgentAddressTable(1000)
+
+        ###
+
+        for app_agent_id in range(1001):
+            self.assertEqual(
+                table.decode_app_agent_address(traitkeyless.encode_app_agent_address(app_agent_id)),
+                app_agent_id,
+                "Table decodes AppAgent address incorrectly.",
+            )
+
+        # Addresses that aren't in the table are decoded
+        self.assertIsNone(table.lookup(traitkeyless.encode_app_agent_address(5000)), "Address isn't in the table.")
+        self.assertEqual(table.decode_app_agent_address(traitkeyless.encode_app_agent_address(5000)), 5000)
+        self.assertIsNone(table.lookup(traitkeyless.encode_app_agent_address(123, 42)), "Address of another format.")
+        self.assertIsNone(table.lookup("ttąxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4"), "Non-ASCII address.")
+
+        with self.assertRaisesRegex(ValueError, "^Provided address is not an AppAgent address"):
+            table.decode_app_agent_address(traitkeyless.encode_transactional_address(123, 456))
+        with self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+            table.decode_app_agent_address(traitkeyless.encode_app_agent_address(123)[:-1] + "1")
+
+    def test_growth(self: "TestAppAgentAddressTable") -> None:
+        table = AppAgentAddressTable(10)
+
+        ###
+
+        self.assertEqual(table.encode_app_agent_address(15), traitkeyless.encode_app_agent_address(15))
+        self.assertEqual(table.max_id, 21, "Table didn't grow by doubling.")
+        self.assertEqual(table.lookup(traitkeyless.encode_app_agent_address(20)), 20, "Grown address isn't found.")
+
+        self.assertEqual(table.encode_app_agent_address(100), traitkeyless.encode_app_agent_address(100))
+        self.assertEqual(table.max_id, 100, "Table didn't grow to the ID.")
+
+        # IDs beyond the maximal size of a table are encoded without the table
+        self.assertEqual(
+            table.encode_app_agent_address(MAX_TABLE_SIZE), traitkeyless.encode_app_agent_address(MAX_TABLE_SIZE)
+        )
+        self.assertEqual(table.max_id, 100, "Table grew beyond its maximal size.")
+        with self.assertRaises(OverflowError):
+            table.encode_app_agent_address(-1)
+
+    def test_invalid_table(self: "TestAppAgentAddressTable") -> None:
+        with self.assertRaisesRegex(ValueError, "^Invalid maximal AppAgent ID of address table$"):
+            AppAgentAddressTable(-1)
+        with self.assertRaisesRegex(ValueError, "^Invalid value for ss58_format$"):
+            AppAgentAddressTable(10, 46)
+
+    def test_memory_footprint(self: "TestAppAgentAddressTable") -> None:
+        table = AppAgentAddressTable(9999)
+
+        ###
+
+        self.assertLess(table.memory_footprint() / len(table), 100, "Entries of the table aren't compact.")
+
+
+if __name__ == "__main__":
+    unittest.main()
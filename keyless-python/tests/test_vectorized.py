@@ -0,0 +1,74 @@
+import importlib.util
+import unittest
+
+import traitkeyless
+from traitkeyless.ss58 import ss58_encode
+
+if importlib.util.find_spec("numpy") is not None:
+    import numpy as np
+
+    from traitkeyless.vectorized import MISSING_ID, decode_addresses_np
+
+
+@unittest.skipIf(importlib.util.find_spec("numpy") is None, "numpy is not installed")
+class TestVectorizedDecoding(unittest.TestCase):
+    def test_decode_addresses(self: "TestVectorizedDecoding") -> None:
+        app_agent_address = "ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp"
+        transactional_address = "ttowKp8AmjjQh4GoN7xMiQWwVyyrU1Pu7GRf5HxFmV5t43TXG"
+        named_address = "ttowKp8Amrt2FQ2eNdsbMsW2EEeEsEmsT8KHLvPhVppp9zs8k"
+        regular_address = "ttqxHzRJmmjFBcE7Lb5Xs4GNMq2gFSt28JyvTEqjhqzE9EGP4"
+
+        ###
+
+        addresses_info = decode_addresses_np([app_agent_address, transactional_address, named_address, regular_address])
+        self.assertEqual(
+            addresses_info["address_type"].tolist(),
+            [
+                traitkeyless.AddressType.AppAgent.value,
+                traitkeyless.AddressType.Transactional.value,
+                traitkeyless.AddressType.Named.value,
+                traitkeyless.AddressType.Regular.value,
+            ],
+            "Types of addresses are decoded incorrectly.",
+        )
+        self.assertEqual(addresses_info["app_agent_id"].tolist(), [123, 123, 123, MISSING_ID])
+        self.assertEqual(addresses_info["ta_id"].tolist(), [MISSING_ID, 456, MISSING_ID, MISSING_ID])
+        self.assertEqual(addresses_info["name"].tolist(), [b"", b"", b"example123", b""])
+        self.assertEqual(
+            "0x" + addresses_info["account_id"][3].tobytes().hex(),
+            "0xd43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d",
+            "Account ID is decoded incorrectly.",
+        )
+
+    def test_matches_decode_address(self: "TestVectorizedDecoding") -> None:
+        addresses = traitkeyless.encode_transactional_addresses(7, range(100), 42)
+        addresses += traitkeyless.encode_app_agent_addresses(range(100), 42)
+
+        addresses_info = decode_addresses_np(addresses, 42)
+        for address, address_info in zip(addresses, addresses_info, strict=True):
+            expected_address_info = traitkeyless.decode_address(address, 42)
+            with self.subTest(address=address):
+                self.assertEqual(address_info["address_type"], expected_address_info.address_type.value)
+                self.assertEqual(address_info["app_agent_id"], expected_address_info.app_agent_id)
+                self.assertEqual(
+                    "0x" + address_info["account_id"].tobytes().hex(),
+                    expected_address_info.account_id,
+                )
+
+    def test_errors(self: "TestVectorizedDecoding") -> None:
+        self.assertEqual(len(decode_addresses_np([])), 0, "Decoding of no addresses should produce an empty array.")
+
+        # Trailing zero bytes of an account ID are kept
+        account_id = "0x" + "ab" * 30 + "0000"
+        addresses_info = decode_addresses_np([ss58_encode(account_id, 42)], 42)
+        self.assertEqual(addresses_info["account_id"].dtype, np.dtype("V32"), "Account ID isn't a 32 bytes field.")
+        self.assertEqual(
+            "0x" + addresses_info["account_id"][0].tobytes().hex(), account_id, "Trailing zero bytes are lost."
+        )
+
+        with self.assertRaisesRegex(ValueError, "^Invalid SS58 format$"):
+            decode_addresses_np(["ttowKp8AmQuGfbBGikG2pbdYNnErhHRaLrdktJeZEfJVeVnTp"], 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+
+import traitkeyless
+from traitkeyless.ss58 import ss58_encode
+
+
+def corrupt(address: str) -> str:
+    """Replace the last character of an address, which breaks its SS58 checksum."""
+    return address[:-1] + ("q" if address[-1] != "q" else "r")
+
+
+class TestVerifyLevels(unittest.TestCase):
+    def test_valid_addresses(self: "TestVerifyLevels") -> None:
+        for ss58_format in [42, 5335]:
+            codec = traitkeyless.KeylessCodec(ss58_format)
+            addresses = [
+                traitkeyless.encode_app_agent_address(123, ss58_format),
+                traitkeyless.encode_transactional_address(123, 456, ss58_format),
+                traitkeyless.encode_named_address(123, "hot-wallet", ss58_format),
+                ss58_encode("0x" + "ab" * 32, ss58_format),
+            ]
+            for address in addresses:
+                expected = traitkeyless.decode_address(address, ss58_format)
+                for verify in ("none", "ss58", "full"):
+                    with self.subTest(ss58_format=ss58_format, address=address, verify=verify):
+                        self.assertEqual(
+                            traitkeyless.decode_address(address, ss58_format, verify=verify),
+                            expected,
+                            "Decoding of a valid address depends on the verification.",
+                        )
+                        self.assertEqual(
+                            codec.decode_address(address, verify=verify),
+                            expected,
+                            "Codec decodes a valid address differently.",
+                        )
+
+    def test_typed_decoding(self: "TestVerifyLevels") -> None:
+        codec = traitkeyless.KeylessCodec()
+        app_agent_address = traitkeyless.encode_app_agent_address(123)
+        transactional_address = traitkeyless.encode_transactional_address(123, 456)
+        named_address = traitkeyless.encode_named_address(123, "hot-wallet")
+
+        ###
+
+        for verify in ("none", "ss58", "full"):
+            with self.subTest(verify=verify):
+                self.assertEqual(traitkeyless.decode_app_agent_address(app_agent_address, verify=verify), 123)
+                self.assertEqual(
+                    traitkeyless.decode_transactional_address(transactional_address, verify=verify), (123, 456)
+                )
+                self.assertEqual(traitkeyless.decode_named_address(named_address, verify=verify), (123, "hot-wallet"))
+                self.assertEqual(codec.decode_app_agent_address(app_agent_address, verify=verify), 123)
+                self.assertEqual(codec.decode_transactional_address(transactional_address, verify=verify), (123, 456))
+                self.assertEqual(codec.decode_named_address(named_address, verify=verify), (123, "hot-wallet"))
+
+                with self.assertRaisesRegex(ValueError, "^Provided address is not an AppAgent address"):
+                    traitkeyless.decode_app_agent_address(transactional_address, verify=verify)
+
+    def test_skipped_ss58_checksum(self: "TestVerifyLevels") -> None:
+        address = corrupt(traitkeyless.encode_transactional_address(123, 456))
+        codec = traitkeyless.KeylessCodec()
+
+        ###
+
+        for verify in ("ss58", "full"):
+            with self.subTest(verify=verify), self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+                traitkeyless.decode_address(address, verify=verify)
+            with self.subTest(verify=verify), self.assertRaisesRegex(ValueError, "^Invalid checksum$"):
+                codec.decode_address(address, verify=verify)
+
+        self.assertEqual(traitkeyless.decode_transactional_address(address, verify="none"), (123, 456))
+        self.assertEqual(codec.decode_transactional_address(address, verify="none"), (123, 456))
+
+        # The SS58 format is checked at every level
+        with self.assertRaisesRegex(ValueError, "^Invalid SS58 format$"):
+            traitkeyless.decode_address(traitkeyless.encode_app_agent_address(123, 42), verify="none")
+
+    def test_skipped_keyless_checksum(self: "TestVerifyLevels") -> None:
+        # Regular address with the type byte of a Transactional address
+        address = ss58_encode("0x7b00000002" + "00" * 27, traitkeyless.SS58_FORMAT__TRAIT_ASSET_HUB)
+
+        ###
+
+        self.assertEqual(traitkeyless.decode_address(address).address_type, traitkeyless.AddressType.Regular)
+        for verify in ("none", "ss58"):
+            with self.subTest(verify=verify):
+                address_info = traitkeyless.decode_address(address, verify=verify)
+                self.assertEqual(
+                    address_info.address_type,
+                    traitkeyless.AddressType.Transactional,
+                    "Type of an address isn't read from its type byte.",
+                )
+                self.assertEqual((address_info.app_agent_id, address_info.ta_id), (123, 0))
+
+    def test_invalid_level(self: "TestVerifyLevels") -> None:
+        address = traitkeyless.encode_app_agent_address(123)
+
+        ###
+
+        with self.assertRaisesRegex(ValueError, "^Invalid value for verify$"):
+            traitkeyless.decode_address(address, verify="partial")  # type: ignore[arg-type]
+        with self.assertRaisesRegex(ValueError, "^Invalid value for verify$"):
+            traitkeyless.KeylessCodec().decode_address(address, verify="partial")  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
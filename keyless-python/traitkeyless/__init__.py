@@ -1,24 +1,61 @@
-# ruff: noqa: I001
-
-from traitkeyless.keyless import (
-    NAMED_ADDRESS_LENGTH,
-    SS58_FORMAT__TRAIT_ASSET_HUB,
-    BlockchainAddress,
-    BlockchainAccountId,
-    AddressType,
-    AppAgentId,
-    TransactionalAddressId,
-    AddressName,
-    SS58Format,
-    BlockchainAddressInfo,
-    encode_app_agent_address,
-    decode_app_agent_address,
-    encode_transactional_address,
-    decode_transactional_address,
-    encode_named_address,
-    decode_named_address,
-    decode_address,
-)
+"""__init__.py
+
+This package provides encoding and decoding of TRAIT keyless addresses.
+
+Public names are imported from their modules when they're first accessed, so importing the package alone
+doesn't import `dataclasses`, `hashlib` or `base58`, and a process that uses only the codec functions
+doesn't import the cache and the index. The encoders and the constants are imported from `encoders`,
+so a process that only encodes addresses doesn't import `enum` either, and neither encoding nor decoding
+imports `dataclasses`.
+"""
+
+# Module of every public name
+_EXPORTS = {
+    "NAMED_ADDRESS_LENGTH": "encoders",
+    "SS58_FORMAT__TRAIT_ASSET_HUB": "encoders",
+    "BlockchainAddress": "encoders",
+    "BlockchainAccountId": "encoders",
+    "AddressType": "keyless",
+    "DecodeStatus": "keyless",
+    "AppAgentId": "encoders",
+    "TransactionalAddressId": "encoders",
+    "AddressName": "encoders",
+    "SS58Format": "encoders",
+    "VerifyLevel": "keyless",
+    "BlockchainAddressInfo": "keyless",
+    "KeylessCodec": "keyless",
+    "encode_app_agent_address": "encoders",
+    "encode_app_agent_addresses": "encoders",
+    "decode_app_agent_address": "keyless",
+    "encode_transactional_address": "encoders",
+    "encode_transactional_addresses": "encoders",
+    "iter_transactional_addresses": "encoders",
+    "decode_transactional_address": "keyless",
+    "encode_named_address": "encoders",
+    "encode_named_addresses": "encoders",
+    "decode_named_address": "keyless",
+    "decode_address": "keyless",
+    "try_decode_address": "keyless",
+    "classify_address": "keyless",
+    "encode_app_agent_account_id": "encoders",
+    "encode_app_agent_account_ids": "encoders",
+    "encode_transactional_account_id": "encoders",
+    "encode_transactional_account_ids": "encoders",
+    "encode_named_account_id": "encoders",
+    "encode_named_account_ids": "encoders",
+    "decode_account_id": "keyless",
+    "decode_account_ids": "keyless",
+    "DecodeCache": "cache",
+    "DecodeCacheInfo": "cache",
+    "DecodedAddresses": "parallel",
+    "decode_addresses_parallel": "parallel",
+    "KeylessAddressIndex": "index",
+    "filter_by_app_agents": "index",
+    "AppAgentAddressTable": "table",
+    "AppAgentGroup": "groups",
+    "AppAgentGroups": "groups",
+    "group_by_app_agent": "groups",
+}
 
 __all__ = [
     "NAMED_ADDRESS_LENGTH",
@@ -26,16 +63,62 @@ __all__ = [
     "BlockchainAddress",
     "BlockchainAccountId",
     "AddressType",
+    "DecodeStatus",
     "AppAgentId",
     "TransactionalAddressId",
     "AddressName",
     "SS58Format",
+    "VerifyLevel",
     "BlockchainAddressInfo",
+    "KeylessCodec",
     "encode_app_agent_address",
+    "encode_app_agent_addresses",
     "decode_app_agent_address",
     "encode_transactional_address",
+    "encode_transactional_addresses",
+    "iter_transactional_addresses",
     "decode_transactional_address",
     "encode_named_address",
+    "encode_named_addresses",
     "decode_named_address",
     "decode_address",
+    "try_decode_address",
+    "classify_address",
+    "encode_app_agent_account_id",
+    "encode_app_agent_account_ids",
+    "encode_transactional_account_id",
+    "encode_transactional_account_ids",
+    "encode_named_account_id",
+    "encode_named_account_ids",
+    "decode_account_id",
+    "decode_account_ids",
+    "DecodeCache",
+    "DecodeCacheInfo",
+    "DecodedAddresses",
+    "decode_addresses_parallel",
+    "KeylessAddressIndex",
+    "filter_by_app_agents",
+    "AppAgentAddressTable",
+    "AppAgentGroup",
+    "AppAgentGroups",
+    "group_by_app_agent",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    # `__import__` returns the submodule itself when given a list of its names, `importlib` isn't imported for it
+    module = __import__(f"{__name__}.{module_name}", fromlist=[name])
+    value = getattr(module, name)
+    # Later accesses find the name in the module and don't call `__getattr__`
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
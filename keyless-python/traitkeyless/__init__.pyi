@@ -0,0 +1,90 @@
+# ruff: noqa: I001, RUF022
+
+from traitkeyless.keyless import (
+    NAMED_ADDRESS_LENGTH,
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    BlockchainAddress,
+    BlockchainAccountId,
+    AddressType,
+    DecodeStatus,
+    AppAgentId,
+    TransactionalAddressId,
+    AddressName,
+    SS58Format,
+    VerifyLevel,
+    BlockchainAddressInfo,
+    KeylessCodec,
+    encode_app_agent_address,
+    encode_app_agent_addresses,
+    decode_app_agent_address,
+    encode_transactional_address,
+    encode_transactional_addresses,
+    iter_transactional_addresses,
+    decode_transactional_address,
+    encode_named_address,
+    encode_named_addresses,
+    decode_named_address,
+    decode_address,
+    try_decode_address,
+    classify_address,
+    encode_app_agent_account_id,
+    encode_app_agent_account_ids,
+    encode_transactional_account_id,
+    encode_transactional_account_ids,
+    encode_named_account_id,
+    encode_named_account_ids,
+    decode_account_id,
+    decode_account_ids,
+)
+from traitkeyless.cache import DecodeCache, DecodeCacheInfo
+from traitkeyless.parallel import DecodedAddresses, decode_addresses_parallel
+from traitkeyless.index import KeylessAddressIndex, filter_by_app_agents
+from traitkeyless.table import AppAgentAddressTable
+from traitkeyless.groups import AppAgentGroup, AppAgentGroups, group_by_app_agent
+
+__all__ = [
+    "NAMED_ADDRESS_LENGTH",
+    "SS58_FORMAT__TRAIT_ASSET_HUB",
+    "BlockchainAddress",
+    "BlockchainAccountId",
+    "AddressType",
+    "DecodeStatus",
+    "AppAgentId",
+    "TransactionalAddressId",
+    "AddressName",
+    "SS58Format",
+    "VerifyLevel",
+    "BlockchainAddressInfo",
+    "KeylessCodec",
+    "encode_app_agent_address",
+    "encode_app_agent_addresses",
+    "decode_app_agent_address",
+    "encode_transactional_address",
+    "encode_transactional_addresses",
+    "iter_transactional_addresses",
+    "decode_transactional_address",
+    "encode_named_address",
+    "encode_named_addresses",
+    "decode_named_address",
+    "decode_address",
+    "try_decode_address",
+    "classify_address",
+    "encode_app_agent_account_id",
+    "encode_app_agent_account_ids",
+    "encode_transactional_account_id",
+    "encode_transactional_account_ids",
+    "encode_named_account_id",
+    "encode_named_account_ids",
+    "decode_account_id",
+    "decode_account_ids",
+    "DecodeCache",
+    "DecodeCacheInfo",
+    "DecodedAddresses",
+    "decode_addresses_parallel",
+    "KeylessAddressIndex",
+    "filter_by_app_agents",
+    "AppAgentAddressTable",
+    "AppAgentGroup",
+    "AppAgentGroups",
+    "group_by_app_agent",
+]
@@ -0,0 +1,415 @@
+"""__main__.py
+
+This module provides a command-line tool for bulk encoding and decoding of keyless addresses.
+
+Addresses are streamed from the standard input or from files, one per line or from a column of CSV or JSONL rows,
+and decoded in batches, so memory use doesn't depend on the size of the input.
+Decoded addresses are written to the standard output as JSONL or CSV rows.
+Encoding produces addresses from ranges of AppAgent IDs or of Transactional address IDs.
+A throughput summary is written to the standard error when the tool finishes.
+
+Examples:
+    python -m traitkeyless decode addresses.txt > addresses.jsonl
+    python -m traitkeyless decode --input-format csv --column address --output-format csv export.csv
+    python -m traitkeyless decode --workers 8 < addresses.txt > addresses.jsonl
+    python -m traitkeyless encode transactional 123 0 1000000 --output-format csv
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from itertools import islice
+from pathlib import Path
+from typing import Any, TextIO
+
+from .keyless import (
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    KeylessCodec,
+    SS58Format,
+)
+
+# Columns of the rows written by the tool
+DECODE_COLUMNS = ("address", "account_id", "address_type", "app_agent_id", "ta_id", "address_name")
+ENCODE_COLUMNS = ("address", "address_type", "app_agent_id", "ta_id")
+
+
+def _batched(iterable: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    """
+    Split an iterable into lists of at most `batch_size` items.
+
+    Args:
+        iterable (Iterable): Items to split.
+        batch_size (int): Maximal number of items in a list.
+
+    Yields:
+        list: Consecutive items of the iterable.
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _open_inputs(paths: Sequence[str]) -> Iterator[TextIO]:
+    """
+    Open the input files one after another, `-` or no files stands for the standard input.
+
+    Args:
+        paths (Sequence[str]): Paths of the input files.
+
+    Yields:
+        TextIO: Opened input file, closed when the next one is requested.
+    """
+    for path in paths or ["-"]:
+        if path == "-":
+            yield sys.stdin
+            continue
+
+        with Path(path).open(encoding="utf-8", newline="") as file:
+            yield file
+
+
+def _read_column(rows: Iterable[Any], column: str, input_format: str) -> Iterator[BlockchainAddress]:
+    """
+    Read addresses from a column of CSV or JSONL rows.
+
+    Args:
+        rows (Iterable[Any]): Parsed rows.
+        column (str): Column with the addresses.
+        input_format (str): `csv` or `jsonl`, used in errors.
+
+    Yields:
+        str: Encoded addresses.
+    """
+    for row_number, row in enumerate(rows, 1):
+        if not isinstance(row, dict) or column not in row:
+            msg = f"Column '{column}' not found in {input_format.upper()} input"
+            raise ValueError(msg)
+        # CSV rows with too few columns have None values, as well as JSONL rows with null values
+        if row[column] is None:
+            msg = f"Missing value of column '{column}' in row {row_number} of {input_format.upper()} input"
+            raise ValueError(msg)
+        yield str(row[column]).strip()
+
+
+def _read_addresses(paths: Sequence[str], input_format: str, column: str) -> Iterator[BlockchainAddress]:
+    """
+    Read addresses from the input files, skipping empty lines.
+
+    Args:
+        paths (Sequence[str]): Paths of the input files.
+        input_format (str): `lines`, `csv` or `jsonl`.
+        column (str): Column with the addresses in CSV and JSONL rows.
+
+    Yields:
+        str: Encoded addresses.
+    """
+    for file in _open_inputs(paths):
+        lines = (line for line in file if line.strip())
+        if input_format == "csv":
+            yield from _read_column(csv.DictReader(file), column, input_format)
+        elif input_format == "jsonl":
+            yield from _read_column(map(json.loads, lines), column, input_format)
+        else:
+            yield from (line.strip() for line in lines)
+
+
+def _decode_serial(
+    addresses: list[BlockchainAddress], codec: KeylessCodec, skip_invalid: bool
+) -> list[BlockchainAddressInfo]:
+    """
+    Decode a batch of addresses in the calling process.
+
+    Args:
+        addresses (list[str]): Encoded addresses.
+        codec (KeylessCodec): Codec of the SS58 format of the addresses.
+        skip_invalid (bool): Leave out invalid addresses instead of failing.
+
+    Returns:
+        list[BlockchainAddressInfo]: Info about the valid addresses.
+    """
+    addresses_info = []
+    for address in addresses:
+        try:
+            addresses_info.append(codec.decode_address(address))
+        except ValueError as error:
+            if skip_invalid:
+                continue
+            msg = f"Invalid address '{address}': {error}"
+            raise ValueError(msg) from error
+
+    return addresses_info
+
+
+def _decode_parallel_batch(
+    addresses: list[BlockchainAddress],
+    ss58_format: SS58Format,
+    workers: int,
+    executor: Executor,
+    skip_invalid: bool,
+) -> list[BlockchainAddressInfo]:
+    """
+    Decode a batch of addresses in a pool of processes.
+
+    Invalid addresses are found by the statuses of the addresses decoded by the workers.
+
+    Args:
+        addresses (list[str]): Encoded addresses.
+        ss58_format (int): SS58 format of the addresses.
+        workers (int): Number of worker processes of the pool.
+        executor (Executor): Pool of processes.
+        skip_invalid (bool): Leave out invalid addresses instead of failing.
+
+    Returns:
+        list[BlockchainAddressInfo]: Info about the valid addresses.
+    """
+    from .parallel import _decode_parallel  # noqa: PLC0415
+
+    addresses_info = _decode_parallel(addresses, ss58_format, workers, None, executor)
+    invalid_indexes = set()
+    for index, error in addresses_info._decode_failed():  # noqa: SLF001
+        if not skip_invalid:
+            msg = f"Invalid address '{addresses[index]}': {error}"
+            raise ValueError(msg) from error
+        invalid_indexes.add(index)
+
+    if not invalid_indexes:
+        return list(addresses_info)
+
+    return [addresses_info[index] for index in range(len(addresses_info)) if index not in invalid_indexes]
+
+
+def _decode_batches(  # noqa: PLR0913, PLR0917
+    addresses: Iterable[BlockchainAddress],
+    ss58_format: SS58Format,
+    batch_size: int,
+    workers: int,
+    executor: Executor | None,
+    skip_invalid: bool,
+) -> Iterator[list[BlockchainAddressInfo]]:
+    """
+    Decode addresses batch by batch, using a pool of processes if there is one.
+
+    Args:
+        addresses (Iterable[str]): Encoded addresses.
+        ss58_format (int): SS58 format of the addresses.
+        batch_size (int): Number of addresses decoded at once.
+        workers (int): Number of worker processes of the pool.
+        executor (Executor | None): Pool of processes used for all the batches, None to decode in the calling process.
+        skip_invalid (bool): Leave out invalid addresses instead of failing.
+
+    Yields:
+        list[BlockchainAddressInfo]: Info about the addresses of a batch.
+    """
+    if executor is None:
+        codec = KeylessCodec(ss58_format)
+        for batch in _batched(addresses, batch_size):
+            yield _decode_serial(batch, codec, skip_invalid)
+        return
+
+    for batch in _batched(addresses, batch_size):
+        yield _decode_parallel_batch(batch, ss58_format, workers, executor, skip_invalid)
+
+
+def _encode_batches(arguments: argparse.Namespace) -> Iterator[list[dict[str, Any]]]:
+    """
+    Encode addresses of a range of IDs batch by batch.
+
+    Args:
+        arguments (argparse.Namespace): Arguments of the `encode` command.
+
+    Yields:
+        list[dict]: Rows with the encoded addresses of a batch.
+    """
+    codec = KeylessCodec(arguments.ss58_format)
+
+    if arguments.address_type == "app-agent":
+        for batch in _batched(range(arguments.start, arguments.stop), arguments.batch_size):
+            addresses = codec.encode_app_agent_addresses(batch)
+            yield [
+                {"address": address, "address_type": "AppAgent", "app_agent_id": app_agent_id, "ta_id": None}
+                for address, app_agent_id in zip(addresses, batch, strict=True)
+            ]
+        return
+
+    transactional_addresses = codec.iter_transactional_addresses(
+        arguments.app_agent_id, arguments.start, arguments.stop
+    )
+    for batch in _batched(transactional_addresses, arguments.batch_size):
+        yield [
+            {
+                "address": address,
+                "address_type": "Transactional",
+                "app_agent_id": arguments.app_agent_id,
+                "ta_id": ta_id,
+            }
+            for ta_id, address in batch
+        ]
+
+
+def _info_to_row(address_info: BlockchainAddressInfo) -> dict[str, Any]:
+    """
+    Convert info about an address to an output row.
+
+    Args:
+        address_info (BlockchainAddressInfo): Info about the address.
+
+    Returns:
+        dict: Values of `DECODE_COLUMNS`.
+    """
+    return {
+        "address": address_info.address,
+        "account_id": address_info.account_id,
+        "address_type": address_info.address_type.name,
+        "app_agent_id": address_info.app_agent_id,
+        "ta_id": address_info.ta_id,
+        "address_name": address_info.address_name,
+    }
+
+
+def _write_rows(
+    row_batches: Iterable[list[dict[str, Any]]], columns: Sequence[str], output_format: str, output: TextIO
+) -> int:
+    """
+    Write batches of rows to the output, one write per batch.
+
+    Args:
+        row_batches (Iterable[list[dict]]): Batches of rows.
+        columns (Sequence[str]): Columns of the rows.
+        output_format (str): `jsonl` or `csv`.
+        output (TextIO): Output stream.
+
+    Returns:
+        int: Number of written rows.
+    """
+    count = 0
+    if output_format == "csv":
+        writer = csv.DictWriter(output, columns, lineterminator="\n")
+        writer.writeheader()
+        for rows in row_batches:
+            writer.writerows(rows)
+            count += len(rows)
+    else:
+        for rows in row_batches:
+            output.write("".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows))
+            count += len(rows)
+
+    output.flush()
+    return count
+
+
+def _decode_command(arguments: argparse.Namespace) -> int:
+    """Decode addresses of the input files, returns number of decoded addresses."""
+    executor: Executor | None = None
+    if arguments.workers > 1:
+        # Importing the pool imports `multiprocessing`, which is needed only with several workers
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        # One pool of processes is used for all the batches
+        executor = ProcessPoolExecutor(max_workers=arguments.workers)
+
+    with executor or nullcontext():
+        addresses = _read_addresses(arguments.files, arguments.input_format, arguments.column)
+        info_batches = _decode_batches(
+            addresses,
+            arguments.ss58_format,
+            arguments.batch_size,
+            arguments.workers,
+            executor,
+            arguments.skip_invalid,
+        )
+        row_batches = ([_info_to_row(address_info) for address_info in batch] for batch in info_batches)
+
+        return _write_rows(row_batches, DECODE_COLUMNS, arguments.output_format, sys.stdout)
+
+
+def _encode_command(arguments: argparse.Namespace) -> int:
+    """Encode addresses of a range of IDs, returns number of encoded addresses."""
+    return _write_rows(_encode_batches(arguments), ENCODE_COLUMNS, arguments.output_format, sys.stdout)
+
+
+def _positive_int(value: str) -> int:
+    """Parse a positive integer argument."""
+    number = int(value)
+    if number <= 0:
+        msg = f"{value} is not a positive integer"
+        raise argparse.ArgumentTypeError(msg)
+
+    return number
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the command-line arguments."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--ss58-format", type=int, default=SS58_FORMAT__TRAIT_ASSET_HUB, help="SS58 format of the addresses"
+    )
+    common.add_argument("--output-format", choices=["jsonl", "csv"], default="jsonl", help="format of the output")
+    common.add_argument("--batch-size", type=_positive_int, default=65536, help="number of addresses handled at once")
+    common.add_argument("-q", "--quiet", action="store_true", help="don't write the throughput summary")
+
+    parser = argparse.ArgumentParser(
+        prog="python -m traitkeyless", description="Bulk encoding and decoding of keyless addresses."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    decode = commands.add_parser("decode", parents=[common], help="decode addresses")
+    decode.add_argument("files", nargs="*", help="input files, the standard input by default or for -")
+    decode.add_argument(
+        "--input-format", choices=["lines", "csv", "jsonl"], default="lines", help="format of the input"
+    )
+    decode.add_argument("--column", default="address", help="column with the addresses in CSV and JSONL input")
+    decode.add_argument("--workers", type=_positive_int, default=1, help="number of worker processes")
+    decode.add_argument("--skip-invalid", action="store_true", help="leave out invalid addresses instead of failing")
+    decode.set_defaults(handler=_decode_command)
+
+    encode = commands.add_parser("encode", help="encode addresses of a range of IDs")
+    encode_types = encode.add_subparsers(dest="address_type", required=True)
+    app_agent = encode_types.add_parser("app-agent", parents=[common], help="AppAgent addresses")
+    transactional = encode_types.add_parser("transactional", parents=[common], help="Transactional addresses")
+    transactional.add_argument("app_agent_id", type=int, help="AppAgent ID of the addresses")
+    for type_parser in (app_agent, transactional):
+        type_parser.add_argument("start", type=int, help="first ID of the range")
+        type_parser.add_argument("stop", type=int, help="ID after the last one of the range")
+        type_parser.set_defaults(handler=_encode_command)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the command-line tool.
+
+    Args:
+        argv (Sequence[str] | None): Command-line arguments, `sys.argv` by default.
+
+    Returns:
+        int: Exit status.
+    """
+    arguments = _build_parser().parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = arguments.handler
+
+    started = time.perf_counter()
+    try:
+        count = handler(arguments)
+    except (ValueError, OSError) as error:
+        sys.stderr.write(f"error: {error}\n")
+        return 1
+    elapsed = time.perf_counter() - started
+
+    if not arguments.quiet:
+        action = "Decoded" if arguments.command == "decode" else "Encoded"
+        rate = count / elapsed if elapsed > 0 else 0.0
+        sys.stderr.write(f"{action} {count} addresses in {elapsed:.3f} s ({rate:,.0f} addresses/s)\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
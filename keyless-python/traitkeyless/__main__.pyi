@@ -0,0 +1,6 @@
+from collections.abc import Sequence
+
+DECODE_COLUMNS: tuple[str, ...]
+ENCODE_COLUMNS: tuple[str, ...]
+
+def main(argv: Sequence[str] | None = None) -> int: ...
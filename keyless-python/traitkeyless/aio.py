@@ -0,0 +1,159 @@
+"""aio.py
+
+This module provides decoding of streams of addresses for asyncio applications.
+
+Decoding is pure-Python work, so decoding thousands of addresses of a block inline blocks the event loop.
+`adecode_stream` collects addresses of an asynchronous stream into micro-batches and decodes them
+in a thread or process pool, while the event loop keeps serving other tasks.
+
+A batch is sent for decoding as soon as it's full, or as soon as the stream has no more addresses ready,
+so addresses that arrive slowly aren't held back waiting for a full batch.
+The number of batches being decoded is bounded, so a fast stream is read only as fast as it's decoded.
+
+Examples:
+    async for address_info in adecode_stream(addresses, executor=process_pool):
+        print(address_info.address_type)
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor
+from typing import Any, NamedTuple
+
+from .keyless import (
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    KeylessCodec,
+    SS58Format,
+)
+
+
+class _StreamEnd(NamedTuple):
+    """End of the stream in the queues, with the error that ended it, if any."""
+
+    error: Exception | None
+
+
+def _decode_batch(
+    addresses: list[BlockchainAddress], ss58_format: SS58Format
+) -> tuple[list[BlockchainAddressInfo], ValueError | None]:
+    """
+    Decode a batch of addresses one at a time, in a worker of the executor, up to the first invalid address.
+
+    Args:
+        addresses (list[str]): Encoded addresses.
+        ss58_format (int): SS58 format of the addresses.
+
+    Returns:
+        Tuple[list[BlockchainAddressInfo], ValueError | None]: Info about the addresses that precede the first invalid
+        address, in the order of the batch, and the error of the invalid address, None if all the addresses are valid.
+    """
+    codec = KeylessCodec(ss58_format)
+    addresses_info = []
+    for address in addresses:
+        try:
+            addresses_info.append(codec.decode_address(address))
+        except ValueError as error:
+            return addresses_info, error
+
+    return addresses_info, None
+
+
+async def _read_stream(addresses: AsyncIterable[BlockchainAddress], ready: asyncio.Queue[Any]) -> None:
+    """Put the addresses of the stream into the queue of ready addresses, followed by the end of the stream."""
+    try:
+        async for address in addresses:
+            await ready.put(address)
+    except Exception as error:
+        await ready.put(_StreamEnd(error))
+    else:
+        await ready.put(_StreamEnd(None))
+
+
+async def _collect_batches(
+    ready: asyncio.Queue[Any],
+    pending: asyncio.Queue[Any],
+    executor: Executor | None,
+    batch_size: int,
+    ss58_format: SS58Format,
+) -> None:
+    """Collect ready addresses into batches, and put futures of their decoding into the queue of pending batches."""
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await ready.get()
+        batch: list[BlockchainAddress] = []
+        # Take the addresses that are ready, up to the batch size
+        while not isinstance(item, _StreamEnd):
+            batch.append(item)
+            if len(batch) == batch_size or ready.empty():
+                break
+            item = ready.get_nowait()
+
+        if batch:
+            await pending.put(loop.run_in_executor(executor, _decode_batch, batch, ss58_format))
+        if isinstance(item, _StreamEnd):
+            await pending.put(item)
+            return
+
+
+async def adecode_stream(
+    addresses: AsyncIterable[BlockchainAddress],
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+    *,
+    executor: Executor | None = None,
+    batch_size: int = 1024,
+    max_pending_batches: int = 4,
+) -> AsyncIterator[BlockchainAddressInfo]:
+    """
+    Decode an asynchronous stream of encoded addresses in micro-batches, off the event loop.
+
+    Errors of decoding are raised the same way as by `decode_address`, after info about all the addresses
+    that precede the invalid one is yielded.
+
+    Args:
+        addresses (AsyncIterable[str]): Encoded addresses of any type.
+        executor (Executor | None): Thread or process pool to decode in, the default executor of the loop if None.
+        batch_size (int): Maximal number of addresses decoded at once.
+        max_pending_batches (int): Maximal number of batches being decoded, or decoded and not yet consumed.
+
+    Yields:
+        BlockchainAddressInfo: Info about the addresses, in the order of the stream.
+    """
+    if batch_size <= 0:
+        msg = "Batch size must be positive"
+        raise ValueError(msg)
+    if max_pending_batches <= 0:
+        msg = "Number of pending batches must be positive"
+        raise ValueError(msg)
+
+    # Validate the SS58 format before reading the stream
+    KeylessCodec(ss58_format)
+
+    # Addresses read from the stream, and futures of decoded batches, both bounded for backpressure
+    ready: asyncio.Queue[Any] = asyncio.Queue(maxsize=batch_size)
+    pending: asyncio.Queue[Any] = asyncio.Queue(maxsize=max_pending_batches)
+
+    reader = asyncio.create_task(_read_stream(addresses, ready))
+    collector = asyncio.create_task(_collect_batches(ready, pending, executor, batch_size, ss58_format))
+    try:
+        while True:
+            item = await pending.get()
+            if isinstance(item, _StreamEnd):
+                if item.error is not None:
+                    raise item.error
+                return
+
+            addresses_info, error = await item
+            for address_info in addresses_info:
+                yield address_info
+            if error is not None:
+                raise error
+    finally:
+        reader.cancel()
+        collector.cancel()
+        while not pending.empty():
+            item = pending.get_nowait()
+            if isinstance(item, asyncio.Future):
+                item.cancel()
+        await asyncio.gather(reader, collector, return_exceptions=True)
@@ -0,0 +1,13 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor
+
+from .keyless import BlockchainAddress, BlockchainAddressInfo, SS58Format
+
+def adecode_stream(
+    addresses: AsyncIterable[BlockchainAddress],
+    ss58_format: SS58Format = ...,
+    *,
+    executor: Executor | None = None,
+    batch_size: int = 1024,
+    max_pending_batches: int = 4,
+) -> AsyncIterator[BlockchainAddressInfo]: ...
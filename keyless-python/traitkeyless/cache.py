@@ -0,0 +1,147 @@
+"""cache.py
+
+This module provides an opt-in cache of decoded addresses.
+
+Hot addresses, e.g. AppAgent and Named treasury addresses, repeat constantly in blockchain traffic.
+`DecodeCache` keeps the results of `decode_address` for the most recently used addresses,
+so repeated addresses are decoded only once.
+
+Examples:
+    decode_cache = DecodeCache(maxsize=10_000)
+    address_info = decode_cache.decode_address(address)
+    print(decode_cache.cache_info())
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple
+
+from .keyless import (
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AddressName,
+    AppAgentId,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    SS58Format,
+    TransactionalAddressId,
+    VerifyLevel,
+    _app_agent_address_data,
+    _named_address_data,
+    _transactional_address_data,
+    _verification,
+    decode_address,
+)
+
+
+class DecodeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class DecodeCache:
+    """
+    Bounded cache of decoded addresses with LRU eviction, keyed on the address and the SS58 format.
+
+    Cached `BlockchainAddressInfo` objects are immutable, so they are shared between callers safely.
+    Addresses that fail to decode are not cached, and neither are addresses decoded with reduced verification,
+    so every cached result is fully verified and is returned for any `verify`.
+    """
+
+    def __init__(self: "DecodeCache", maxsize: int = 4096) -> None:
+        if maxsize <= 0:
+            msg = "Size of decode cache must be positive"
+            raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple[BlockchainAddress, SS58Format], BlockchainAddressInfo] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def decode_address(
+        self: "DecodeCache",
+        blockchain_address: BlockchainAddress,
+        ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+        *,
+        verify: VerifyLevel = "full",
+    ) -> BlockchainAddressInfo:
+        """
+        Decode an encoded blockchain address, see `decode_address`.
+
+        Reduced verification skips work only on a cache miss, and its result isn't cached.
+        """
+        verify_ss58, verify_keyless = _verification(verify)
+        key = (blockchain_address, ss58_format)
+
+        with self._lock:
+            address_info = self._cache.get(key)
+            if address_info is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return address_info
+
+        address_info = decode_address(blockchain_address, ss58_format, verify=verify)
+
+        with self._lock:
+            self._misses += 1
+            if not (verify_ss58 and verify_keyless):
+                return address_info
+
+            self._cache[key] = address_info
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+        return address_info
+
+    def decode_app_agent_address(
+        self: "DecodeCache",
+        encoded_address: BlockchainAddress,
+        ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+        *,
+        verify: VerifyLevel = "full",
+    ) -> AppAgentId:
+        """Decode an encoded AppAgent address, see `decode_app_agent_address`."""
+        return _app_agent_address_data(self.decode_address(encoded_address, ss58_format, verify=verify))
+
+    def decode_transactional_address(
+        self: "DecodeCache",
+        encoded_address: BlockchainAddress,
+        ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+        *,
+        verify: VerifyLevel = "full",
+    ) -> tuple[AppAgentId, TransactionalAddressId]:
+        """Decode an encoded Transactional address, see `decode_transactional_address`."""
+        return _transactional_address_data(self.decode_address(encoded_address, ss58_format, verify=verify))
+
+    def decode_named_address(
+        self: "DecodeCache",
+        encoded_address: BlockchainAddress,
+        ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+        *,
+        verify: VerifyLevel = "full",
+    ) -> tuple[AppAgentId, AddressName]:
+        """Decode an encoded Named address, see `decode_named_address`."""
+        return _named_address_data(self.decode_address(encoded_address, ss58_format, verify=verify))
+
+    def cache_info(self: "DecodeCache") -> DecodeCacheInfo:
+        """
+        Report statistics of the cache.
+
+        Returns:
+            DecodeCacheInfo: Hits, misses and evictions since the last clearing, maximal and current size.
+        """
+        with self._lock:
+            return DecodeCacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._cache))
+
+    def cache_clear(self: "DecodeCache") -> None:
+        """Remove all the cached addresses and reset statistics of the cache."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -0,0 +1,36 @@
+from typing import NamedTuple
+
+from .keyless import (
+    AddressName,
+    AppAgentId,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    SS58Format,
+    TransactionalAddressId,
+    VerifyLevel,
+)
+
+class DecodeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+class DecodeCache:
+    maxsize: int
+    def __init__(self, maxsize: int = 4096) -> None: ...
+    def decode_address(
+        self, blockchain_address: BlockchainAddress, ss58_format: SS58Format = ..., *, verify: VerifyLevel = "full"
+    ) -> BlockchainAddressInfo: ...
+    def decode_app_agent_address(
+        self, encoded_address: BlockchainAddress, ss58_format: SS58Format = ..., *, verify: VerifyLevel = "full"
+    ) -> AppAgentId: ...
+    def decode_transactional_address(
+        self, encoded_address: BlockchainAddress, ss58_format: SS58Format = ..., *, verify: VerifyLevel = "full"
+    ) -> tuple[AppAgentId, TransactionalAddressId]: ...
+    def decode_named_address(
+        self, encoded_address: BlockchainAddress, ss58_format: SS58Format = ..., *, verify: VerifyLevel = "full"
+    ) -> tuple[AppAgentId, AddressName]: ...
+    def cache_info(self) -> DecodeCacheInfo: ...
+    def cache_clear(self) -> None: ...
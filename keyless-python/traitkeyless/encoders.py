@@ -0,0 +1,535 @@
+"""encoders.py
+
+This module provides encoding of keyless addresses and of their account IDs.
+
+Encoding needs only hashing and Base58, so the encoders are kept apart from the decoders: importing them
+doesn't import `enum` or create `BlockchainAddressInfo` and the enums of the results
+of decoding. The encoders are also available from `traitkeyless.keyless`.
+
+Examples:
+    app_agent_address = encode_app_agent_address(123)
+    transactional_addresses = encode_transactional_addresses(123, range(1000))
+"""
+
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from time import perf_counter
+from typing import TypeAlias
+
+from .metrics import HASHING_STAGE, _metrics
+from .ss58 import (
+    b58encode,
+    blake2b,
+    blake2b_continue,
+    ss58_checksum_state,
+    ss58_encode_prepared,
+    ss58_format_to_bytes,
+)
+
+# Constants
+NAMED_ADDRESS_LENGTH = 10
+SS58_FORMAT__TRAIT_ASSET_HUB = 5335
+
+
+# Types of address identifiers
+BlockchainAddress: TypeAlias = str
+BlockchainAccountId: TypeAlias = str
+AppAgentId: TypeAlias = int
+TransactionalAddressId: TypeAlias = int
+AddressName: TypeAlias = str
+SS58Format: TypeAlias = int
+
+# Values of the type byte of keyless addresses, same as of `AddressType` members, and names of the members
+# by their values, so that encoding doesn't need the enum
+_APP_AGENT_TYPE = 1
+_TRANSACTIONAL_TYPE = 2
+_NAMED_TYPE = 3
+_ADDRESS_TYPE_NAMES = ("Regular", "AppAgent", "Transactional", "Named")
+
+# Size of the open part of keyless addresses, by the byte that encodes type of the address
+_open_part_sizes = {
+    _APP_AGENT_TYPE: 5,
+    _TRANSACTIONAL_TYPE: 9,
+    _NAMED_TYPE: 15,
+}
+
+# Characters allowed in names of Named addresses, same as `AddressName::ALLOWED_CHARS` of the Rust crate
+_ADDRESS_NAME_CHARS = b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-#"
+
+__allowed_chars = set(_ADDRESS_NAME_CHARS.decode())
+
+
+@lru_cache(maxsize=16)
+def _prepared_ss58_format(ss58_format: SS58Format) -> tuple[bytes, "blake2b"]:
+    """
+    Prepare the SS58 format bytes and checksum state of the given SS58 format, once per format.
+
+    Args:
+        ss58_format (int): SS58 format.
+
+    Returns:
+        Tuple[bytes, blake2b]: SS58 format bytes and checksum state, they must not be modified.
+    """
+    ss58_format_bytes = ss58_format_to_bytes(ss58_format)
+
+    return ss58_format_bytes, ss58_checksum_state(ss58_format_bytes)
+
+
+def _blake2_256(data: bytes) -> bytes:
+    """
+    Helper function to calculate a 32 bytes Blake2b hash for provided data, used as key for Substrate storage items
+
+    Parameters
+    ----------
+    data
+
+    Returns
+    -------
+
+    """
+    started = perf_counter() if _metrics.enabled else 0.0
+    digest = blake2b(data, digest_size=32).digest()
+    if started:
+        _metrics.add_time(HASHING_STAGE, perf_counter() - started)
+
+    return digest
+
+
+def _validate_address_name(name: str) -> None:
+    """
+    Validates that a name contains only allowed ASCII characters.
+
+    Args:
+        name (str): The name to validate.
+
+    Returns:
+        bool: True if the name is valid, otherwise False.
+    """
+    if len(name) != NAMED_ADDRESS_LENGTH:
+        msg = "Named keyless address must be of 10 chars length"
+        raise ValueError(msg)
+
+    if not all(c in __allowed_chars for c in name):
+        msg = "Address name contains invalid characters"
+        raise ValueError(msg)
+
+
+def _keyless_account_id(open_part: bytes) -> bytes:
+    """
+    Construct the account ID of a keyless address from its open part.
+
+    Args:
+        open_part (bytes): The open part of the address.
+
+    Returns:
+        bytes: 32 bytes account ID, the open part followed by the rest of its checksum.
+    """
+    # Calculate checksum using blake2_256
+    checksum = _blake2_256(open_part)
+
+    return open_part + checksum[len(open_part) :]
+
+
+def _encode_address(open_part: bytes, ss58_format: SS58Format) -> BlockchainAddress:
+    """
+    Encode an address using the given open part.
+
+    Args:
+        open_part (bytes): The open part of the address.
+        ss58_format (int): SS58 format of the address.
+
+    Returns:
+        str: Encoded address.
+    """
+    return _encode_address_prepared(open_part, *_prepared_ss58_format(ss58_format))
+
+
+def _encode_address_prepared(
+    open_part: bytes, ss58_format_bytes: bytes, checksum_state: "blake2b"
+) -> BlockchainAddress:
+    """
+    Encode an address using the given open part, and the prepared SS58 format bytes and checksum state.
+
+    Args:
+        open_part (bytes): The open part of the address.
+        ss58_format_bytes (bytes): SS58 format bytes of the address.
+        checksum_state (blake2b): SS58 checksum state of the format.
+
+    Returns:
+        str: Encoded address.
+    """
+    blockchain_address = ss58_encode_prepared(_keyless_account_id(open_part), ss58_format_bytes, checksum_state)
+
+    if _metrics.enabled:
+        _metrics.count("encoded", _ADDRESS_TYPE_NAMES[open_part[4]])
+
+    return blockchain_address
+
+
+def _app_agent_open_part(app_agent_id: AppAgentId) -> bytes:
+    """
+    Construct the open part of an AppAgent address.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+
+    Returns:
+        bytes: Open part of the address.
+    """
+    # Convert app_agent_id to little-endian bytes
+    app_agent_id_bytes = app_agent_id.to_bytes(4, byteorder="little")
+
+    # Construct open_part
+    return app_agent_id_bytes + bytes([_APP_AGENT_TYPE])
+
+
+def _transactional_open_part(app_agent_id: AppAgentId, ta_id: TransactionalAddressId) -> bytes:
+    """
+    Construct the open part of a Transactional address.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        ta_id (int): Transactional address ID.
+
+    Returns:
+        bytes: Open part of the address.
+    """
+    # Convert app_agent_id and ta_id to little-endian bytes
+    app_agent_id_bytes = app_agent_id.to_bytes(4, byteorder="little")
+    ta_id_bytes = ta_id.to_bytes(4, byteorder="little")
+
+    # Construct open_part
+    return app_agent_id_bytes + bytes([_TRANSACTIONAL_TYPE]) + ta_id_bytes
+
+
+def _named_open_part(app_agent_id: AppAgentId, name: AddressName) -> bytes:
+    """
+    Construct the open part of a Named address.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        name (str): Address name.
+
+    Returns:
+        bytes: Open part of the address.
+    """
+    _validate_address_name(name)
+
+    # Convert app_agent_id to little-endian bytes
+    app_agent_id_bytes = app_agent_id.to_bytes(4, byteorder="little")
+
+    # Construct open_part
+    return app_agent_id_bytes + bytes([_NAMED_TYPE]) + name.encode()
+
+
+def _encode_account_id(open_part: bytes) -> bytes:
+    """
+    Encode the account ID of a keyless address using the given open part, same as `_encode_address` without SS58.
+
+    Args:
+        open_part (bytes): The open part of the address.
+
+    Returns:
+        bytes: 32 bytes account ID.
+    """
+    account_id_bytes = _keyless_account_id(open_part)
+
+    if _metrics.enabled:
+        _metrics.count("encoded", _ADDRESS_TYPE_NAMES[open_part[4]])
+
+    return account_id_bytes
+
+
+def encode_app_agent_address(
+    app_agent_id: AppAgentId, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> BlockchainAddress:
+    """
+    Encode an AppAgent address.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+
+    Returns:
+        str: Encoded AppAgent address.
+    """
+    return _encode_address(_app_agent_open_part(app_agent_id), ss58_format)
+
+
+def encode_app_agent_addresses(
+    app_agent_ids: Iterable[AppAgentId], ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> list[BlockchainAddress]:
+    """
+    Encode many AppAgent addresses at once.
+
+    Args:
+        app_agent_ids (Iterable[int]): AppAgent IDs.
+
+    Returns:
+        list[str]: Encoded AppAgent addresses, in the order of the IDs.
+    """
+    ss58_format_bytes, checksum_state = _prepared_ss58_format(ss58_format)
+
+    return [
+        _encode_address_prepared(_app_agent_open_part(app_agent_id), ss58_format_bytes, checksum_state)
+        for app_agent_id in app_agent_ids
+    ]
+
+
+def encode_transactional_address(
+    app_agent_id: AppAgentId,
+    ta_id: TransactionalAddressId,
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+) -> BlockchainAddress:
+    """
+    Encode a Transactional address.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        ta_id (int): Transactional address ID.
+
+    Returns:
+        str: Encoded Transactional address.
+    """
+    return _encode_address(_transactional_open_part(app_agent_id, ta_id), ss58_format)
+
+
+def encode_transactional_addresses(
+    app_agent_id: AppAgentId,
+    ta_ids: Iterable[TransactionalAddressId],
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+) -> list[BlockchainAddress]:
+    """
+    Encode many Transactional addresses of one AppAgent at once.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        ta_ids (Iterable[int]): Transactional address IDs.
+
+    Returns:
+        list[str]: Encoded Transactional addresses, in the order of the IDs.
+    """
+    return _encode_transactional_addresses(app_agent_id, ta_ids, *_prepared_ss58_format(ss58_format))
+
+
+def iter_transactional_addresses(
+    app_agent_id: AppAgentId,
+    start: TransactionalAddressId,
+    stop: TransactionalAddressId,
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+) -> Iterator[tuple[TransactionalAddressId, BlockchainAddress]]:
+    """
+    Lazily encode the Transactional addresses of a range of IDs of one AppAgent.
+
+    The hash states of the part shared by all addresses are computed once and reused for every address,
+    and no list of addresses is built.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        start (int): First Transactional address ID of the range.
+        stop (int): Transactional address ID after the last one of the range.
+
+    Yields:
+        tuple[int, str]: Transactional address ID and encoded Transactional address.
+    """
+    # The SS58 format is validated by the call, not by the first iteration
+    return _iter_transactional_addresses(app_agent_id, start, stop, *_prepared_ss58_format(ss58_format))
+
+
+def _encode_transactional_addresses(
+    app_agent_id: AppAgentId,
+    ta_ids: Iterable[TransactionalAddressId],
+    ss58_format_bytes: bytes,
+    checksum_state: "blake2b",
+) -> list[BlockchainAddress]:
+    """
+    Encode many Transactional addresses of one AppAgent in the prepared SS58 format.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        ta_ids (Iterable[int]): Transactional address IDs.
+        ss58_format_bytes (bytes): SS58 format bytes of the addresses.
+        checksum_state (blake2b): SS58 checksum state of the format.
+
+    Returns:
+        list[str]: Encoded Transactional addresses, in the order of the IDs.
+    """
+    open_part_prefix = app_agent_id.to_bytes(4, byteorder="little") + bytes([_TRANSACTIONAL_TYPE])
+
+    return [
+        _encode_address_prepared(
+            open_part_prefix + ta_id.to_bytes(4, byteorder="little"), ss58_format_bytes, checksum_state
+        )
+        for ta_id in ta_ids
+    ]
+
+
+def _iter_transactional_addresses(
+    app_agent_id: AppAgentId,
+    start: TransactionalAddressId,
+    stop: TransactionalAddressId,
+    ss58_format_bytes: bytes,
+    checksum_state: "blake2b",
+) -> Iterator[tuple[TransactionalAddressId, BlockchainAddress]]:
+    """
+    Lazily encode the Transactional addresses of a range of IDs of one AppAgent in the prepared SS58 format.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        start (int): First Transactional address ID of the range.
+        stop (int): Transactional address ID after the last one of the range.
+        ss58_format_bytes (bytes): SS58 format bytes of the addresses.
+        checksum_state (blake2b): SS58 checksum state of the format.
+
+    Yields:
+        tuple[int, str]: Transactional address ID and encoded Transactional address.
+    """
+    open_part_prefix = app_agent_id.to_bytes(4, byteorder="little") + bytes([_TRANSACTIONAL_TYPE])
+    open_part_size = _open_part_sizes[_TRANSACTIONAL_TYPE]
+
+    # Hash states of the account ID and of the SS58 checksum, both fed with the part shared by all addresses
+    account_state = blake2b(open_part_prefix, digest_size=32)
+    checksum_state = checksum_state.copy()
+    checksum_state.update(open_part_prefix)
+
+    for ta_id in range(start, stop):
+        ta_id_bytes = ta_id.to_bytes(4, byteorder="little")
+        account_id_rest = ta_id_bytes + blake2b_continue(account_state, ta_id_bytes)[open_part_size:]
+        checksum = blake2b_continue(checksum_state, account_id_rest)[:2]
+
+        if _metrics.enabled:
+            _metrics.count("encoded", _ADDRESS_TYPE_NAMES[_TRANSACTIONAL_TYPE])
+
+        yield ta_id, b58encode(ss58_format_bytes + open_part_prefix + account_id_rest + checksum)
+
+
+def encode_named_address(
+    app_agent_id: AppAgentId, name: AddressName, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> BlockchainAddress:
+    """
+    Encode a Named address.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        name (str): Address name.
+
+    Returns:
+        str: Encoded Named address.
+    """
+    return _encode_address(_named_open_part(app_agent_id, name), ss58_format)
+
+
+def encode_named_addresses(
+    app_agent_id: AppAgentId, names: Iterable[AddressName], ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> list[BlockchainAddress]:
+    """
+    Encode many Named addresses of one AppAgent at once.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        names (Iterable[str]): Address names.
+
+    Returns:
+        list[str]: Encoded Named addresses, in the order of the names.
+    """
+    ss58_format_bytes, checksum_state = _prepared_ss58_format(ss58_format)
+
+    return [
+        _encode_address_prepared(_named_open_part(app_agent_id, name), ss58_format_bytes, checksum_state)
+        for name in names
+    ]
+
+
+def encode_app_agent_account_id(app_agent_id: AppAgentId) -> bytes:
+    """
+    Encode the raw account ID of an AppAgent address, without SS58 encoding.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+
+    Returns:
+        bytes: 32 bytes account ID of the AppAgent address.
+    """
+    return _encode_account_id(_app_agent_open_part(app_agent_id))
+
+
+def encode_app_agent_account_ids(app_agent_ids: Iterable[AppAgentId]) -> bytes:
+    """
+    Encode the raw account IDs of many AppAgent addresses at once.
+
+    Args:
+        app_agent_ids (Iterable[int]): AppAgent IDs.
+
+    Returns:
+        bytes: Account IDs of 32 bytes each, one after another in the order of the IDs.
+    """
+    return b"".join([_encode_account_id(_app_agent_open_part(app_agent_id)) for app_agent_id in app_agent_ids])
+
+
+def encode_transactional_account_id(app_agent_id: AppAgentId, ta_id: TransactionalAddressId) -> bytes:
+    """
+    Encode the raw account ID of a Transactional address, without SS58 encoding.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        ta_id (int): Transactional address ID.
+
+    Returns:
+        bytes: 32 bytes account ID of the Transactional address.
+    """
+    return _encode_account_id(_transactional_open_part(app_agent_id, ta_id))
+
+
+def encode_transactional_account_ids(app_agent_id: AppAgentId, ta_ids: Iterable[TransactionalAddressId]) -> bytes:
+    """
+    Encode the raw account IDs of many Transactional addresses of one AppAgent at once.
+
+    The hash state of the part shared by all account IDs is computed once and reused for every account ID.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        ta_ids (Iterable[int]): Transactional address IDs.
+
+    Returns:
+        bytes: Account IDs of 32 bytes each, one after another in the order of the IDs.
+    """
+    open_part_prefix = app_agent_id.to_bytes(4, byteorder="little") + bytes([_TRANSACTIONAL_TYPE])
+    open_part_size = _open_part_sizes[_TRANSACTIONAL_TYPE]
+    account_state = blake2b(open_part_prefix, digest_size=32)
+
+    account_ids = bytearray()
+    for ta_id in ta_ids:
+        ta_id_bytes = ta_id.to_bytes(4, byteorder="little")
+        account_ids += open_part_prefix + ta_id_bytes + blake2b_continue(account_state, ta_id_bytes)[open_part_size:]
+
+        if _metrics.enabled:
+            _metrics.count("encoded", _ADDRESS_TYPE_NAMES[_TRANSACTIONAL_TYPE])
+
+    return bytes(account_ids)
+
+
+def encode_named_account_id(app_agent_id: AppAgentId, name: AddressName) -> bytes:
+    """
+    Encode the raw account ID of a Named address, without SS58 encoding.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        name (str): Address name.
+
+    Returns:
+        bytes: 32 bytes account ID of the Named address.
+    """
+    return _encode_account_id(_named_open_part(app_agent_id, name))
+
+
+def encode_named_account_ids(app_agent_id: AppAgentId, names: Iterable[AddressName]) -> bytes:
+    """
+    Encode the raw account IDs of many Named addresses of one AppAgent at once.
+
+    Args:
+        app_agent_id (int): AppAgent ID.
+        names (Iterable[str]): Address names.
+
+    Returns:
+        bytes: Account IDs of 32 bytes each, one after another in the order of the names.
+    """
+    return b"".join([_encode_account_id(_named_open_part(app_agent_id, name)) for name in names])
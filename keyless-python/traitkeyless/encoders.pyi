@@ -0,0 +1,73 @@
+from collections.abc import Iterable, Iterator
+from hashlib import blake2b
+from typing import TypeAlias
+
+NAMED_ADDRESS_LENGTH: int
+SS58_FORMAT__TRAIT_ASSET_HUB: int
+BlockchainAddress: TypeAlias = str
+BlockchainAccountId: TypeAlias = str
+AppAgentId: TypeAlias = int
+TransactionalAddressId: TypeAlias = int
+AddressName: TypeAlias = str
+SS58Format: TypeAlias = int
+
+_APP_AGENT_TYPE: int
+_TRANSACTIONAL_TYPE: int
+_NAMED_TYPE: int
+_ADDRESS_TYPE_NAMES: tuple[str, ...]
+_open_part_sizes: dict[int, int]
+_ADDRESS_NAME_CHARS: bytes
+
+def _blake2_256(data: bytes) -> bytes: ...
+def _validate_address_name(name: str) -> None: ...
+def _app_agent_open_part(app_agent_id: AppAgentId) -> bytes: ...
+def _transactional_open_part(app_agent_id: AppAgentId, ta_id: TransactionalAddressId) -> bytes: ...
+def _named_open_part(app_agent_id: AppAgentId, name: AddressName) -> bytes: ...
+def _keyless_account_id(open_part: bytes) -> bytes: ...
+def _encode_account_id(open_part: bytes) -> bytes: ...
+def encode_app_agent_address(app_agent_id: AppAgentId, ss58_format: SS58Format = ...) -> BlockchainAddress: ...
+def encode_app_agent_addresses(
+    app_agent_ids: Iterable[AppAgentId], ss58_format: SS58Format = ...
+) -> list[BlockchainAddress]: ...
+def encode_transactional_address(
+    app_agent_id: AppAgentId, ta_id: TransactionalAddressId, ss58_format: SS58Format = ...
+) -> BlockchainAddress: ...
+def encode_transactional_addresses(
+    app_agent_id: AppAgentId, ta_ids: Iterable[TransactionalAddressId], ss58_format: SS58Format = ...
+) -> list[BlockchainAddress]: ...
+def iter_transactional_addresses(
+    app_agent_id: AppAgentId,
+    start: TransactionalAddressId,
+    stop: TransactionalAddressId,
+    ss58_format: SS58Format = ...,
+) -> Iterator[tuple[TransactionalAddressId, BlockchainAddress]]: ...
+def encode_named_address(
+    app_agent_id: AppAgentId, name: AddressName, ss58_format: SS58Format = ...
+) -> BlockchainAddress: ...
+def encode_named_addresses(
+    app_agent_id: AppAgentId, names: Iterable[AddressName], ss58_format: SS58Format = ...
+) -> list[BlockchainAddress]: ...
+def encode_app_agent_account_id(app_agent_id: AppAgentId) -> bytes: ...
+def encode_app_agent_account_ids(app_agent_ids: Iterable[AppAgentId]) -> bytes: ...
+def encode_transactional_account_id(app_agent_id: AppAgentId, ta_id: TransactionalAddressId) -> bytes: ...
+def encode_transactional_account_ids(app_agent_id: AppAgentId, ta_ids: Iterable[TransactionalAddressId]) -> bytes: ...
+def encode_named_account_id(app_agent_id: AppAgentId, name: AddressName) -> bytes: ...
+def encode_named_account_ids(app_agent_id: AppAgentId, names: Iterable[AddressName]) -> bytes: ...
+def _prepared_ss58_format(ss58_format: SS58Format) -> tuple[bytes, blake2b]: ...
+def _encode_address(open_part: bytes, ss58_format: SS58Format) -> BlockchainAddress: ...
+def _encode_address_prepared(
+    open_part: bytes, ss58_format_bytes: bytes, checksum_state: blake2b
+) -> BlockchainAddress: ...
+def _encode_transactional_addresses(
+    app_agent_id: AppAgentId,
+    ta_ids: Iterable[TransactionalAddressId],
+    ss58_format_bytes: bytes,
+    checksum_state: blake2b,
+) -> list[BlockchainAddress]: ...
+def _iter_transactional_addresses(
+    app_agent_id: AppAgentId,
+    start: TransactionalAddressId,
+    stop: TransactionalAddressId,
+    ss58_format_bytes: bytes,
+    checksum_state: blake2b,
+) -> Iterator[tuple[TransactionalAddressId, BlockchainAddress]]: ...
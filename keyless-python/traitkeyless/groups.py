@@ -0,0 +1,260 @@
+"""groups.py
+
+This module provides aggregation of streams of addresses by AppAgent, for activity reports.
+
+A report needs per-AppAgent counts of addresses by their type, the distinct Transactional address IDs
+and the usage of Named addresses, not info about every single address. `group_by_app_agent` decodes a stream
+of addresses without creating `BlockchainAddressInfo` objects, and adds every keyless address to the columns
+of its AppAgent: counters of AppAgent and Transactional addresses, an `array('I')` of distinct Transactional
+address IDs and counts of Named addresses by name. Memory is bounded by the distinct IDs and names,
+at most 8 bytes per distinct Transactional address ID, whatever the length of the stream.
+
+Groups of parts of a stream, e.g. aggregated by parallel workers, are merged into one with `merge`.
+
+Examples:
+    groups = group_by_app_agent(addresses)
+    for app_agent_id, group in groups.items():
+        print(app_agent_id, group.counts(), len(group.ta_ids), group.names)
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+
+from .keyless import (
+    NAMED_ADDRESS_LENGTH,
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AddressName,
+    AddressType,
+    AppAgentId,
+    BlockchainAddress,
+    SS58Format,
+    TransactionalAddressId,
+    _classify_account_id,
+    _prepared_ss58_format,
+    _try_decode_account_id,
+)
+from .metrics import _metrics
+
+# Number of Transactional address IDs added to a group before its duplicates are removed the first time
+_COMPACTION_SIZE = 1024
+
+
+class AppAgentGroup:
+    """
+    Columns of the addresses of one AppAgent.
+
+    Transactional address IDs are appended to an array as they come, and the array is deduplicated whenever
+    it doubles, so it holds at most about twice as many IDs as there are distinct ones.
+    """
+
+    __slots__ = ("_compacted_size", "_ta_ids", "app_agent_count", "names", "ta_count")
+
+    def __init__(self: "AppAgentGroup") -> None:
+        # Number of occurrences of the AppAgent address
+        self.app_agent_count = 0
+        # Number of occurrences of Transactional addresses
+        self.ta_count = 0
+        # Number of occurrences of Named addresses by name
+        self.names: dict[AddressName, int] = {}
+        self._ta_ids = array("I")
+        # Number of distinct IDs at the start of `_ta_ids` after the last deduplication
+        self._compacted_size = 0
+
+    def __repr__(self: "AppAgentGroup") -> str:
+        return (
+            f"AppAgentGroup(app_agent_count={self.app_agent_count}, ta_count={self.ta_count},"
+            f" named_count={self.named_count})"
+        )
+
+    def __eq__(self: "AppAgentGroup", other: object) -> bool:
+        if not isinstance(other, AppAgentGroup):
+            return NotImplemented
+
+        return (self.app_agent_count, self.ta_count, self.ta_ids, self.names) == (
+            other.app_agent_count,
+            other.ta_count,
+            other.ta_ids,
+            other.names,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self: "AppAgentGroup") -> tuple[int, int, dict[AddressName, int], array]:
+        return self.app_agent_count, self.ta_count, self.names, self.ta_ids
+
+    def __setstate__(self: "AppAgentGroup", state: tuple[int, int, dict[AddressName, int], array]) -> None:
+        self.app_agent_count, self.ta_count, self.names, self._ta_ids = state
+        self._compacted_size = len(self._ta_ids)
+
+    @property
+    def ta_ids(self: "AppAgentGroup") -> array:
+        """Distinct Transactional address IDs, sorted, as an `array('I')`."""
+        if len(self._ta_ids) != self._compacted_size:
+            self._compact()
+
+        return self._ta_ids
+
+    @property
+    def named_count(self: "AppAgentGroup") -> int:
+        """Number of occurrences of Named addresses."""
+        return sum(self.names.values())
+
+    def counts(self: "AppAgentGroup") -> dict[AddressType, int]:
+        """
+        Count the occurrences of the addresses of the AppAgent by their type.
+
+        Returns:
+            dict[AddressType, int]: Numbers of AppAgent, Transactional and Named addresses.
+        """
+        return {
+            AddressType.AppAgent: self.app_agent_count,
+            AddressType.Transactional: self.ta_count,
+            AddressType.Named: self.named_count,
+        }
+
+    def add_ta_id(self: "AppAgentGroup", ta_id: TransactionalAddressId) -> None:
+        """Add an occurrence of a Transactional address."""
+        self.ta_count += 1
+        self._ta_ids.append(ta_id)
+        if len(self._ta_ids) >= 2 * self._compacted_size + _COMPACTION_SIZE:
+            self._compact()
+
+    def add_name(self: "AppAgentGroup", name: AddressName) -> None:
+        """Add an occurrence of a Named address."""
+        self.names[name] = self.names.get(name, 0) + 1
+
+    def merge(self: "AppAgentGroup", other: "AppAgentGroup") -> None:
+        """
+        Add the addresses of another group of the same AppAgent to this group.
+
+        Args:
+            other (AppAgentGroup): Group to merge, it isn't modified.
+        """
+        self.app_agent_count += other.app_agent_count
+        self.ta_count += other.ta_count
+        for name, count in other.names.items():
+            self.names[name] = self.names.get(name, 0) + count
+        self._ta_ids.extend(other._ta_ids)  # noqa: SLF001
+        self._compact()
+
+    def _compact(self: "AppAgentGroup") -> None:
+        """Remove duplicates from the Transactional address IDs, and sort them."""
+        self._ta_ids = array("I", sorted(set(self._ta_ids)))
+        self._compacted_size = len(self._ta_ids)
+
+
+class AppAgentGroups:
+    """
+    Addresses of a stream grouped by AppAgent, bound to one SS58 format.
+
+    Regular addresses and invalid addresses aren't grouped, they are only counted. Named account IDs with names
+    that can't be encoded, e.g. that aren't valid UTF-8, are counted as Regular ones.
+    Groups can be pickled, e.g. to be sent from a worker process.
+    """
+
+    def __init__(self: "AppAgentGroups", ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB) -> None:
+        # Validate the SS58 format, its prepared state is cached, and isn't kept in the groups
+        _prepared_ss58_format(ss58_format)
+
+        self.ss58_format = ss58_format
+        self._groups: dict[AppAgentId, AppAgentGroup] = {}
+        # Number of Regular addresses, and of invalid addresses, i.e. those `try_decode_address` fails to decode
+        self.regular_count = 0
+        self.failed_count = 0
+
+    def __repr__(self: "AppAgentGroups") -> str:
+        return f"AppAgentGroups(ss58_format={self.ss58_format}, app_agents={len(self._groups)})"
+
+    def __len__(self: "AppAgentGroups") -> int:
+        return len(self._groups)
+
+    def __contains__(self: "AppAgentGroups", app_agent_id: object) -> bool:
+        return app_agent_id in self._groups
+
+    def __getitem__(self: "AppAgentGroups", app_agent_id: AppAgentId) -> AppAgentGroup:
+        return self._groups[app_agent_id]
+
+    def __iter__(self: "AppAgentGroups") -> Iterator[AppAgentId]:
+        return iter(self._groups)
+
+    def items(self: "AppAgentGroups") -> Iterator[tuple[AppAgentId, AppAgentGroup]]:
+        """Iterate over the AppAgent IDs and their groups, in the order the AppAgents were first seen."""
+        return iter(self._groups.items())
+
+    def _group(self: "AppAgentGroups", app_agent_id: AppAgentId) -> AppAgentGroup:
+        """Get the group of an AppAgent, creating it if the AppAgent wasn't seen yet."""
+        group = self._groups.get(app_agent_id)
+        if group is None:
+            group = self._groups[app_agent_id] = AppAgentGroup()
+
+        return group
+
+    def add(self: "AppAgentGroups", addresses: Iterable[BlockchainAddress]) -> None:
+        """
+        Decode a stream of addresses and add them to the groups of their AppAgents.
+
+        Args:
+            addresses (Iterable[str]): Encoded addresses of any type.
+        """
+        ss58_format_bytes, checksum_state = _prepared_ss58_format(self.ss58_format)
+        for address in addresses:
+            status, account_id_bytes = _try_decode_account_id(address, ss58_format_bytes, checksum_state)
+            if account_id_bytes is None:
+                self.failed_count += 1
+                if _metrics.enabled:
+                    _metrics.count("failed", status.name)
+                continue
+
+            address_type = _classify_account_id(account_id_bytes)
+            if _metrics.enabled:
+                _metrics.count("decoded", address_type.name)
+
+            if address_type is AddressType.Regular:
+                self.regular_count += 1
+                continue
+
+            group = self._group(int.from_bytes(account_id_bytes[:4], byteorder="little"))
+            if address_type is AddressType.AppAgent:
+                group.app_agent_count += 1
+            elif address_type is AddressType.Transactional:
+                group.add_ta_id(int.from_bytes(account_id_bytes[5:9], byteorder="little"))
+            else:
+                group.add_name(account_id_bytes[5 : 5 + NAMED_ADDRESS_LENGTH].decode())
+
+    def merge(self: "AppAgentGroups", other: "AppAgentGroups") -> None:
+        """
+        Add the groups of another part of the stream to these groups.
+
+        Args:
+            other (AppAgentGroups): Groups to merge, of the same SS58 format, they aren't modified.
+        """
+        if other.ss58_format != self.ss58_format:
+            msg = "Groups of different SS58 formats can't be merged"
+            raise ValueError(msg)
+
+        for app_agent_id, group in other.items():
+            self._group(app_agent_id).merge(group)
+        self.regular_count += other.regular_count
+        self.failed_count += other.failed_count
+
+
+def group_by_app_agent(
+    addresses: Iterable[BlockchainAddress], ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> AppAgentGroups:
+    """
+    Decode a stream of addresses and group them by AppAgent.
+
+    Only SS58 addresses of 32 bytes account IDs are decoded, other addresses are counted as invalid,
+    same as by `try_decode_address`.
+
+    Args:
+        addresses (Iterable[str]): Encoded addresses of any type.
+        ss58_format (int): SS58 format of the addresses.
+
+    Returns:
+        AppAgentGroups: Columns of the addresses of every AppAgent, and counts of the other addresses.
+    """
+    groups = AppAgentGroups(ss58_format)
+    groups.add(addresses)
+
+    return groups
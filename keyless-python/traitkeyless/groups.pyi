@@ -0,0 +1,44 @@
+from array import array
+from collections.abc import Iterable, Iterator
+
+from .keyless import (
+    AddressName,
+    AddressType,
+    AppAgentId,
+    BlockchainAddress,
+    SS58Format,
+    TransactionalAddressId,
+)
+
+class AppAgentGroup:
+    app_agent_count: int
+    ta_count: int
+    names: dict[AddressName, int]
+    _ta_ids: array[int]
+    def __init__(self) -> None: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __getstate__(self) -> tuple[int, int, dict[AddressName, int], array[int]]: ...
+    def __setstate__(self, state: tuple[int, int, dict[AddressName, int], array[int]]) -> None: ...
+    @property
+    def ta_ids(self) -> array[int]: ...
+    @property
+    def named_count(self) -> int: ...
+    def counts(self) -> dict[AddressType, int]: ...
+    def add_ta_id(self, ta_id: TransactionalAddressId) -> None: ...
+    def add_name(self, name: AddressName) -> None: ...
+    def merge(self, other: AppAgentGroup) -> None: ...
+
+class AppAgentGroups:
+    ss58_format: SS58Format
+    regular_count: int
+    failed_count: int
+    def __init__(self, ss58_format: SS58Format = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, app_agent_id: object) -> bool: ...
+    def __getitem__(self, app_agent_id: AppAgentId) -> AppAgentGroup: ...
+    def __iter__(self) -> Iterator[AppAgentId]: ...
+    def items(self) -> Iterator[tuple[AppAgentId, AppAgentGroup]]: ...
+    def add(self, addresses: Iterable[BlockchainAddress]) -> None: ...
+    def merge(self, other: AppAgentGroups) -> None: ...
+
+def group_by_app_agent(addresses: Iterable[BlockchainAddress], ss58_format: SS58Format = ...) -> AppAgentGroups: ...
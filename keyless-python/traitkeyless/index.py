@@ -0,0 +1,350 @@
+"""index.py
+
+This module provides a reverse lookup index of keyless addresses that belong to a known set of AppAgents.
+
+A block scanner has to find out whether an address belongs to one of its AppAgents, and which Transactional
+or Named address it is. `KeylessAddressIndex` holds the AppAgents, the ranges of Transactional address IDs
+and the names of Named addresses to look for, keyed on the AppAgent ID bytes of the account ID.
+Foreign addresses are rejected by the type byte and the AppAgent ID bytes right after Base58 decoding,
+before the SS58 checksum and the keyless checksum are computed.
+Ranges of Transactional address IDs are kept as ranges, so the index is compact even for millions of addresses.
+
+`filter_by_app_agents` applies the same prefilter to a stream of addresses, for consumers that take
+every address of a set of AppAgents, whatever its type and ID.
+
+Examples:
+    index = KeylessAddressIndex()
+    index.add_app_agent(123)
+    index.add_transactional_range(123, 0, 1_000_000)
+    index.add_named_addresses(123, ["hot-wallet"])
+
+    address_info = index.lookup(address)
+    if address_info is not None:
+        print(address_info.address_type, address_info.ta_id)
+
+    for address_info in filter_by_app_agents(addresses, {123, 456}):
+        print(address_info.app_agent_id, address_info.address_type)
+"""
+
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+
+from .keyless import (
+    NAMED_ADDRESS_LENGTH,
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AddressName,
+    AddressType,
+    AppAgentId,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    SS58Format,
+    TransactionalAddressId,
+    _decode_account_id,
+    _has_keyless_checksum,
+    _open_part_sizes,
+    _prepared_ss58_format,
+    _validate_address_name,
+)
+from .ss58 import b58decode_account, blake2b, blake2b_continue, ss58_encode_prepared
+
+_MAX_ID = 2**32
+
+
+class _AppAgentEntry:
+    """Addresses of one AppAgent in the index."""
+
+    __slots__ = ("app_agent", "names", "ta_starts", "ta_stops")
+
+    def __init__(self: "_AppAgentEntry") -> None:
+        self.app_agent = False
+        # Sorted, non-overlapping and non-adjacent ranges of Transactional address IDs
+        self.ta_starts: list[TransactionalAddressId] = []
+        self.ta_stops: list[TransactionalAddressId] = []
+        self.names: set[bytes] = set()
+
+    def add_ta_range(self: "_AppAgentEntry", start: TransactionalAddressId, stop: TransactionalAddressId) -> None:
+        """Add a range of Transactional address IDs, merging it with the ranges it overlaps or touches."""
+        # Ranges that end before the new one starts, and ranges that start after the new one ends, stay as they are
+        first = bisect_right(self.ta_stops, start - 1)
+        last = bisect_right(self.ta_starts, stop)
+        if first < last:
+            start = min(start, self.ta_starts[first])
+            stop = max(stop, self.ta_stops[last - 1])
+
+        self.ta_starts[first:last] = [start]
+        self.ta_stops[first:last] = [stop]
+
+    def has_ta_id(self: "_AppAgentEntry", ta_id: TransactionalAddressId) -> bool:
+        """Check that a Transactional address ID is in one of the ranges."""
+        position = bisect_right(self.ta_starts, ta_id) - 1
+
+        return position >= 0 and ta_id < self.ta_stops[position]
+
+    def has_account_id(self: "_AppAgentEntry", account_id_bytes: bytes) -> bool:
+        """Check that an account ID of the AppAgent is in the entry, by its type byte and its open part."""
+        type_byte = account_id_bytes[4]
+        if type_byte == AddressType.AppAgent.value:
+            return self.app_agent
+        if type_byte == AddressType.Transactional.value:
+            return self.has_ta_id(int.from_bytes(account_id_bytes[5:9], byteorder="little"))
+        if type_byte == AddressType.Named.value:
+            return account_id_bytes[5 : 5 + NAMED_ADDRESS_LENGTH] in self.names
+
+        return False
+
+    def count(self: "_AppAgentEntry") -> int:
+        """Count the addresses of the AppAgent in the index."""
+        ta_count = sum(stop - start for start, stop in zip(self.ta_starts, self.ta_stops, strict=True))
+
+        return self.app_agent + ta_count + len(self.names)
+
+    def memory_footprint(self: "_AppAgentEntry") -> int:
+        """Estimate the memory used by the entry, in bytes."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.ta_starts)
+            + sys.getsizeof(self.ta_stops)
+            + sum(map(sys.getsizeof, self.ta_starts))
+            + sum(map(sys.getsizeof, self.ta_stops))
+            + sys.getsizeof(self.names)
+            + sum(map(sys.getsizeof, self.names))
+        )
+
+
+class KeylessAddressIndex:
+    """
+    Reverse lookup index of keyless addresses of known AppAgents, bound to one SS58 format.
+
+    Addresses are added by AppAgent IDs, ranges of Transactional address IDs and names of Named addresses,
+    at any time. A lookup costs a Base58 decoding and a dictionary lookup for foreign addresses,
+    and the checksums are verified only for addresses found in the index.
+    """
+
+    def __init__(self: "KeylessAddressIndex", ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB) -> None:
+        self.ss58_format = ss58_format
+        self._ss58_format_bytes, self._checksum_state = _prepared_ss58_format(ss58_format)
+        self._entries: dict[bytes, _AppAgentEntry] = {}
+
+    def __repr__(self: "KeylessAddressIndex") -> str:
+        return f"KeylessAddressIndex(ss58_format={self.ss58_format}, app_agents={len(self._entries)})"
+
+    def __len__(self: "KeylessAddressIndex") -> int:
+        return sum(entry.count() for entry in self._entries.values())
+
+    def __contains__(self: "KeylessAddressIndex", blockchain_address: object) -> bool:
+        return isinstance(blockchain_address, str) and self.lookup(blockchain_address) is not None
+
+    def _entry(self: "KeylessAddressIndex", app_agent_id: AppAgentId) -> _AppAgentEntry:
+        """Get the entry of an AppAgent, creating it if the AppAgent isn't in the index yet."""
+        app_agent_id_bytes = app_agent_id.to_bytes(4, byteorder="little")
+
+        entry = self._entries.get(app_agent_id_bytes)
+        if entry is None:
+            entry = self._entries[app_agent_id_bytes] = _AppAgentEntry()
+
+        return entry
+
+    def add_app_agent(self: "KeylessAddressIndex", app_agent_id: AppAgentId) -> None:
+        """
+        Add the AppAgent address of an AppAgent.
+
+        Args:
+            app_agent_id (int): AppAgent ID.
+        """
+        self._entry(app_agent_id).app_agent = True
+
+    def add_transactional_range(
+        self: "KeylessAddressIndex",
+        app_agent_id: AppAgentId,
+        start: TransactionalAddressId,
+        stop: TransactionalAddressId,
+    ) -> None:
+        """
+        Add the Transactional addresses of a range of IDs of an AppAgent.
+
+        Args:
+            app_agent_id (int): AppAgent ID.
+            start (int): First Transactional address ID of the range.
+            stop (int): Transactional address ID after the last one of the range.
+        """
+        if not 0 <= start <= stop <= _MAX_ID:
+            msg = "Invalid range of Transactional address IDs"
+            raise ValueError(msg)
+
+        entry = self._entry(app_agent_id)
+        if start < stop:
+            entry.add_ta_range(start, stop)
+
+    def add_named_addresses(
+        self: "KeylessAddressIndex", app_agent_id: AppAgentId, names: Iterable[AddressName]
+    ) -> None:
+        """
+        Add Named addresses of an AppAgent.
+
+        Args:
+            app_agent_id (int): AppAgent ID.
+            names (Iterable[str]): Address names.
+        """
+        names = list(names)
+        for name in names:
+            _validate_address_name(name)
+
+        self._entry(app_agent_id).names.update(name.encode() for name in names)
+
+    def lookup(self: "KeylessAddressIndex", blockchain_address: BlockchainAddress) -> BlockchainAddressInfo | None:
+        """
+        Look up an encoded address in the index.
+
+        Args:
+            blockchain_address (str): Encoded address of any type.
+
+        Returns:
+            BlockchainAddressInfo | None: Info about the address if it's in the index, otherwise None,
+            also for invalid addresses.
+        """
+        address_decoded = b58decode_account(blockchain_address)
+        if address_decoded is None or address_decoded[: len(self._ss58_format_bytes)] != self._ss58_format_bytes:
+            return None
+
+        account_id_bytes = address_decoded[len(self._ss58_format_bytes) : -2]
+        if len(account_id_bytes) != 32:  # noqa: PLR2004
+            return None
+
+        address_info = self._lookup_account_id(account_id_bytes, blockchain_address)
+        if address_info is None:
+            return None
+
+        # Verify the SS58 checksum only for addresses found in the index
+        checksum = self._checksum_state.copy()
+        checksum.update(account_id_bytes)
+        if checksum.digest()[:2] != address_decoded[-2:]:
+            return None
+
+        return address_info
+
+    def lookup_account_id(self: "KeylessAddressIndex", account_id_bytes: bytes) -> BlockchainAddressInfo | None:
+        """
+        Look up a raw account ID in the index.
+
+        Args:
+            account_id_bytes (bytes): 32 bytes account ID.
+
+        Returns:
+            BlockchainAddressInfo | None: Info about the address if it's in the index, otherwise None.
+        """
+        if len(account_id_bytes) != 32:  # noqa: PLR2004
+            return None
+
+        return self._lookup_account_id(account_id_bytes, None)
+
+    def _lookup_account_id(
+        self: "KeylessAddressIndex", account_id_bytes: bytes, blockchain_address: BlockchainAddress | None
+    ) -> BlockchainAddressInfo | None:
+        """
+        Look up an account ID in the index, verifying its keyless checksum only if it passes the prefilter.
+
+        Args:
+            account_id_bytes (bytes): 32 bytes account ID.
+            blockchain_address (str | None): Encoded address, encoded from the account ID if None.
+
+        Returns:
+            BlockchainAddressInfo | None: Info about the address if it's in the index, otherwise None.
+        """
+        entry = self._entries.get(account_id_bytes[:4])
+        if entry is None or not entry.has_account_id(account_id_bytes) or not _has_keyless_checksum(account_id_bytes):
+            return None
+
+        address_type = AddressType(account_id_bytes[4])
+        ta_id = None
+        address_name = None
+        if address_type is AddressType.Transactional:
+            ta_id = int.from_bytes(account_id_bytes[5:9], byteorder="little")
+        elif address_type is AddressType.Named:
+            address_name = account_id_bytes[5 : 5 + NAMED_ADDRESS_LENGTH].decode()
+
+        if blockchain_address is None:
+            blockchain_address = ss58_encode_prepared(account_id_bytes, self._ss58_format_bytes, self._checksum_state)
+
+        return BlockchainAddressInfo.from_account_id_bytes(
+            address=blockchain_address,
+            account_id_bytes=account_id_bytes,
+            address_type=address_type,
+            app_agent_id=int.from_bytes(account_id_bytes[:4], byteorder="little"),
+            ta_id=ta_id,
+            address_name=address_name,
+            ss58_format=self.ss58_format,
+        )
+
+    def memory_footprint(self: "KeylessAddressIndex") -> int:
+        """
+        Estimate the memory used by the index.
+
+        Returns:
+            int: Size of the index in bytes, including its entries, AppAgent ID keys and names.
+        """
+        return (
+            sys.getsizeof(self._entries)
+            + sum(map(sys.getsizeof, self._entries))
+            + sum(entry.memory_footprint() for entry in self._entries.values())
+        )
+
+
+def filter_by_app_agents(
+    addresses: Iterable[BlockchainAddress],
+    app_agent_ids: Iterable[AppAgentId],
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+) -> Iterator[BlockchainAddressInfo]:
+    """
+    Lazily filter the keyless addresses of a set of AppAgents out of a stream of addresses.
+
+    An address is rejected by its type byte and AppAgent ID right after Base58 decoding, and the SS58 checksum
+    and the keyless checksum are verified only for the addresses of the AppAgents. Addresses of other AppAgents,
+    Regular addresses and invalid addresses are skipped, same as by `KeylessAddressIndex.lookup`. Named account IDs
+    with names that can't be encoded, e.g. that aren't valid UTF-8, are Regular ones, and are skipped as well.
+
+    Args:
+        addresses (Iterable[str]): Encoded addresses of any type.
+        app_agent_ids (Iterable[int]): AppAgent IDs to keep the addresses of.
+        ss58_format (int): SS58 format of the addresses.
+
+    Returns:
+        Iterator[BlockchainAddressInfo]: Info about the addresses of the AppAgents, in the order of the stream.
+    """
+    # Validate the SS58 format and the IDs before the stream is read
+    ss58_format_bytes, checksum_state = _prepared_ss58_format(ss58_format)
+    app_agent_ids_bytes = frozenset(app_agent_id.to_bytes(4, byteorder="little") for app_agent_id in app_agent_ids)
+
+    return _filter_by_app_agents(addresses, app_agent_ids_bytes, ss58_format, ss58_format_bytes, checksum_state)
+
+
+def _filter_by_app_agents(
+    addresses: Iterable[BlockchainAddress],
+    app_agent_ids_bytes: frozenset[bytes],
+    ss58_format: SS58Format,
+    ss58_format_bytes: bytes,
+    checksum_state: blake2b,
+) -> Iterator[BlockchainAddressInfo]:
+    """Filter the addresses of AppAgents given by their ID bytes, see `filter_by_app_agents`."""
+    ss58_format_length = len(ss58_format_bytes)
+    for address in addresses:
+        address_decoded = b58decode_account(address)
+        if (
+            address_decoded is None
+            or len(address_decoded) != ss58_format_length + 34
+            or address_decoded[:ss58_format_length] != ss58_format_bytes
+        ):
+            continue
+
+        # Prefilter by the type byte and the AppAgent ID bytes, before any checksum
+        account_id_bytes = address_decoded[ss58_format_length:-2]
+        if account_id_bytes[4] not in _open_part_sizes or account_id_bytes[:4] not in app_agent_ids_bytes:
+            continue
+
+        if blake2b_continue(checksum_state, account_id_bytes)[:2] != address_decoded[-2:]:
+            continue
+
+        # The keyless checksum is verified once, by decoding the account ID
+        address_info = _decode_account_id(address, account_id_bytes, ss58_format=ss58_format)
+        if address_info.address_type is not AddressType.Regular:
+            yield address_info
@@ -0,0 +1,28 @@
+from collections.abc import Iterable, Iterator
+
+from .keyless import (
+    AddressName,
+    AppAgentId,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    SS58Format,
+    TransactionalAddressId,
+)
+
+class KeylessAddressIndex:
+    ss58_format: SS58Format
+    def __init__(self, ss58_format: SS58Format = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, blockchain_address: object) -> bool: ...
+    def add_app_agent(self, app_agent_id: AppAgentId) -> None: ...
+    def add_transactional_range(
+        self, app_agent_id: AppAgentId, start: TransactionalAddressId, stop: TransactionalAddressId
+    ) -> None: ...
+    def add_named_addresses(self, app_agent_id: AppAgentId, names: Iterable[AddressName]) -> None: ...
+    def lookup(self, blockchain_address: BlockchainAddress) -> BlockchainAddressInfo | None: ...
+    def lookup_account_id(self, account_id_bytes: bytes) -> BlockchainAddressInfo | None: ...
+    def memory_footprint(self) -> int: ...
+
+def filter_by_app_agents(
+    addresses: Iterable[BlockchainAddress], app_agent_ids: Iterable[AppAgentId], ss58_format: SS58Format = ...
+) -> Iterator[BlockchainAddressInfo]: ...
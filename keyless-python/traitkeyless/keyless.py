@@ -16,25 +16,67 @@ Examples:
     assert decoded_app_agent_id == app_agent_id
 """
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
 from enum import Enum
-from hashlib import blake2b
-from typing import TypeAlias
-
-from .ss58 import ss58_decode, ss58_encode
-
-# Constants
-NAMED_ADDRESS_LENGTH = 10
-SS58_FORMAT__TRAIT_ASSET_HUB = 5335
-
-
-# Types of address identifiers
-BlockchainAddress: TypeAlias = str
-BlockchainAccountId: TypeAlias = str
-AppAgentId: TypeAlias = int
-TransactionalAddressId: TypeAlias = int
-AddressName: TypeAlias = str
-SS58Format: TypeAlias = int
+from typing import Any, Literal, TypeAlias
+
+# The encoders are defined apart from the decoders, so that importing them doesn't import `enum`,
+# and they are re-exported by this module, where they were defined before
+from .encoders import (  # noqa: F401
+    _ADDRESS_NAME_CHARS,
+    NAMED_ADDRESS_LENGTH,
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AddressName,
+    AppAgentId,
+    BlockchainAccountId,
+    BlockchainAddress,
+    SS58Format,
+    TransactionalAddressId,
+    _app_agent_open_part,
+    _blake2_256,
+    _encode_account_id,
+    _encode_address,
+    _encode_address_prepared,
+    _encode_transactional_addresses,
+    _iter_transactional_addresses,
+    _keyless_account_id,
+    _named_open_part,
+    _open_part_sizes,
+    _prepared_ss58_format,
+    _transactional_open_part,
+    _validate_address_name,
+    encode_app_agent_account_id,
+    encode_app_agent_account_ids,
+    encode_app_agent_address,
+    encode_app_agent_addresses,
+    encode_named_account_id,
+    encode_named_account_ids,
+    encode_named_address,
+    encode_named_addresses,
+    encode_transactional_account_id,
+    encode_transactional_account_ids,
+    encode_transactional_address,
+    encode_transactional_addresses,
+    iter_transactional_addresses,
+)
+from .metrics import _metrics
+from .ss58 import (
+    B58_ACCOUNT_ADDRESS_LENGTHS,
+    b58decode_account,
+    blake2b,
+    blake2b_continue,
+    ss58_checksum_state,
+    ss58_decode_bytes,
+    ss58_decode_prepared,
+    ss58_encode,  # noqa: F401
+    ss58_encode_prepared,
+    ss58_format_to_bytes,
+    ss58_parse,
+)
+
+# Checksums verified by decoding: `full` verifies both the SS58 checksum and the keyless checksum,
+# `ss58` only the SS58 checksum, and `none` neither, for addresses that were verified before
+VerifyLevel: TypeAlias = Literal["none", "ss58", "full"]
 
 
 class AddressType(Enum):
@@ -44,251 +86,492 @@ class AddressType(Enum):
     Named = 3
 
 
-@dataclass
+class DecodeStatus(Enum):
+    Ok = 0
+    InvalidLength = 1
+    InvalidCharacter = 2
+    InvalidFormat = 3
+    InvalidChecksum = 4
+
+
+class _DataclassAttribute:
+    """
+    Attribute of `BlockchainAddressInfo` read by the functions of `dataclasses`, e.g. `fields` or `replace`.
+
+    Importing `dataclasses` takes most of the time of importing the decoders, so `BlockchainAddressInfo`
+    isn't decorated with `dataclass`. Its dataclass attributes are created from a model dataclass of the same
+    fields when one of them is first read.
+    """
+
+    def __set_name__(self: "_DataclassAttribute", owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self: "_DataclassAttribute", instance: object, owner: type) -> Any:  # noqa: ANN401
+        from dataclasses import make_dataclass  # noqa: PLC0415
+
+        model = make_dataclass(
+            BlockchainAddressInfo.__name__, list(BlockchainAddressInfo.__annotations__.items()), frozen=True
+        )
+        BlockchainAddressInfo.__dataclass_fields__ = model.__dataclass_fields__  # type: ignore[attr-defined]
+        BlockchainAddressInfo.__dataclass_params__ = model.__dataclass_params__  # type: ignore[attr-defined]
+
+        return getattr(BlockchainAddressInfo, self.name)
+
+
 class BlockchainAddressInfo:
+    """
+    Info about a decoded blockchain address, a frozen dataclass.
+
+    The methods `dataclass` would generate are defined by the class, and only the decoded fields are compared
+    and shown, not the SS58 format.
+    """
+
+    __dataclass_fields__ = _DataclassAttribute()
+    __dataclass_params__ = _DataclassAttribute()
+    __match_args__ = ("address", "account_id", "address_type", "app_agent_id", "ta_id", "address_name", "ss58_format")
+
+    __slots__ = (
+        # Account ID of an address created by `from_account_id_bytes`, it isn't a field
+        "_account_id_bytes",
+        "account_id",
+        "address",
+        "address_name",
+        "address_type",
+        "app_agent_id",
+        "ss58_format",
+        "ta_id",
+    )
+
     address: BlockchainAddress
     account_id: BlockchainAccountId
     address_type: AddressType
     app_agent_id: AppAgentId | None
     ta_id: TransactionalAddressId | None
     address_name: AddressName | None
-
-    def __eq__(self: "BlockchainAddressInfo", value: object) -> bool:
-        if not isinstance(value, BlockchainAddressInfo):
-            return False
-
+    # SS58 format the address is encoded in, None if it's not known
+    ss58_format: SS58Format | None
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self: "BlockchainAddressInfo",
+        address: BlockchainAddress,
+        account_id: BlockchainAccountId,
+        address_type: AddressType,
+        app_agent_id: AppAgentId | None,
+        ta_id: TransactionalAddressId | None,
+        address_name: AddressName | None,
+        ss58_format: SS58Format | None = None,
+    ) -> None:
+        # The slot setters bypass the frozen `__setattr__`, which makes a generated `__init__` 3 times slower
+        _set_address(self, address)
+        _set_account_id(self, account_id)
+        _set_address_type(self, address_type)
+        _set_app_agent_id(self, app_agent_id)
+        _set_ta_id(self, ta_id)
+        _set_address_name(self, address_name)
+        _set_ss58_format(self, ss58_format)
+        _set_account_id_bytes(self, None)
+
+    def __getattr__(self: "BlockchainAddressInfo", name: str) -> Any:  # noqa: ANN401
+        # The hex account ID of an address created by `from_account_id_bytes` is computed when it's read first time
+        if name == "account_id" and self._account_id_bytes is not None:
+            account_id = "0x" + self._account_id_bytes.hex()
+            object.__setattr__(self, "account_id", account_id)
+            return account_id
+
+        # So is the encoded address of an address created from its account ID and SS58 format
+        if name == "address" and self.ss58_format is not None and self._account_id_bytes is not None:
+            address = ss58_encode_prepared(self._account_id_bytes, *_prepared_ss58_format(self.ss58_format))
+            object.__setattr__(self, "address", address)
+            return address
+
+        msg = f"'{type(self).__name__}' object has no attribute '{name}'"
+        raise AttributeError(msg)
+
+    def __setattr__(self: "BlockchainAddressInfo", name: str, value: object) -> None:
+        from dataclasses import FrozenInstanceError  # noqa: PLC0415
+
+        msg = f"cannot assign to field {name!r}"
+        raise FrozenInstanceError(msg)
+
+    def __delattr__(self: "BlockchainAddressInfo", name: str) -> None:
+        from dataclasses import FrozenInstanceError  # noqa: PLC0415
+
+        msg = f"cannot delete field {name!r}"
+        raise FrozenInstanceError(msg)
+
+    def __repr__(self: "BlockchainAddressInfo") -> str:
         return (
-            self.address == value.address
-            and self.account_id == value.account_id
-            and self.address_type == value.address_type
-            and self.app_agent_id == value.app_agent_id
-            and self.ta_id == value.ta_id
-            and self.address_name == value.address_name
+            f"{type(self).__qualname__}(address={self.address!r}, account_id={self.account_id!r},"
+            f" address_type={self.address_type!r}, app_agent_id={self.app_agent_id!r}, ta_id={self.ta_id!r},"
+            f" address_name={self.address_name!r})"
         )
 
-
-def _blake2_256(data: bytes) -> bytes:
+    def _decoded_fields(self: "BlockchainAddressInfo") -> tuple:
+        """Get the fields that are compared and hashed, the SS58 format isn't one of them."""
+        return self.address, self.account_id, self.address_type, self.app_agent_id, self.ta_id, self.address_name
+
+    def __eq__(self: "BlockchainAddressInfo", other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self._decoded_fields() == other._decoded_fields()  # type: ignore[attr-defined]
+
+    def __hash__(self: "BlockchainAddressInfo") -> int:
+        return hash(self._decoded_fields())
+
+    def __getstate__(self: "BlockchainAddressInfo") -> tuple:
+        return (*self._decoded_fields(), self.ss58_format, self._account_id_bytes)
+
+    def __setstate__(self: "BlockchainAddressInfo", state: tuple) -> None:
+        # Unpickling sets the slots the same way as `__init__`, bypassing the frozen `__setattr__`
+        (address, account_id, address_type, app_agent_id, ta_id, address_name, ss58_format, account_id_bytes) = state
+        _set_address(self, address)
+        _set_account_id(self, account_id)
+        _set_address_type(self, address_type)
+        _set_app_agent_id(self, app_agent_id)
+        _set_ta_id(self, ta_id)
+        _set_address_name(self, address_name)
+        _set_ss58_format(self, ss58_format)
+        _set_account_id_bytes(self, account_id_bytes)
+
+    @classmethod
+    def from_account_id_bytes(  # noqa: PLR0913
+        cls: type["BlockchainAddressInfo"],
+        *,
+        address: BlockchainAddress | None,
+        account_id_bytes: bytes,
+        address_type: AddressType,
+        app_agent_id: AppAgentId | None,
+        ta_id: TransactionalAddressId | None,
+        address_name: AddressName | None,
+        ss58_format: SS58Format | None = None,
+    ) -> "BlockchainAddressInfo":
+        """
+        Create an info about an address from the bytes of its account ID.
+
+        The hex representation of the account ID is computed only when `account_id` is read.
+
+        Args:
+            address (str | None): Encoded address, or None to encode it in `ss58_format` when it's read.
+            account_id_bytes (bytes): Account ID of the address.
+            address_type (AddressType): Type of the address.
+            app_agent_id (int | None): AppAgent ID of a keyless address.
+            ta_id (int | None): Transactional address ID of a Transactional address.
+            address_name (str | None): Address name of a Named address.
+            ss58_format (int | None): SS58 format of the address, it's required to encode the address if `address`
+                is None.
+
+        Returns:
+            an object with info about the address
+        """
+        info = cls.__new__(cls)
+        if address is not None:
+            _set_address(info, address)
+        _set_ss58_format(info, ss58_format)
+        _set_account_id_bytes(info, account_id_bytes)
+        _set_address_type(info, address_type)
+        _set_app_agent_id(info, app_agent_id)
+        _set_ta_id(info, ta_id)
+        _set_address_name(info, address_name)
+
+        return info
+
+
+# Setters of the slots of `BlockchainAddressInfo` that bypass its frozen `__setattr__`,
+# they are faster than `object.__setattr__`
+_set_address = BlockchainAddressInfo.address.__set__  # type: ignore[attr-defined]
+_set_account_id = BlockchainAddressInfo.account_id.__set__  # type: ignore[attr-defined]
+_set_account_id_bytes = BlockchainAddressInfo._account_id_bytes.__set__  # type: ignore[attr-defined]  # noqa: SLF001
+_set_address_type = BlockchainAddressInfo.address_type.__set__  # type: ignore[attr-defined]
+_set_app_agent_id = BlockchainAddressInfo.app_agent_id.__set__  # type: ignore[attr-defined]
+_set_ta_id = BlockchainAddressInfo.ta_id.__set__  # type: ignore[attr-defined]
+_set_address_name = BlockchainAddressInfo.address_name.__set__  # type: ignore[attr-defined]
+_set_ss58_format = BlockchainAddressInfo.ss58_format.__set__  # type: ignore[attr-defined]
+
+
+def _has_keyless_checksum(account_id_bytes: bytes) -> bool:
     """
-    Helper function to calculate a 32 bytes Blake2b hash for provided data, used as key for Substrate storage items
+    Check that an account ID is a keyless one, i.e. that it ends with the checksum of its open part.
 
-    Parameters
-    ----------
-    data
+    The checksum can be computed for any open part, so a Named account ID is a keyless one only if its name
+    is made of the allowed characters, as validated by `AddressName` of the Rust crate.
 
-    Returns
-    -------
+    Args:
+        account_id_bytes (bytes): Account ID of the address.
 
+    Returns:
+        bool: True if the account ID is a keyless one of the type encoded in its type byte, otherwise False.
     """
-    return blake2b(data, digest_size=32).digest()
+    open_part_size = _open_part_sizes.get(account_id_bytes[4])
+    if open_part_size is None:
+        return False
+
+    if account_id_bytes[4] == AddressType.Named.value and not _is_address_name(account_id_bytes[5:open_part_size]):
+        return False
+
+    open_part = account_id_bytes[:open_part_size]
+    checksum = account_id_bytes[open_part_size:]
+
+    return checksum == _blake2_256(open_part)[open_part_size:]
 
 
-__allowed_chars = set("0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-#")
+def _is_address_name(name_bytes: bytes) -> bool:
+    """Check that the name bytes of a Named account ID are made of the allowed characters only."""
+    return not name_bytes.translate(None, _ADDRESS_NAME_CHARS)
 
 
-def _validate_address_name(name: str) -> None:
+def decode_app_agent_address(
+    encoded_address: BlockchainAddress,
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+    *,
+    verify: VerifyLevel = "full",
+) -> AppAgentId:
     """
-    Validates that a name contains only allowed ASCII characters.
+    Decode an encoded AppAgent address.
 
     Args:
-        name (str): The name to validate.
+        encoded_address (str): Encoded AppAgent address.
+        verify (str): Checksums to verify, see `decode_address`.
 
     Returns:
-        bool: True if the name is valid, otherwise False.
+        int: Decoded AppAgent ID.
     """
-    if len(name) != NAMED_ADDRESS_LENGTH:
-        msg = "Named keyless address must be of 10 chars length"
-        raise ValueError(msg)
-
-    if not all(c in __allowed_chars for c in name):
-        msg = "Address name contains invalid characters"
-        raise ValueError(msg)
+    return _app_agent_address_data(decode_address(encoded_address, ss58_format, verify=verify))
 
 
-def _encode_address(open_part: bytes, ss58_format: SS58Format) -> BlockchainAddress:
+def decode_transactional_address(
+    encoded_address: BlockchainAddress,
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+    *,
+    verify: VerifyLevel = "full",
+) -> tuple[AppAgentId, TransactionalAddressId]:
     """
-    Encode an address using the given open part, open part size, and checksum size.
+    Decode an encoded Transactional address.
 
     Args:
-        open_part (bytes): The open part of the address.
-        open_part_size (int): Size of the open part.
-        checksum_size (int): Size of the checksum.
+        encoded_address (str): Encoded Transactional address.
+        verify (str): Checksums to verify, see `decode_address`.
 
     Returns:
-        str: Encoded address.
+        Tuple[int, int]: Decoded AppAgent ID and Transactional address ID.
     """
-    # Calculate checksum using blake2_256
-    checksum = _blake2_256(open_part)
-
-    # Construct address_encoded
-    address_encoded = open_part + checksum[len(open_part) :]
-
-    return ss58_encode(address_encoded, ss58_format)
+    return _transactional_address_data(decode_address(encoded_address, ss58_format, verify=verify))
 
 
-def encode_app_agent_address(
-    app_agent_id: AppAgentId, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
-) -> BlockchainAddress:
+def decode_named_address(
+    encoded_address: BlockchainAddress,
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+    *,
+    verify: VerifyLevel = "full",
+) -> tuple[AppAgentId, AddressName]:
     """
-    Encode an AppAgent address.
+    Decode an encoded Named address.
 
     Args:
-        app_agent_id (int): AppAgent ID.
+        encoded_address (str): Encoded Named address.
+        verify (str): Checksums to verify, see `decode_address`.
 
     Returns:
-        str: Encoded AppAgent address.
+        Tuple[int, str]: Decoded AppAgent ID and address name.
     """
-    # Convert app_agent_id to little-endian bytes
-    app_agent_id_bytes = app_agent_id.to_bytes(4, byteorder="little")
+    return _named_address_data(decode_address(encoded_address, ss58_format, verify=verify))
 
-    # Construct open_part
-    open_part = app_agent_id_bytes + bytes([AddressType.AppAgent.value])
 
-    return _encode_address(open_part, ss58_format)
+def decode_address(
+    blockchain_address: BlockchainAddress,
+    ss58_format: SS58Format | None = SS58_FORMAT__TRAIT_ASSET_HUB,
+    *,
+    verify: VerifyLevel = "full",
+) -> BlockchainAddressInfo:
+    """
+    Decode an encoded blockchain address.
 
+    With `ss58_format=None` the address may be of any SS58 format, which is detected while the address is decoded,
+    with one Base58 decoding and one SS58 checksum, and reported in `ss58_format` of the result.
 
-def decode_app_agent_address(
-    encoded_address: BlockchainAddress, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
-) -> AppAgentId:
-    """
-    Decode an encoded AppAgent address.
+    With `verify="ss58"` the keyless checksum isn't computed, and the type of an address is read from its type byte.
+    With `verify="none"` the SS58 checksum of an address of a 32 bytes account ID isn't verified either,
+    the SS58 format and the length are still checked. Both are meant only for addresses that were decoded
+    with full verification before, e.g. read back from own storage, since a Regular address may be
+    reported as a keyless one, and a corrupted address isn't detected.
 
     Args:
-        encoded_address (str): Encoded AppAgent address.
+        encoded_address (str): Encoded keyless address of any type.
+        ss58_format (int | None): SS58 format the address must be of, None to detect it.
+        verify (str): Checksums to verify, `full` (default), `ss58` or `none`.
 
     Returns:
-        int: Decoded AppAgent ID.
+        an object with info about the address
     """
-    decoding_result = decode_address(encoded_address, ss58_format)
+    verify_ss58, verify_keyless = _verification(verify)
 
-    if decoding_result.address_type is not AddressType.AppAgent:
-        msg = f"Provided address is not an AppAgent address but is instance of {decoding_result.address_type}."
-        raise ValueError(msg)
-    if decoding_result.app_agent_id is None:
-        msg = "Internal error in traitkeyless - app_agent_id of AppAgent address is None"
-        raise ValueError(msg)
+    # Decode the encoded address
+    try:
+        if ss58_format is None:
+            ss58_format, account_id_bytes = _parse_address(blockchain_address, verify_checksum=verify_ss58)
+        elif verify_ss58:
+            account_id_bytes = ss58_decode_bytes(blockchain_address, ss58_format)
+        else:
+            account_id_bytes = ss58_decode_prepared(
+                blockchain_address, ss58_format, *_prepared_ss58_format(ss58_format), verify_checksum=False
+            )
+    except ValueError as error:
+        if _metrics.enabled:
+            _metrics.count("failed", _failure_reason(error))
+        raise
 
-    return decoding_result.app_agent_id
+    address_info = _decode_account_id(
+        blockchain_address, account_id_bytes, verify_checksum=verify_keyless, ss58_format=ss58_format
+    )
+    if _metrics.enabled:
+        _metrics.count("decoded", address_info.address_type.name)
 
+    return address_info
 
-def encode_transactional_address(
-    app_agent_id: AppAgentId,
-    ta_id: TransactionalAddressId,
-    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
-) -> BlockchainAddress:
+
+def _parse_address(blockchain_address: BlockchainAddress, *, verify_checksum: bool) -> tuple[SS58Format, bytes]:
     """
-    Encode a Transactional address.
+    Decode an address of any SS58 format.
 
     Args:
-        app_agent_id (int): AppAgent ID.
-        ta_id (int): Transactional address ID.
+        blockchain_address (str): Encoded address.
+        verify_checksum (bool): Verify the SS58 checksum.
 
     Returns:
-        str: Encoded Transactional address.
+        Tuple[int, bytes]: SS58 format and account ID of the address.
     """
-    # Convert app_agent_id and ta_id to little-endian bytes
-    app_agent_id_bytes = app_agent_id.to_bytes(4, byteorder="little")
-    ta_id_bytes = ta_id.to_bytes(4, byteorder="little")
-
-    # Construct open_part
-    open_part = app_agent_id_bytes + bytes([AddressType.Transactional.value]) + ta_id_bytes
+    parsed = ss58_parse(blockchain_address, verify_checksum=verify_checksum)
+    if parsed.checksum_valid is False:
+        msg = "Invalid checksum"
+        raise ValueError(msg)
 
-    return _encode_address(open_part, ss58_format)
+    return parsed.ss58_format, parsed.payload
 
 
-def decode_transactional_address(
-    encoded_address: BlockchainAddress, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
-) -> tuple[AppAgentId, TransactionalAddressId]:
+def decode_account_id(
+    account_id_bytes: bytes | bytearray | memoryview, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> BlockchainAddressInfo:
     """
-    Decode an encoded Transactional address.
+    Decode a raw account ID of an address of any type, without SS58 decoding.
+
+    The encoded address is computed in the given SS58 format only when `address` is read.
 
     Args:
-        encoded_address (str): Encoded Transactional address.
+        account_id_bytes (bytes | bytearray | memoryview): 32 bytes account ID.
+        ss58_format (int): SS58 format of the encoded address.
 
     Returns:
-        Tuple[int, int]: Decoded AppAgent ID and Transactional address ID.
+        an object with info about the address
     """
-    decoding_result = decode_address(encoded_address, ss58_format)
-
-    if decoding_result.address_type is not AddressType.Transactional:
-        msg = f"Provided address is not a Transactional address but is instance of {decoding_result.address_type}."
-        raise ValueError(msg)
-    if decoding_result.app_agent_id is None:
-        msg = "Internal error in traitkeyless - app_agent_id of Transactional address is None"
-        raise ValueError(msg)
-    if decoding_result.ta_id is None:
-        msg = "Internal error in traitkeyless - ta_id of Transactional address is None"
+    if len(account_id_bytes) != 32:  # noqa: PLR2004
+        msg = "Invalid account ID length"
         raise ValueError(msg)
 
-    return decoding_result.app_agent_id, decoding_result.ta_id
+    # Validate the SS58 format before the address is read
+    _prepared_ss58_format(ss58_format)
 
+    address_info = _decode_account_id(None, bytes(account_id_bytes), ss58_format=ss58_format)
+    if _metrics.enabled:
+        _metrics.count("decoded", address_info.address_type.name)
 
-def encode_named_address(
-    app_agent_id: AppAgentId, name: AddressName, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
-) -> BlockchainAddress:
+    return address_info
+
+
+def decode_account_ids(
+    account_ids: bytes | bytearray | memoryview, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> list[BlockchainAddressInfo]:
     """
-    Encode a Named address.
+    Decode many raw account IDs at once, from a contiguous buffer, without SS58 decoding.
 
     Args:
-        app_agent_id (int): AppAgent ID.
-        name (str): Address name.
+        account_ids (bytes | bytearray | memoryview): Account IDs of 32 bytes each, one after another.
+        ss58_format (int): SS58 format of the encoded addresses.
 
     Returns:
-        str: Encoded Named address.
+        list[BlockchainAddressInfo]: Info about the addresses, in the order of the buffer.
     """
-    _validate_address_name(name)
+    account_ids = memoryview(account_ids).cast("B")
+    if len(account_ids) % 32:
+        msg = "Invalid length of account IDs buffer"
+        raise ValueError(msg)
 
-    # Convert app_agent_id to little-endian bytes
-    app_agent_id_bytes = app_agent_id.to_bytes(4, byteorder="little")
+    return [decode_account_id(account_ids[start : start + 32], ss58_format) for start in range(0, len(account_ids), 32)]
 
-    # Construct open_part
-    open_part = app_agent_id_bytes + bytes([AddressType.Named.value]) + name.encode()
 
-    return _encode_address(open_part, ss58_format)
+# Whether the SS58 checksum and the keyless checksum are verified, by the level of verification
+_verify_levels: dict[str, tuple[bool, bool]] = {
+    "none": (False, False),
+    "ss58": (True, False),
+    "full": (True, True),
+}
 
 
-def decode_named_address(
-    encoded_address: BlockchainAddress, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
-) -> tuple[AppAgentId, AddressName]:
+def _verification(verify: VerifyLevel) -> tuple[bool, bool]:
     """
-    Decode an encoded Named address.
+    Find out which checksums to verify at the given level of verification.
 
     Args:
-        encoded_address (str): Encoded Named address.
+        verify (str): Level of verification, `full`, `ss58` or `none`.
 
     Returns:
-        Tuple[int, str]: Decoded AppAgent ID and address name.
+        Tuple[bool, bool]: Whether to verify the SS58 checksum, and whether to verify the keyless checksum.
     """
-    decoding_result = decode_address(encoded_address, ss58_format)
-
-    if decoding_result.address_type is not AddressType.Named:
-        msg = f"Provided address is not a Named address but is instance of {decoding_result.address_type}."
-        raise ValueError(msg)
-    if decoding_result.app_agent_id is None:
-        msg = "Internal error in traitkeyless - app_agent_id of Named address is None"
-        raise ValueError(msg)
-    if decoding_result.address_name is None:
-        msg = "Internal error in traitkeyless - name of Named address is None"
+    verification = _verify_levels.get(verify)
+    if verification is None:
+        msg = "Invalid value for verify"
         raise ValueError(msg)
 
-    return decoding_result.app_agent_id, decoding_result.address_name
+    return verification
 
 
-def decode_address(
-    blockchain_address: BlockchainAddress, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+# Reasons of decoding failures by their errors, reported by metrics
+_error_statuses = {
+    "Empty address provided": DecodeStatus.InvalidLength,
+    "Invalid address length": DecodeStatus.InvalidLength,
+    "Invalid SS58 format": DecodeStatus.InvalidFormat,
+    "Invalid checksum": DecodeStatus.InvalidChecksum,
+}
+
+
+def _failure_reason(error: ValueError) -> str:
+    """
+    Find out the reason of a decoding failure, for metrics.
+
+    Args:
+        error (ValueError): Error raised by decoding.
+
+    Returns:
+        str: Name of the `DecodeStatus` of the error, or `Other`.
+    """
+    message = str(error)
+    status = _error_statuses.get(message)
+    if status is None and message.endswith("is a reserved SS58 format"):
+        status = DecodeStatus.InvalidFormat
+    if status is None and message.startswith(("Invalid character", "non-hexadecimal")):
+        status = DecodeStatus.InvalidCharacter
+
+    return status.name if status is not None else "Other"
+
+
+def _decode_account_id(
+    blockchain_address: BlockchainAddress | None,
+    account_id_bytes: bytes,
+    *,
+    verify_checksum: bool = True,
+    ss58_format: SS58Format | None = None,
 ) -> BlockchainAddressInfo:
     """
-    Decode an encoded blockchain address.
+    Decode the account ID of a blockchain address.
 
     Args:
-        encoded_address (str): Encoded keyless address of any type.
+        blockchain_address (str | None): Encoded address the account ID was decoded from, None if it's not known.
+        account_id_bytes (bytes): Account ID of the address.
+        verify_checksum (bool): Verify the keyless checksum, otherwise the type byte alone decides the type.
+        ss58_format (int | None): SS58 format of the address, to encode the address when it's read if it's not known.
 
     Returns:
         an object with info about the address
     """
-    # Decode the encoded address
-    account_id = ss58_decode(blockchain_address, ss58_format)
-    account_id_bytes = bytes.fromhex(account_id[2:])
-
     # Read the byte that encodes type of the address
     address_type_byte = account_id_bytes[4]
 
@@ -297,19 +580,19 @@ def decode_address(
         open_part_size = 5
         open_part = account_id_bytes[:open_part_size]
         checksum = account_id_bytes[open_part_size:]
-        checksum_calculated = _blake2_256(open_part)[open_part_size:]
-        if checksum == checksum_calculated:
+        if not verify_checksum or checksum == _blake2_256(open_part)[open_part_size:]:
             # Extract and decode app_agent_id
             app_agent_id_bytes = account_id_bytes[:4]
             app_agent_id = int.from_bytes(app_agent_id_bytes, byteorder="little")
 
-            return BlockchainAddressInfo(
+            return BlockchainAddressInfo.from_account_id_bytes(
                 address=blockchain_address,
-                account_id=account_id,
+                account_id_bytes=account_id_bytes,
                 address_type=AddressType.AppAgent,
                 app_agent_id=app_agent_id,
                 ta_id=None,
                 address_name=None,
+                ss58_format=ss58_format,
             )
 
     if address_type_byte == AddressType.Transactional.value:
@@ -317,50 +600,402 @@ def decode_address(
         open_part_size = 9
         open_part = account_id_bytes[:open_part_size]
         checksum = account_id_bytes[open_part_size:]
-        checksum_calculated = _blake2_256(open_part)[open_part_size:]
-        if checksum == checksum_calculated:
+        if not verify_checksum or checksum == _blake2_256(open_part)[open_part_size:]:
             # Extract and decode app_agent_id and ta_id
             app_agent_id_bytes = account_id_bytes[:4]
             ta_id_bytes = account_id_bytes[5:9]
             app_agent_id = int.from_bytes(app_agent_id_bytes, byteorder="little")
             ta_id = int.from_bytes(ta_id_bytes, byteorder="little")
 
-            return BlockchainAddressInfo(
+            return BlockchainAddressInfo.from_account_id_bytes(
                 address=blockchain_address,
-                account_id=account_id,
+                account_id_bytes=account_id_bytes,
                 address_type=AddressType.Transactional,
                 app_agent_id=app_agent_id,
                 ta_id=ta_id,
                 address_name=None,
+                ss58_format=ss58_format,
             )
 
-    if address_type_byte == AddressType.Named.value:
+    # Names of other characters can't be encoded, so such account IDs are Regular ones, even with the checksum
+    if address_type_byte == AddressType.Named.value and _is_address_name(account_id_bytes[5:15]):
         # Verify checksum
         open_part_size = 15
         open_part = account_id_bytes[:open_part_size]
         checksum = account_id_bytes[open_part_size:]
-        checksum_calculated = _blake2_256(open_part)[open_part_size:]
-        if checksum == checksum_calculated:
+        if not verify_checksum or checksum == _blake2_256(open_part)[open_part_size:]:
             # Extract and decode app_agent_id and address_name
             app_agent_id_bytes = account_id_bytes[:4]
             name_bytes = account_id_bytes[5:15]
             app_agent_id = int.from_bytes(app_agent_id_bytes, byteorder="little")
             address_name = name_bytes.decode()
 
-            return BlockchainAddressInfo(
+            return BlockchainAddressInfo.from_account_id_bytes(
                 address=blockchain_address,
-                account_id=account_id,
+                account_id_bytes=account_id_bytes,
                 address_type=AddressType.Named,
                 app_agent_id=app_agent_id,
                 ta_id=None,
                 address_name=address_name,
+                ss58_format=ss58_format,
             )
 
-    return BlockchainAddressInfo(
+    return BlockchainAddressInfo.from_account_id_bytes(
         address=blockchain_address,
-        account_id=account_id,
+        account_id_bytes=account_id_bytes,
         address_type=AddressType.Regular,
         app_agent_id=None,
         ta_id=None,
         address_name=None,
+        ss58_format=ss58_format,
     )
+
+
+def _try_decode_account_id(
+    blockchain_address: BlockchainAddress, ss58_format_bytes: bytes, checksum_state: "blake2b"
+) -> tuple[DecodeStatus, bytes | None]:
+    """
+    Decode SS58 of an address of a 32 bytes account ID without raising exceptions.
+
+    Args:
+        blockchain_address (str): Encoded address.
+        ss58_format_bytes (bytes): SS58 format bytes the address must start with.
+        checksum_state (blake2b): SS58 checksum state of the format.
+
+    Returns:
+        Tuple[DecodeStatus, bytes | None]: Status of decoding, and the account ID if the status is `Ok`.
+    """
+    if len(blockchain_address) not in B58_ACCOUNT_ADDRESS_LENGTHS:
+        return DecodeStatus.InvalidLength, None
+
+    address_decoded = b58decode_account(blockchain_address)
+    if address_decoded is None:
+        return DecodeStatus.InvalidCharacter, None
+
+    # Length of the SS58 format the address is encoded with is flagged in its first byte
+    address_format_length = 2 if address_decoded[0] & 0b0100_0000 else 1
+    if len(address_decoded) != address_format_length + 34:
+        return DecodeStatus.InvalidLength, None
+
+    ss58_format_length = len(ss58_format_bytes)
+    if address_decoded[:ss58_format_length] != ss58_format_bytes:
+        return DecodeStatus.InvalidFormat, None
+
+    account_id_bytes = address_decoded[ss58_format_length:-2]
+    if blake2b_continue(checksum_state, account_id_bytes)[:2] != address_decoded[-2:]:
+        return DecodeStatus.InvalidChecksum, None
+
+    return DecodeStatus.Ok, account_id_bytes
+
+
+def try_decode_address(
+    blockchain_address: BlockchainAddress, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> tuple[DecodeStatus, BlockchainAddressInfo | None]:
+    """
+    Decode an encoded blockchain address, reporting invalid addresses with a status instead of exceptions.
+
+    Only SS58 addresses of 32 bytes account IDs are accepted, hex account IDs are reported as invalid.
+
+    Args:
+        blockchain_address (str): Encoded address of any type.
+
+    Returns:
+        Tuple[DecodeStatus, BlockchainAddressInfo | None]: Status of decoding, and info about the address
+        if the status is `Ok`.
+    """
+    status, account_id_bytes = _try_decode_account_id(blockchain_address, *_prepared_ss58_format(ss58_format))
+
+    return status, _decode_try_result(blockchain_address, status, account_id_bytes, ss58_format)
+
+
+def classify_address(
+    blockchain_address: BlockchainAddress, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> AddressType | None:
+    """
+    Find out type of an encoded blockchain address, without raising exceptions for invalid addresses.
+
+    Regular addresses are recognized by the type byte, and keyless checksum is verified only for keyless candidates.
+
+    Args:
+        blockchain_address (str): Encoded address of any type.
+
+    Returns:
+        AddressType | None: Type of the address, or None if the address is invalid.
+    """
+    status, account_id_bytes = _try_decode_account_id(blockchain_address, *_prepared_ss58_format(ss58_format))
+
+    return _classify_try_result(status, account_id_bytes)
+
+
+def _decode_try_result(
+    blockchain_address: BlockchainAddress, status: DecodeStatus, account_id_bytes: bytes | None, ss58_format: SS58Format
+) -> BlockchainAddressInfo | None:
+    """
+    Decode the account ID of a result of `_try_decode_account_id`, counting the result in metrics.
+
+    Args:
+        blockchain_address (str): Encoded address the account ID was decoded from.
+        status (DecodeStatus): Status of decoding.
+        account_id_bytes (bytes | None): Account ID of the address, None if decoding failed.
+        ss58_format (int): SS58 format of the address.
+
+    Returns:
+        BlockchainAddressInfo | None: Info about the address, or None if decoding failed.
+    """
+    if account_id_bytes is None:
+        if _metrics.enabled:
+            _metrics.count("failed", status.name)
+        return None
+
+    address_info = _decode_account_id(blockchain_address, account_id_bytes, ss58_format=ss58_format)
+    if _metrics.enabled:
+        _metrics.count("decoded", address_info.address_type.name)
+
+    return address_info
+
+
+def _classify_try_result(status: DecodeStatus, account_id_bytes: bytes | None) -> AddressType | None:
+    """
+    Classify the account ID of a result of `_try_decode_account_id`, counting the result in metrics.
+
+    Args:
+        status (DecodeStatus): Status of decoding.
+        account_id_bytes (bytes | None): Account ID of the address, None if decoding failed.
+
+    Returns:
+        AddressType | None: Type of the address, or None if decoding failed.
+    """
+    if account_id_bytes is None:
+        if _metrics.enabled:
+            _metrics.count("failed", status.name)
+        return None
+
+    address_type = _classify_account_id(account_id_bytes)
+    if _metrics.enabled:
+        _metrics.count("decoded", address_type.name)
+
+    return address_type
+
+
+def _classify_account_id(account_id_bytes: bytes) -> AddressType:
+    """
+    Find out type of an address by its account ID.
+
+    Args:
+        account_id_bytes (bytes): Account ID of the address.
+
+    Returns:
+        AddressType: Type of the address.
+    """
+    if _has_keyless_checksum(account_id_bytes):
+        return AddressType(account_id_bytes[4])
+
+    return AddressType.Regular
+
+
+def _app_agent_address_data(decoding_result: BlockchainAddressInfo) -> AppAgentId:
+    """
+    Extract data of an AppAgent address from the result of its decoding.
+
+    Args:
+        decoding_result (BlockchainAddressInfo): Decoded AppAgent address.
+
+    Returns:
+        int: Decoded AppAgent ID.
+    """
+    if decoding_result.address_type is not AddressType.AppAgent:
+        msg = f"Provided address is not an AppAgent address but is instance of {decoding_result.address_type}."
+        raise ValueError(msg)
+    if decoding_result.app_agent_id is None:
+        msg = "Internal error in traitkeyless - app_agent_id of AppAgent address is None"
+        raise ValueError(msg)
+
+    return decoding_result.app_agent_id
+
+
+def _transactional_address_data(
+    decoding_result: BlockchainAddressInfo,
+) -> tuple[AppAgentId, TransactionalAddressId]:
+    """
+    Extract data of a Transactional address from the result of its decoding.
+
+    Args:
+        decoding_result (BlockchainAddressInfo): Decoded Transactional address.
+
+    Returns:
+        Tuple[int, int]: Decoded AppAgent ID and Transactional address ID.
+    """
+    if decoding_result.address_type is not AddressType.Transactional:
+        msg = f"Provided address is not a Transactional address but is instance of {decoding_result.address_type}."
+        raise ValueError(msg)
+    if decoding_result.app_agent_id is None:
+        msg = "Internal error in traitkeyless - app_agent_id of Transactional address is None"
+        raise ValueError(msg)
+    if decoding_result.ta_id is None:
+        msg = "Internal error in traitkeyless - ta_id of Transactional address is None"
+        raise ValueError(msg)
+
+    return decoding_result.app_agent_id, decoding_result.ta_id
+
+
+def _named_address_data(decoding_result: BlockchainAddressInfo) -> tuple[AppAgentId, AddressName]:
+    """
+    Extract data of a Named address from the result of its decoding.
+
+    Args:
+        decoding_result (BlockchainAddressInfo): Decoded Named address.
+
+    Returns:
+        Tuple[int, str]: Decoded AppAgent ID and address name.
+    """
+    if decoding_result.address_type is not AddressType.Named:
+        msg = f"Provided address is not a Named address but is instance of {decoding_result.address_type}."
+        raise ValueError(msg)
+    if decoding_result.app_agent_id is None:
+        msg = "Internal error in traitkeyless - app_agent_id of Named address is None"
+        raise ValueError(msg)
+    if decoding_result.address_name is None:
+        msg = "Internal error in traitkeyless - name of Named address is None"
+        raise ValueError(msg)
+
+    return decoding_result.app_agent_id, decoding_result.address_name
+
+
+class KeylessCodec:
+    """
+    Encoder and decoder of keyless addresses bound to one SS58 format.
+
+    The SS58 format prefix bytes and the checksum state are computed once, at construction,
+    so the codec is cheaper than the module level functions when it handles many addresses.
+
+    Examples:
+        codec = KeylessCodec(SS58_FORMAT__TRAIT_ASSET_HUB)
+        app_agent_address = codec.encode_app_agent_address(123)
+        assert codec.decode_app_agent_address(app_agent_address) == 123
+    """
+
+    def __init__(self: "KeylessCodec", ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB) -> None:
+        self._ss58_format = ss58_format
+        self._ss58_format_bytes = ss58_format_to_bytes(ss58_format)
+        self._checksum_state = ss58_checksum_state(self._ss58_format_bytes)
+
+    def __repr__(self: "KeylessCodec") -> str:
+        return f"KeylessCodec(ss58_format={self.ss58_format})"
+
+    @property
+    def ss58_format(self: "KeylessCodec") -> SS58Format:
+        """SS58 format the codec is bound to, read-only since its prefix bytes and checksum state are prepared once."""
+        return self._ss58_format
+
+    def _encode_address(self: "KeylessCodec", open_part: bytes) -> BlockchainAddress:
+        """
+        Encode an address using the given open part, same as the module level `_encode_address`.
+
+        Args:
+            open_part (bytes): The open part of the address.
+
+        Returns:
+            str: Encoded address.
+        """
+        return _encode_address_prepared(open_part, self._ss58_format_bytes, self._checksum_state)
+
+    def encode_app_agent_address(self: "KeylessCodec", app_agent_id: AppAgentId) -> BlockchainAddress:
+        """Encode an AppAgent address, see `encode_app_agent_address`."""
+        return self._encode_address(_app_agent_open_part(app_agent_id))
+
+    def encode_app_agent_addresses(
+        self: "KeylessCodec", app_agent_ids: Iterable[AppAgentId]
+    ) -> list[BlockchainAddress]:
+        """Encode many AppAgent addresses at once, see `encode_app_agent_addresses`."""
+        return [self._encode_address(_app_agent_open_part(app_agent_id)) for app_agent_id in app_agent_ids]
+
+    def decode_app_agent_address(
+        self: "KeylessCodec", encoded_address: BlockchainAddress, *, verify: VerifyLevel = "full"
+    ) -> AppAgentId:
+        """Decode an encoded AppAgent address, see `decode_app_agent_address`."""
+        return _app_agent_address_data(self.decode_address(encoded_address, verify=verify))
+
+    def encode_transactional_address(
+        self: "KeylessCodec", app_agent_id: AppAgentId, ta_id: TransactionalAddressId
+    ) -> BlockchainAddress:
+        """Encode a Transactional address, see `encode_transactional_address`."""
+        return self._encode_address(_transactional_open_part(app_agent_id, ta_id))
+
+    def encode_transactional_addresses(
+        self: "KeylessCodec", app_agent_id: AppAgentId, ta_ids: Iterable[TransactionalAddressId]
+    ) -> list[BlockchainAddress]:
+        """Encode many Transactional addresses of one AppAgent at once, see `encode_transactional_addresses`."""
+        return _encode_transactional_addresses(app_agent_id, ta_ids, self._ss58_format_bytes, self._checksum_state)
+
+    def iter_transactional_addresses(
+        self: "KeylessCodec", app_agent_id: AppAgentId, start: TransactionalAddressId, stop: TransactionalAddressId
+    ) -> Iterator[tuple[TransactionalAddressId, BlockchainAddress]]:
+        """Lazily encode the Transactional addresses of a range of IDs, see `iter_transactional_addresses`."""
+        return _iter_transactional_addresses(app_agent_id, start, stop, self._ss58_format_bytes, self._checksum_state)
+
+    def decode_transactional_address(
+        self: "KeylessCodec", encoded_address: BlockchainAddress, *, verify: VerifyLevel = "full"
+    ) -> tuple[AppAgentId, TransactionalAddressId]:
+        """Decode an encoded Transactional address, see `decode_transactional_address`."""
+        return _transactional_address_data(self.decode_address(encoded_address, verify=verify))
+
+    def encode_named_address(self: "KeylessCodec", app_agent_id: AppAgentId, name: AddressName) -> BlockchainAddress:
+        """Encode a Named address, see `encode_named_address`."""
+        return self._encode_address(_named_open_part(app_agent_id, name))
+
+    def encode_named_addresses(
+        self: "KeylessCodec", app_agent_id: AppAgentId, names: Iterable[AddressName]
+    ) -> list[BlockchainAddress]:
+        """Encode many Named addresses of one AppAgent at once, see `encode_named_addresses`."""
+        return [self._encode_address(_named_open_part(app_agent_id, name)) for name in names]
+
+    def decode_named_address(
+        self: "KeylessCodec", encoded_address: BlockchainAddress, *, verify: VerifyLevel = "full"
+    ) -> tuple[AppAgentId, AddressName]:
+        """Decode an encoded Named address, see `decode_named_address`."""
+        return _named_address_data(self.decode_address(encoded_address, verify=verify))
+
+    def decode_address(
+        self: "KeylessCodec", blockchain_address: BlockchainAddress, *, verify: VerifyLevel = "full"
+    ) -> BlockchainAddressInfo:
+        """Decode an encoded blockchain address, see `decode_address`."""
+        verify_ss58, verify_keyless = _verification(verify)
+
+        try:
+            account_id_bytes = ss58_decode_prepared(
+                blockchain_address,
+                self.ss58_format,
+                self._ss58_format_bytes,
+                self._checksum_state,
+                verify_checksum=verify_ss58,
+            )
+        except ValueError as error:
+            if _metrics.enabled:
+                _metrics.count("failed", _failure_reason(error))
+            raise
+
+        address_info = _decode_account_id(
+            blockchain_address, account_id_bytes, verify_checksum=verify_keyless, ss58_format=self.ss58_format
+        )
+        if _metrics.enabled:
+            _metrics.count("decoded", address_info.address_type.name)
+
+        return address_info
+
+    def try_decode_address(
+        self: "KeylessCodec", blockchain_address: BlockchainAddress
+    ) -> tuple[DecodeStatus, BlockchainAddressInfo | None]:
+        """Decode an encoded blockchain address without raising exceptions, see `try_decode_address`."""
+        status, account_id_bytes = _try_decode_account_id(
+            blockchain_address, self._ss58_format_bytes, self._checksum_state
+        )
+
+        return status, _decode_try_result(blockchain_address, status, account_id_bytes, self.ss58_format)
+
+    def classify_address(self: "KeylessCodec", blockchain_address: BlockchainAddress) -> AddressType | None:
+        """Find out type of an encoded blockchain address, see `classify_address`."""
+        status, account_id_bytes = _try_decode_account_id(
+            blockchain_address, self._ss58_format_bytes, self._checksum_state
+        )
+
+        return _classify_try_result(status, account_id_bytes)
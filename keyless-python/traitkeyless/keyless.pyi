@@ -1,26 +1,58 @@
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
-from typing import TypeAlias
+from hashlib import blake2b
+from typing import Literal, TypeAlias
 
+from .encoders import NAMED_ADDRESS_LENGTH as NAMED_ADDRESS_LENGTH
+from .encoders import SS58_FORMAT__TRAIT_ASSET_HUB as SS58_FORMAT__TRAIT_ASSET_HUB
+from .encoders import AddressName as AddressName
+from .encoders import AppAgentId as AppAgentId
+from .encoders import BlockchainAccountId as BlockchainAccountId
+from .encoders import BlockchainAddress as BlockchainAddress
+from .encoders import SS58Format as SS58Format
+from .encoders import TransactionalAddressId as TransactionalAddressId
+from .encoders import _app_agent_open_part as _app_agent_open_part
+from .encoders import _blake2_256 as _blake2_256
+from .encoders import _encode_account_id as _encode_account_id
+from .encoders import _keyless_account_id as _keyless_account_id
+from .encoders import _named_open_part as _named_open_part
+from .encoders import _open_part_sizes as _open_part_sizes
+from .encoders import _prepared_ss58_format as _prepared_ss58_format
+from .encoders import _transactional_open_part as _transactional_open_part
+from .encoders import _validate_address_name as _validate_address_name
+from .encoders import encode_app_agent_account_id as encode_app_agent_account_id
+from .encoders import encode_app_agent_account_ids as encode_app_agent_account_ids
+from .encoders import encode_app_agent_address as encode_app_agent_address
+from .encoders import encode_app_agent_addresses as encode_app_agent_addresses
+from .encoders import encode_named_account_id as encode_named_account_id
+from .encoders import encode_named_account_ids as encode_named_account_ids
+from .encoders import encode_named_address as encode_named_address
+from .encoders import encode_named_addresses as encode_named_addresses
+from .encoders import encode_transactional_account_id as encode_transactional_account_id
+from .encoders import encode_transactional_account_ids as encode_transactional_account_ids
+from .encoders import encode_transactional_address as encode_transactional_address
+from .encoders import encode_transactional_addresses as encode_transactional_addresses
+from .encoders import iter_transactional_addresses as iter_transactional_addresses
 from .ss58 import ss58_decode as ss58_decode
 from .ss58 import ss58_encode as ss58_encode
 
-NAMED_ADDRESS_LENGTH: int
-SS58_FORMAT__TRAIT_ASSET_HUB: int
-BlockchainAddress: TypeAlias = str
-BlockchainAccountId: TypeAlias = str
-AppAgentId: TypeAlias = int
-TransactionalAddressId: TypeAlias = int
-AddressName: TypeAlias = str
-SS58Format: TypeAlias = int
+VerifyLevel: TypeAlias = Literal["none", "ss58", "full"]
 
 class AddressType(Enum):
-    Regular: int
-    AppAgent: int
-    Transactional: int
-    Named: int
+    Regular = 0
+    AppAgent = 1
+    Transactional = 2
+    Named = 3
 
-@dataclass
+class DecodeStatus(Enum):
+    Ok = 0
+    InvalidLength = 1
+    InvalidCharacter = 2
+    InvalidFormat = 3
+    InvalidChecksum = 4
+
+@dataclass(frozen=True, slots=True)
 class BlockchainAddressInfo:
     address: BlockchainAddress
     account_id: BlockchainAccountId
@@ -28,6 +60,7 @@ class BlockchainAddressInfo:
     app_agent_id: AppAgentId | None
     ta_id: TransactionalAddressId | None
     address_name: AddressName | None
+    ss58_format: SS58Format | None
     def __init__(  # noqa: PLR0913
         self,  # noqa: ANN101
         address: BlockchainAddress,
@@ -36,20 +69,95 @@ class BlockchainAddressInfo:
         app_agent_id: AppAgentId | None,
         ta_id: TransactionalAddressId | None,
         address_name: AddressName | None,
+        ss58_format: SS58Format | None = None,
     ) -> None: ...
+    @classmethod
+    def from_account_id_bytes(
+        cls,
+        *,
+        address: BlockchainAddress | None,
+        account_id_bytes: bytes,
+        address_type: AddressType,
+        app_agent_id: AppAgentId | None,
+        ta_id: TransactionalAddressId | None,
+        address_name: AddressName | None,
+        ss58_format: SS58Format | None = None,
+    ) -> BlockchainAddressInfo: ...
 
-def encode_app_agent_address(app_agent_id: AppAgentId, ss58_format: SS58Format = ...) -> BlockchainAddress: ...
-def decode_app_agent_address(encoded_address: BlockchainAddress, ss58_format: SS58Format = ...) -> AppAgentId: ...
-def encode_transactional_address(
-    app_agent_id: AppAgentId, ta_id: TransactionalAddressId, ss58_format: SS58Format = ...
-) -> BlockchainAddress: ...
+def _has_keyless_checksum(account_id_bytes: bytes) -> bool: ...
+def _app_agent_address_data(decoding_result: BlockchainAddressInfo) -> AppAgentId: ...
+def _transactional_address_data(
+    decoding_result: BlockchainAddressInfo,
+) -> tuple[AppAgentId, TransactionalAddressId]: ...
+def _named_address_data(decoding_result: BlockchainAddressInfo) -> tuple[AppAgentId, AddressName]: ...
+def decode_app_agent_address(
+    encoded_address: BlockchainAddress, ss58_format: SS58Format = ..., *, verify: VerifyLevel = "full"
+) -> AppAgentId: ...
 def decode_transactional_address(
-    encoded_address: BlockchainAddress, ss58_format: SS58Format = ...
+    encoded_address: BlockchainAddress, ss58_format: SS58Format = ..., *, verify: VerifyLevel = "full"
 ) -> tuple[AppAgentId, TransactionalAddressId]: ...
-def encode_named_address(
-    app_agent_id: AppAgentId, name: AddressName, ss58_format: SS58Format = ...
-) -> BlockchainAddress: ...
 def decode_named_address(
-    encoded_address: BlockchainAddress, ss58_format: SS58Format = ...
+    encoded_address: BlockchainAddress, ss58_format: SS58Format = ..., *, verify: VerifyLevel = "full"
 ) -> tuple[AppAgentId, AddressName]: ...
-def decode_address(blockchain_address: BlockchainAddress, ss58_format: SS58Format = ...) -> BlockchainAddressInfo: ...
+def decode_address(
+    blockchain_address: BlockchainAddress, ss58_format: SS58Format | None = ..., *, verify: VerifyLevel = "full"
+) -> BlockchainAddressInfo: ...
+def _parse_address(blockchain_address: BlockchainAddress, *, verify_checksum: bool) -> tuple[SS58Format, bytes]: ...
+def decode_account_id(
+    account_id_bytes: bytes | bytearray | memoryview, ss58_format: SS58Format = ...
+) -> BlockchainAddressInfo: ...
+def decode_account_ids(
+    account_ids: bytes | bytearray | memoryview, ss58_format: SS58Format = ...
+) -> list[BlockchainAddressInfo]: ...
+def _decode_account_id(
+    blockchain_address: BlockchainAddress | None,
+    account_id_bytes: bytes,
+    *,
+    verify_checksum: bool = True,
+    ss58_format: SS58Format | None = None,
+) -> BlockchainAddressInfo: ...
+def _verification(verify: VerifyLevel) -> tuple[bool, bool]: ...
+def _try_decode_account_id(
+    blockchain_address: BlockchainAddress, ss58_format_bytes: bytes, checksum_state: blake2b
+) -> tuple[DecodeStatus, bytes | None]: ...
+def _classify_account_id(account_id_bytes: bytes) -> AddressType: ...
+def try_decode_address(
+    blockchain_address: BlockchainAddress, ss58_format: SS58Format = ...
+) -> tuple[DecodeStatus, BlockchainAddressInfo | None]: ...
+def classify_address(blockchain_address: BlockchainAddress, ss58_format: SS58Format = ...) -> AddressType | None: ...
+
+class KeylessCodec:
+    def __init__(self, ss58_format: SS58Format = ...) -> None: ...
+    @property
+    def ss58_format(self) -> SS58Format: ...
+    def encode_app_agent_address(self, app_agent_id: AppAgentId) -> BlockchainAddress: ...
+    def encode_app_agent_addresses(self, app_agent_ids: Iterable[AppAgentId]) -> list[BlockchainAddress]: ...
+    def decode_app_agent_address(
+        self, encoded_address: BlockchainAddress, *, verify: VerifyLevel = "full"
+    ) -> AppAgentId: ...
+    def encode_transactional_address(
+        self, app_agent_id: AppAgentId, ta_id: TransactionalAddressId
+    ) -> BlockchainAddress: ...
+    def encode_transactional_addresses(
+        self, app_agent_id: AppAgentId, ta_ids: Iterable[TransactionalAddressId]
+    ) -> list[BlockchainAddress]: ...
+    def iter_transactional_addresses(
+        self, app_agent_id: AppAgentId, start: TransactionalAddressId, stop: TransactionalAddressId
+    ) -> Iterator[tuple[TransactionalAddressId, BlockchainAddress]]: ...
+    def decode_transactional_address(
+        self, encoded_address: BlockchainAddress, *, verify: VerifyLevel = "full"
+    ) -> tuple[AppAgentId, TransactionalAddressId]: ...
+    def encode_named_address(self, app_agent_id: AppAgentId, name: AddressName) -> BlockchainAddress: ...
+    def encode_named_addresses(
+        self, app_agent_id: AppAgentId, names: Iterable[AddressName]
+    ) -> list[BlockchainAddress]: ...
+    def decode_named_address(
+        self, encoded_address: BlockchainAddress, *, verify: VerifyLevel = "full"
+    ) -> tuple[AppAgentId, AddressName]: ...
+    def decode_address(
+        self, blockchain_address: BlockchainAddress, *, verify: VerifyLevel = "full"
+    ) -> BlockchainAddressInfo: ...
+    def try_decode_address(
+        self, blockchain_address: BlockchainAddress
+    ) -> tuple[DecodeStatus, BlockchainAddressInfo | None]: ...
+    def classify_address(self, blockchain_address: BlockchainAddress) -> AddressType | None: ...
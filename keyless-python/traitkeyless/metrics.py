@@ -0,0 +1,146 @@
+"""metrics.py
+
+This module provides opt-in instrumentation of encoding and decoding of addresses.
+
+When enabled, the library counts encoded addresses and decoded addresses by their `AddressType`,
+failed decodings by their reason, i.e. the name of a `DecodeStatus`, and accumulates the time spent
+in Base58 encoding and decoding and in Blake2b hashing. Metrics are disabled by default, and then
+the instrumented code paths only check a flag.
+
+Metrics are kept per process. They are read with `stats()`, and can also be exported as they happen
+by a callback, called with the name of a metric, its label and its value.
+
+Examples:
+    from traitkeyless import metrics
+
+    metrics.enable()
+    ...
+    snapshot = metrics.stats(reset=True)
+    print(snapshot.decoded, snapshot.failed, snapshot.base58_seconds)
+"""
+
+# `threading.Lock` is the lock of `_thread`, which is imported without the rest of `threading`
+from _thread import allocate_lock
+from collections import Counter
+from collections.abc import Callable
+from typing import NamedTuple, TypeAlias
+
+# Callback of metrics: name of the metric (`encoded`, `decoded`, `failed` or `seconds`),
+# its label (type of an address, reason of a failure, or `base58` or `hashing` stage), and its value
+MetricsCallback: TypeAlias = Callable[[str, str, float], None]
+
+BASE58_STAGE = "base58"
+HASHING_STAGE = "hashing"
+
+
+class KeylessStats(NamedTuple):
+    encoded: dict[str, int]
+    decoded: dict[str, int]
+    failed: dict[str, int]
+    base58_seconds: float
+    hashing_seconds: float
+
+
+class _Metrics:
+    """Metrics of the process, `enabled` is checked by the instrumented code paths."""
+
+    __slots__ = ("callback", "counters", "enabled", "lock", "seconds")
+
+    def __init__(self: "_Metrics") -> None:
+        self.enabled = False
+        self.callback: MetricsCallback | None = None
+        self.lock = allocate_lock()
+        self.counters: dict[str, Counter[str]] = {"encoded": Counter(), "decoded": Counter(), "failed": Counter()}
+        self.seconds: dict[str, float] = {BASE58_STAGE: 0.0, HASHING_STAGE: 0.0}
+
+    def count(self: "_Metrics", name: str, label: str, number: int = 1) -> None:
+        """Count encoded, decoded or failed addresses."""
+        with self.lock:
+            self.counters[name][label] += number
+
+        callback = self.callback
+        if callback is not None:
+            callback(name, label, number)
+
+    def add_time(self: "_Metrics", stage: str, seconds: float) -> None:
+        """Add time spent in the Base58 or the hashing stage."""
+        with self.lock:
+            self.seconds[stage] += seconds
+
+        callback = self.callback
+        if callback is not None:
+            callback("seconds", stage, seconds)
+
+
+_metrics = _Metrics()
+
+
+def enable(callback: MetricsCallback | None = None) -> None:
+    """
+    Enable collecting of metrics.
+
+    Args:
+        callback (Callable[[str, str, float], None] | None): Callback to call for every recorded value,
+            it replaces the current callback if given.
+    """
+    if callback is not None:
+        _metrics.callback = callback
+    _metrics.enabled = True
+
+
+def disable() -> None:
+    """Disable collecting of metrics, the collected metrics are kept until `reset`."""
+    _metrics.enabled = False
+
+
+def is_enabled() -> bool:
+    """Check if metrics are being collected."""
+    return _metrics.enabled
+
+
+def set_callback(callback: MetricsCallback | None) -> None:
+    """
+    Set the callback to call for every recorded value, or remove it.
+
+    Args:
+        callback (Callable[[str, str, float], None] | None): Callback, None to remove the current one.
+    """
+    _metrics.callback = callback
+
+
+def stats(*, reset: bool = False) -> KeylessStats:
+    """
+    Take a snapshot of the collected metrics.
+
+    Args:
+        reset (bool): Reset the metrics in the same step, so no recorded value is lost between the calls.
+
+    Returns:
+        KeylessStats: Counts of encoded, decoded and failed addresses, and time spent in the stages.
+    """
+    with _metrics.lock:
+        snapshot = KeylessStats(
+            encoded=dict(_metrics.counters["encoded"]),
+            decoded=dict(_metrics.counters["decoded"]),
+            failed=dict(_metrics.counters["failed"]),
+            base58_seconds=_metrics.seconds[BASE58_STAGE],
+            hashing_seconds=_metrics.seconds[HASHING_STAGE],
+        )
+        if reset:
+            _reset()
+
+    return snapshot
+
+
+def reset() -> None:
+    """Reset the collected metrics."""
+    with _metrics.lock:
+        _reset()
+
+
+def _reset() -> None:
+    """Reset the collected metrics, the lock must be held."""
+    for counter in _metrics.counters.values():
+        counter.clear()
+    for stage in _metrics.seconds:
+        _metrics.seconds[stage] = 0.0
@@ -0,0 +1,34 @@
+from collections import Counter
+from collections.abc import Callable
+from threading import Lock
+from typing import NamedTuple, TypeAlias
+
+MetricsCallback: TypeAlias = Callable[[str, str, float], None]
+
+BASE58_STAGE: str
+HASHING_STAGE: str
+
+class KeylessStats(NamedTuple):
+    encoded: dict[str, int]
+    decoded: dict[str, int]
+    failed: dict[str, int]
+    base58_seconds: float
+    hashing_seconds: float
+
+class _Metrics:
+    enabled: bool
+    callback: MetricsCallback | None
+    lock: Lock
+    counters: dict[str, Counter[str]]
+    seconds: dict[str, float]
+    def count(self, name: str, label: str, number: int = 1) -> None: ...
+    def add_time(self, stage: str, seconds: float) -> None: ...
+
+_metrics: _Metrics
+
+def enable(callback: MetricsCallback | None = None) -> None: ...
+def disable() -> None: ...
+def is_enabled() -> bool: ...
+def set_callback(callback: MetricsCallback | None) -> None: ...
+def stats(*, reset: bool = False) -> KeylessStats: ...
+def reset() -> None: ...
@@ -0,0 +1,346 @@
+"""parallel.py
+
+This module provides decoding of large amounts of addresses across a pool of processes.
+
+Decoding of an address is pure-Python hashing and Base58, so it's bound to one core.
+`decode_addresses_parallel` splits the addresses into chunks decoded by worker processes.
+The addresses and the decoded results are passed through shared memory as packed buffers,
+so neither the input strings nor `BlockchainAddressInfo` objects are pickled between the processes.
+The results are kept as the compact buffers written by the workers, a status, a type and a 32 bytes account ID
+per address, and `BlockchainAddressInfo` objects are created only when they are read.
+
+Examples:
+    addresses_info = decode_addresses_parallel(addresses, workers=8)
+    for address_info in addresses_info:
+        print(address_info.address_type, address_info.app_agent_id)
+"""
+
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import accumulate
+from multiprocessing import shared_memory
+from typing import overload
+
+from .keyless import (
+    NAMED_ADDRESS_LENGTH,
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AddressType,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    DecodeStatus,
+    SS58Format,
+    _classify_account_id,
+    _prepared_ss58_format,
+    _try_decode_account_id,
+    decode_address,
+)
+from .metrics import _metrics
+
+# Size of a result: status, address type and account ID
+_RESULT_SIZE = 2 + 32
+
+
+class DecodedAddresses(Sequence[BlockchainAddressInfo]):
+    """
+    Addresses decoded by `decode_addresses_parallel`, in the order of the input.
+
+    Results are kept in one buffer: statuses of all the addresses, followed by their types
+    and by their account IDs. Info about an address is created when it's read, and isn't cached.
+    """
+
+    __slots__ = ("_addresses", "_fallback", "_results", "ss58_format", "statuses")
+
+    def __init__(
+        self: "DecodedAddresses",
+        addresses: Sequence[BlockchainAddress],
+        results: bytes,
+        ss58_format: SS58Format,
+    ) -> None:
+        self._addresses = addresses
+        self._results = results
+        self.ss58_format = ss58_format
+        # Value of `DecodeStatus` of every address, as decoded by the workers
+        self.statuses = results[: len(addresses)]
+        # Info about the addresses the workers failed to decode, decoded again in the calling process
+        self._fallback: dict[int, BlockchainAddressInfo] = {}
+
+    def __repr__(self: "DecodedAddresses") -> str:
+        return f"DecodedAddresses(ss58_format={self.ss58_format}, addresses={len(self)})"
+
+    def __len__(self: "DecodedAddresses") -> int:
+        return len(self._addresses)
+
+    @overload
+    def __getitem__(self: "DecodedAddresses", index: int) -> BlockchainAddressInfo: ...
+
+    @overload
+    def __getitem__(self: "DecodedAddresses", index: slice) -> list[BlockchainAddressInfo]: ...
+
+    def __getitem__(
+        self: "DecodedAddresses", index: int | slice
+    ) -> BlockchainAddressInfo | list[BlockchainAddressInfo]:
+        if isinstance(index, slice):
+            return [self._address_info(position) for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "Index out of range"
+            raise IndexError(msg)
+
+        return self._address_info(index)
+
+    def __iter__(self: "DecodedAddresses") -> Iterator[BlockchainAddressInfo]:
+        return map(self._address_info, range(len(self)))
+
+    def _address_info(self: "DecodedAddresses", index: int) -> BlockchainAddressInfo:
+        """
+        Create info about an address from its result.
+
+        Args:
+            index (int): Index of the address, in range.
+
+        Returns:
+            BlockchainAddressInfo: Info about the address.
+        """
+        if self.statuses[index] != DecodeStatus.Ok.value:
+            return self._fallback[index]
+
+        count = len(self._addresses)
+        address_type = AddressType(self._results[count + index])
+        offset = 2 * count + index * 32
+        account_id_bytes = self._results[offset : offset + 32]
+
+        return BlockchainAddressInfo.from_account_id_bytes(
+            address=self._addresses[index],
+            account_id_bytes=account_id_bytes,
+            address_type=address_type,
+            app_agent_id=(
+                int.from_bytes(account_id_bytes[:4], byteorder="little")
+                if address_type is not AddressType.Regular
+                else None
+            ),
+            ta_id=(
+                int.from_bytes(account_id_bytes[5:9], byteorder="little")
+                if address_type is AddressType.Transactional
+                else None
+            ),
+            address_name=(
+                account_id_bytes[5 : 5 + NAMED_ADDRESS_LENGTH].decode() if address_type is AddressType.Named else None
+            ),
+            ss58_format=self.ss58_format,
+        )
+
+    def _decode_failed(self: "DecodedAddresses") -> Iterator[tuple[int, ValueError]]:
+        """
+        Decode the addresses the workers failed to decode once more in the calling process.
+
+        The workers decode only SS58 addresses of the format, other inputs of `decode_address`,
+        e.g. hex account IDs, are decoded by `decode_address`, which also finds out the error of an invalid address.
+
+        Yields:
+            tuple[int, ValueError]: Index of an invalid address, and the error raised by `decode_address`.
+        """
+        for index, status in enumerate(self.statuses):
+            if status == DecodeStatus.Ok.value:
+                continue
+
+            try:
+                self._fallback[index] = decode_address(self._addresses[index], self.ss58_format)
+            except ValueError as error:
+                yield index, error
+
+
+def decode_addresses_parallel(
+    addresses: Sequence[BlockchainAddress],
+    ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    *,
+    executor: Executor | None = None,
+) -> DecodedAddresses:
+    """
+    Decode many encoded blockchain addresses using a pool of processes.
+
+    Addresses that can't be decoded by the workers are decoded again in the calling process,
+    so errors are raised the same way as by `decode_address`.
+
+    Args:
+        addresses (Sequence[str]): Encoded addresses of any type.
+        workers (int | None): Number of worker processes, the number of CPUs by default.
+        chunk_size (int | None): Number of addresses decoded by a worker at once,
+            by default the addresses are split evenly between the workers.
+        executor (Executor | None): Pool of processes to decode the addresses in, reused e.g. for many batches
+            of addresses, by default a pool of `workers` processes is started for the call.
+
+    Returns:
+        DecodedAddresses: Info about the addresses, in the order of the input.
+    """
+    addresses_info = _decode_parallel(addresses, ss58_format, workers, chunk_size, executor)
+    for _, error in addresses_info._decode_failed():  # noqa: SLF001
+        raise error
+
+    return addresses_info
+
+
+def _decode_parallel(
+    addresses: Sequence[BlockchainAddress],
+    ss58_format: SS58Format,
+    workers: int | None,
+    chunk_size: int | None,
+    executor: Executor | None,
+) -> DecodedAddresses:
+    """
+    Decode many encoded blockchain addresses using a pool of processes, without decoding the failed ones again.
+
+    Args:
+        addresses (Sequence[str]): Encoded addresses of any type.
+        ss58_format (int): SS58 format of the addresses.
+        workers (int | None): Number of worker processes, the number of CPUs by default.
+        chunk_size (int | None): Number of addresses decoded by a worker at once.
+        executor (Executor | None): Pool of processes to decode the addresses in.
+
+    Returns:
+        DecodedAddresses: Results of the workers, addresses with a status other than `Ok` can't be read
+        until `_decode_failed` is exhausted.
+    """
+    if chunk_size is not None and chunk_size <= 0:
+        msg = "Chunk size must be positive"
+        raise ValueError(msg)
+
+    # Validate the SS58 format before starting the workers
+    _prepared_ss58_format(ss58_format)
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(-(-len(addresses) // workers), 1)
+    if executor is None and (workers == 1 or len(addresses) <= chunk_size):
+        results = bytearray(_RESULT_SIZE * len(addresses))
+        _count_decoded(_decode_records(addresses, memoryview(results), len(addresses), 0, ss58_format))
+        return DecodedAddresses(addresses, bytes(results), ss58_format)
+
+    encoded_addresses = [address.encode() for address in addresses]
+    lengths = array("I", map(len, encoded_addresses))
+    input_data = lengths.tobytes() + b"".join(encoded_addresses)
+    del encoded_addresses
+
+    # Shared memory blocks can't be empty
+    input_memory = shared_memory.SharedMemory(create=True, size=max(len(input_data), 1))
+    output_memory = shared_memory.SharedMemory(create=True, size=max(_RESULT_SIZE * len(addresses), 1))
+    try:
+        input_memory.buf[: len(input_data)] = input_data
+        del input_data
+
+        with nullcontext(executor) if executor is not None else ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            address_offset = lengths.itemsize * len(lengths)
+            for start in range(0, len(addresses), chunk_size):
+                stop = min(start + chunk_size, len(addresses))
+                futures.append(
+                    pool.submit(
+                        _decode_chunk,
+                        input_memory.name,
+                        output_memory.name,
+                        len(addresses),
+                        start,
+                        stop,
+                        address_offset,
+                        ss58_format,
+                    )
+                )
+                address_offset += sum(lengths[start:stop])
+            for future in futures:
+                _count_decoded(future.result())
+
+        return DecodedAddresses(addresses, bytes(output_memory.buf[: _RESULT_SIZE * len(addresses)]), ss58_format)
+    finally:
+        input_memory.close()
+        input_memory.unlink()
+        output_memory.close()
+        output_memory.unlink()
+
+
+def _count_decoded(counts: dict[str, int]) -> None:
+    """Count the addresses decoded by a worker in the metrics of the calling process."""
+    if _metrics.enabled:
+        for address_type_name, number in counts.items():
+            _metrics.count("decoded", address_type_name, number)
+
+
+def _decode_chunk(  # noqa: PLR0913, PLR0917
+    input_name: str,
+    output_name: str,
+    count: int,
+    start: int,
+    stop: int,
+    address_offset: int,
+    ss58_format: SS58Format,
+) -> dict[str, int]:
+    """
+    Decode a chunk of the addresses packed in shared memory, and write the results into shared memory.
+
+    Args:
+        input_name (str): Name of the shared memory block with the lengths of the addresses and the addresses.
+        output_name (str): Name of the shared memory block for the results.
+        count (int): Number of all the addresses.
+        start (int): Index of the first address of the chunk.
+        stop (int): Index after the last address of the chunk.
+        address_offset (int): Offset of the first address of the chunk in the input block.
+        ss58_format (int): SS58 format of the addresses.
+
+    Returns:
+        dict[str, int]: Numbers of the decoded addresses by the name of their type, for metrics.
+    """
+    # Workers share the resource tracker of the calling process, which unlinks the memory blocks
+    input_memory = shared_memory.SharedMemory(name=input_name)
+    output_memory = shared_memory.SharedMemory(name=output_name)
+    try:
+        lengths = array("I", bytes(input_memory.buf[4 * start : 4 * stop]))
+        chunk = bytes(input_memory.buf[address_offset : address_offset + sum(lengths)])
+        addresses = (
+            chunk[end - length : end].decode() for length, end in zip(lengths, accumulate(lengths), strict=True)
+        )
+
+        return _decode_records(addresses, output_memory.buf, count, start, ss58_format)
+    finally:
+        input_memory.close()
+        output_memory.close()
+
+
+def _decode_records(
+    addresses: Iterable[BlockchainAddress],
+    results: memoryview,
+    count: int,
+    start: int,
+    ss58_format: SS58Format,
+) -> dict[str, int]:
+    """
+    Decode addresses, and write their results into the buffer of the results of all the addresses.
+
+    Args:
+        addresses (Iterable[str]): Encoded addresses, starting at `start`.
+        results (memoryview): Buffer for the statuses, the types and the account IDs of all the addresses.
+        count (int): Number of all the addresses.
+        start (int): Index of the first address.
+        ss58_format (int): SS58 format of the addresses.
+
+    Returns:
+        dict[str, int]: Numbers of the decoded addresses by the name of their type, for metrics.
+    """
+    ss58_format_bytes, checksum_state = _prepared_ss58_format(ss58_format)
+    counts = dict.fromkeys((address_type.name for address_type in AddressType), 0)
+    for index, address in enumerate(addresses, start):
+        status, account_id_bytes = _try_decode_account_id(address, ss58_format_bytes, checksum_state)
+        results[index] = status.value
+        if account_id_bytes is None:
+            continue
+
+        address_type = _classify_account_id(account_id_bytes)
+        counts[address_type.name] += 1
+        results[count + index] = address_type.value
+        offset = 2 * count + index * 32
+        results[offset : offset + 32] = account_id_bytes
+
+    return {name: number for name, number in counts.items() if number}
@@ -0,0 +1,33 @@
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor
+from typing import overload
+
+from .keyless import BlockchainAddress, BlockchainAddressInfo, SS58Format
+
+class DecodedAddresses(Sequence[BlockchainAddressInfo]):
+    ss58_format: SS58Format
+    statuses: bytes
+    def __init__(self, addresses: Sequence[BlockchainAddress], results: bytes, ss58_format: SS58Format) -> None: ...
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, index: int) -> BlockchainAddressInfo: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[BlockchainAddressInfo]: ...
+    def __iter__(self) -> Iterator[BlockchainAddressInfo]: ...
+    def _decode_failed(self) -> Iterator[tuple[int, ValueError]]: ...
+
+def decode_addresses_parallel(
+    addresses: Sequence[BlockchainAddress],
+    ss58_format: SS58Format = ...,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    *,
+    executor: Executor | None = None,
+) -> DecodedAddresses: ...
+def _decode_parallel(
+    addresses: Sequence[BlockchainAddress],
+    ss58_format: SS58Format,
+    workers: int | None,
+    chunk_size: int | None,
+    executor: Executor | None,
+) -> DecodedAddresses: ...
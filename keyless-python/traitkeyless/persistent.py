@@ -0,0 +1,421 @@
+"""persistent.py
+
+This module provides an opt-in persistent cache of encoded keyless addresses, stored in an SQLite database.
+
+Short-lived workers derive the same AppAgent, Transactional and Named addresses on every start.
+`PersistentAddressCache` stores every address it encodes or decodes, keyed on its type, AppAgent ID,
+Transactional address ID or name, and SS58 format, so later processes read the addresses instead of
+encoding them again. Encoding is deterministic, so stored addresses never go stale.
+
+A process reads the addresses it needs from the database on demand, or all of them at once with `load`,
+and keeps them in memory. New addresses are written in batches, when `flush` or `close` is called,
+or when enough of them are pending. The database is in WAL mode, so any number of processes read it
+while one of them writes. When the database holds more than `max_entries` addresses,
+the addresses stored first are removed. A process counts the stored addresses when it writes first,
+and then adds the addresses it writes itself, so addresses written meanwhile by other processes are counted
+only by processes opened later. Memory of a process is bounded by `max_entries` addresses as well,
+the addresses read or added first are dropped from memory, and read from the database again if needed.
+
+Examples:
+    with PersistentAddressCache("addresses.sqlite") as cache:
+        cache.load()
+        app_agent_address = cache.encode_app_agent_address(123)
+        address_info = cache.decode_address(transactional_address)
+"""
+
+import sqlite3
+from collections.abc import Callable, Iterable
+from os import PathLike
+from threading import Lock
+from types import TracebackType
+from typing import Self, TypeAlias
+
+from .keyless import (
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AddressName,
+    AddressType,
+    AppAgentId,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    KeylessCodec,
+    SS58Format,
+    TransactionalAddressId,
+    _app_agent_open_part,
+    _blake2_256,
+    _named_open_part,
+    _prepared_ss58_format,
+    _transactional_open_part,
+)
+from .ss58 import ss58_encode_prepared
+
+# Key of an address: type, AppAgent ID, Transactional address ID and name, 0 and "" where they don't apply
+_Key: TypeAlias = tuple[int, AppAgentId, TransactionalAddressId, AddressName]
+
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS addresses (
+    address_type INTEGER NOT NULL,
+    app_agent_id INTEGER NOT NULL,
+    ta_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    ss58_format INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    UNIQUE (address_type, app_agent_id, ta_id, name, ss58_format)
+);
+CREATE INDEX IF NOT EXISTS addresses_by_address ON addresses (address, ss58_format);
+"""
+
+# Number of new addresses written to the database at once
+_FLUSH_SIZE = 1024
+
+
+def _key_of(address_info: BlockchainAddressInfo) -> _Key:
+    """Create the key of a decoded keyless address."""
+    return (
+        address_info.address_type.value,
+        address_info.app_agent_id or 0,
+        address_info.ta_id or 0,
+        address_info.address_name or "",
+    )
+
+
+def _address_info(blockchain_address: BlockchainAddress, key: _Key, ss58_format: SS58Format) -> BlockchainAddressInfo:
+    """
+    Create info about a stored address from its key, computing its account ID without Base58 decoding.
+
+    Args:
+        blockchain_address (str): Encoded address.
+        key (_Key): Key of the address.
+        ss58_format (int): SS58 format of the address.
+
+    Returns:
+        BlockchainAddressInfo: Info about the address, same as returned by `decode_address`.
+    """
+    address_type_value, app_agent_id, ta_id, name = key
+    address_type = AddressType(address_type_value)
+    if address_type is AddressType.AppAgent:
+        open_part = _app_agent_open_part(app_agent_id)
+    elif address_type is AddressType.Transactional:
+        open_part = _transactional_open_part(app_agent_id, ta_id)
+    else:
+        open_part = _named_open_part(app_agent_id, name)
+
+    return BlockchainAddressInfo.from_account_id_bytes(
+        address=blockchain_address,
+        account_id_bytes=open_part + _blake2_256(open_part)[len(open_part) :],
+        address_type=address_type,
+        app_agent_id=app_agent_id,
+        ta_id=ta_id if address_type is AddressType.Transactional else None,
+        address_name=name if address_type is AddressType.Named else None,
+        ss58_format=ss58_format,
+    )
+
+
+class PersistentAddressCache:
+    """
+    Persistent cache of encoded keyless addresses of one SS58 format, to be used as a context manager.
+
+    Regular addresses aren't cached, they are decoded every time. Addresses that fail to decode aren't cached.
+    """
+
+    def __init__(
+        self: "PersistentAddressCache",
+        path: str | PathLike[str],
+        ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+        *,
+        max_entries: int = 1_000_000,
+    ) -> None:
+        if max_entries <= 0:
+            msg = "Size of persistent address cache must be positive"
+            raise ValueError(msg)
+
+        self.ss58_format = ss58_format
+        self.max_entries = max_entries
+        self._codec = KeylessCodec(ss58_format)
+        self._lock = Lock()
+        self._addresses: dict[_Key, BlockchainAddress] = {}
+        self._keys: dict[BlockchainAddress, _Key] = {}
+        self._pending: list[tuple[int, AppAgentId, TransactionalAddressId, AddressName, SS58Format, str]] = []
+        self._loaded = False
+        # Number of the addresses in the database, of all the SS58 formats, counted on the first write
+        self._count: int | None = None
+
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        try:
+            self._prepare_database()
+        except (sqlite3.DatabaseError, ValueError) as error:
+            self._connection.close()
+            msg = "Invalid persistent address cache"
+            raise ValueError(msg) from error
+
+    def _prepare_database(self: "PersistentAddressCache") -> None:
+        """Switch a new database to WAL mode and create its table of addresses."""
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version not in (0, _SCHEMA_VERSION):
+            msg = f"Unknown version {version} of persistent address cache"
+            raise ValueError(msg)
+
+        # WAL mode is kept by the database file, so a database that is set up already isn't locked for writing
+        if version == 0:
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+
+    def __enter__(self: "PersistentAddressCache") -> Self:
+        return self
+
+    def __exit__(
+        self: "PersistentAddressCache",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self: "PersistentAddressCache") -> int:
+        """Count the addresses of the SS58 format in the database, including the ones not written yet."""
+        with self._lock:
+            self._flush()
+            (count,) = self._connection.execute(
+                "SELECT count(*) FROM addresses WHERE ss58_format = ?", (self.ss58_format,)
+            ).fetchone()
+
+        return count
+
+    def load(self: "PersistentAddressCache") -> int:
+        """
+        Read all the stored addresses of the SS58 format into memory.
+
+        Returns:
+            int: Number of the addresses read.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT address_type, app_agent_id, ta_id, name, address FROM addresses WHERE ss58_format = ?",
+                (self.ss58_format,),
+            ).fetchall()
+            for address_type_value, app_agent_id, ta_id, name, blockchain_address in rows:
+                self._remember((address_type_value, app_agent_id, ta_id, name), blockchain_address)
+            # Addresses dropped from memory aren't known to be missing from the database
+            self._loaded = len(self._addresses) == len(rows)
+
+        return len(rows)
+
+    def _cached_address(self: "PersistentAddressCache", key: _Key) -> BlockchainAddress | None:
+        """Find an address by its key in memory, or in the database, the lock must be held."""
+        blockchain_address = self._addresses.get(key)
+        if blockchain_address is not None or self._loaded:
+            return blockchain_address
+
+        row = self._connection.execute(
+            "SELECT address FROM addresses"
+            " WHERE address_type = ? AND app_agent_id = ? AND ta_id = ? AND name = ? AND ss58_format = ?",
+            (*key, self.ss58_format),
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._remember(key, row[0])
+
+        return row[0]
+
+    def _cached_key(self: "PersistentAddressCache", blockchain_address: BlockchainAddress) -> _Key | None:
+        """Find the key of an address in memory, or in the database, the lock must be held."""
+        key = self._keys.get(blockchain_address)
+        if key is not None or self._loaded:
+            return key
+
+        row = self._connection.execute(
+            "SELECT address_type, app_agent_id, ta_id, name FROM addresses WHERE address = ? AND ss58_format = ?",
+            (blockchain_address, self.ss58_format),
+        ).fetchone()
+        if row is None:
+            return None
+
+        address_type_value, app_agent_id, ta_id, name = row
+        key = (address_type_value, app_agent_id, ta_id, name)
+        self._remember(key, blockchain_address)
+
+        return key
+
+    def _remember(self: "PersistentAddressCache", key: _Key, blockchain_address: BlockchainAddress) -> None:
+        """Keep an address in memory, dropping the address kept first beyond the size limit, the lock must be held."""
+        self._addresses[key] = blockchain_address
+        self._keys[blockchain_address] = key
+        if len(self._addresses) > self.max_entries:
+            del self._keys[self._addresses.pop(next(iter(self._addresses)))]
+            # The dropped address has to be looked up in the database again
+            self._loaded = False
+
+    def _add(self: "PersistentAddressCache", key: _Key, blockchain_address: BlockchainAddress) -> None:
+        """Add a new address to memory and to the addresses to be written, the lock must be held."""
+        if key in self._addresses:
+            return
+
+        self._remember(key, blockchain_address)
+        self._pending.append((*key, self.ss58_format, blockchain_address))
+        if len(self._pending) >= _FLUSH_SIZE:
+            self._flush()
+
+    def _flush(self: "PersistentAddressCache") -> None:
+        """Write the new addresses and remove the oldest ones beyond the size limit, the lock must be held."""
+        if not self._pending:
+            return
+
+        with self._connection:
+            if self._count is None:
+                (self._count,) = self._connection.execute("SELECT count(*) FROM addresses").fetchone()
+
+            # Addresses already stored by other processes are ignored, and aren't counted
+            count = (
+                self._count
+                + self._connection.executemany(
+                    "INSERT OR IGNORE INTO addresses VALUES (?, ?, ?, ?, ?, ?)", self._pending
+                ).rowcount
+            )
+            if count > self.max_entries:
+                count -= self._connection.execute(
+                    "DELETE FROM addresses WHERE rowid IN (SELECT rowid FROM addresses ORDER BY rowid LIMIT ?)",
+                    (count - self.max_entries,),
+                ).rowcount
+        self._count = count
+        self._pending.clear()
+
+    def _encode(
+        self: "PersistentAddressCache", key: _Key, encode: Callable[..., BlockchainAddress], *args: object
+    ) -> BlockchainAddress:
+        """Get an address from the cache, or encode it and add it to the cache."""
+        with self._lock:
+            blockchain_address = self._cached_address(key)
+        if blockchain_address is not None:
+            return blockchain_address
+
+        blockchain_address = encode(*args)
+        with self._lock:
+            self._add(key, blockchain_address)
+
+        return blockchain_address
+
+    def encode_app_agent_address(self: "PersistentAddressCache", app_agent_id: AppAgentId) -> BlockchainAddress:
+        """Encode an AppAgent address, see `encode_app_agent_address`."""
+        key = (AddressType.AppAgent.value, app_agent_id, 0, "")
+
+        return self._encode(key, self._codec.encode_app_agent_address, app_agent_id)
+
+    def encode_transactional_address(
+        self: "PersistentAddressCache", app_agent_id: AppAgentId, ta_id: TransactionalAddressId
+    ) -> BlockchainAddress:
+        """Encode a Transactional address, see `encode_transactional_address`."""
+        key = (AddressType.Transactional.value, app_agent_id, ta_id, "")
+
+        return self._encode(key, self._codec.encode_transactional_address, app_agent_id, ta_id)
+
+    def encode_named_address(
+        self: "PersistentAddressCache", app_agent_id: AppAgentId, name: AddressName
+    ) -> BlockchainAddress:
+        """Encode a Named address, see `encode_named_address`."""
+        key = (AddressType.Named.value, app_agent_id, 0, name)
+
+        return self._encode(key, self._codec.encode_named_address, app_agent_id, name)
+
+    def decode_address(self: "PersistentAddressCache", blockchain_address: BlockchainAddress) -> BlockchainAddressInfo:
+        """Decode an encoded blockchain address, see `decode_address`."""
+        with self._lock:
+            key = self._cached_key(blockchain_address)
+        if key is not None:
+            return _address_info(blockchain_address, key, self.ss58_format)
+
+        address_info = self._codec.decode_address(blockchain_address)
+        if address_info.address_type is not AddressType.Regular:
+            # Hex account IDs are decoded as well, but only SS58 addresses of the format are stored
+            if blockchain_address.startswith("0x"):
+                blockchain_address = ss58_encode_prepared(
+                    bytes.fromhex(blockchain_address[2:]), *_prepared_ss58_format(self.ss58_format)
+                )
+            with self._lock:
+                self._add(_key_of(address_info), blockchain_address)
+
+        return address_info
+
+    def _preload(
+        self: "PersistentAddressCache", keys: list[_Key], encode_many: Callable[[list[_Key]], list[BlockchainAddress]]
+    ) -> int:
+        """Encode the addresses of the keys that aren't stored yet, and write them."""
+        # Once the addresses don't fit in memory, they are looked up one by one instead of being read again
+        if not self._loaded and len(self._addresses) < self.max_entries:
+            self.load()
+
+        with self._lock:
+            missing_keys = [key for key in dict.fromkeys(keys) if self._cached_address(key) is None]
+        addresses = encode_many(missing_keys)
+
+        with self._lock:
+            for key, blockchain_address in zip(missing_keys, addresses, strict=True):
+                self._add(key, blockchain_address)
+            self._flush()
+
+        return len(missing_keys)
+
+    def preload_app_agent_addresses(self: "PersistentAddressCache", app_agent_ids: Iterable[AppAgentId]) -> int:
+        """
+        Encode and store the AppAgent addresses that aren't stored yet, in one batch.
+
+        Args:
+            app_agent_ids (Iterable[int]): AppAgent IDs.
+
+        Returns:
+            int: Number of the newly stored addresses.
+        """
+        keys = [(AddressType.AppAgent.value, app_agent_id, 0, "") for app_agent_id in app_agent_ids]
+
+        return self._preload(keys, lambda keys: self._codec.encode_app_agent_addresses(key[1] for key in keys))
+
+    def preload_transactional_addresses(
+        self: "PersistentAddressCache", app_agent_id: AppAgentId, ta_ids: Iterable[TransactionalAddressId]
+    ) -> int:
+        """
+        Encode and store the Transactional addresses of an AppAgent that aren't stored yet, in one batch.
+
+        Args:
+            app_agent_id (int): AppAgent ID.
+            ta_ids (Iterable[int]): Transactional address IDs.
+
+        Returns:
+            int: Number of the newly stored addresses.
+        """
+        keys = [(AddressType.Transactional.value, app_agent_id, ta_id, "") for ta_id in ta_ids]
+
+        return self._preload(
+            keys, lambda keys: self._codec.encode_transactional_addresses(app_agent_id, (key[2] for key in keys))
+        )
+
+    def preload_named_addresses(
+        self: "PersistentAddressCache", app_agent_id: AppAgentId, names: Iterable[AddressName]
+    ) -> int:
+        """
+        Encode and store the Named addresses of an AppAgent that aren't stored yet, in one batch.
+
+        Args:
+            app_agent_id (int): AppAgent ID.
+            names (Iterable[str]): Address names.
+
+        Returns:
+            int: Number of the newly stored addresses.
+        """
+        keys = [(AddressType.Named.value, app_agent_id, 0, name) for name in names]
+
+        return self._preload(
+            keys, lambda keys: self._codec.encode_named_addresses(app_agent_id, (key[3] for key in keys))
+        )
+
+    def flush(self: "PersistentAddressCache") -> None:
+        """Write the new addresses to the database."""
+        with self._lock:
+            self._flush()
+
+    def close(self: "PersistentAddressCache") -> None:
+        """Write the new addresses and close the database."""
+        with self._lock:
+            self._flush()
+            self._connection.close()
@@ -0,0 +1,43 @@
+from collections.abc import Iterable
+from os import PathLike
+from types import TracebackType
+from typing import Self
+
+from .keyless import (
+    AddressName,
+    AppAgentId,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    SS58Format,
+    TransactionalAddressId,
+)
+
+class PersistentAddressCache:
+    ss58_format: SS58Format
+    max_entries: int
+    _addresses: dict[tuple[int, AppAgentId, TransactionalAddressId, AddressName], BlockchainAddress]
+    def __init__(
+        self, path: str | PathLike[str], ss58_format: SS58Format = ..., *, max_entries: int = 1_000_000
+    ) -> None: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def load(self) -> int: ...
+    def encode_app_agent_address(self, app_agent_id: AppAgentId) -> BlockchainAddress: ...
+    def encode_transactional_address(
+        self, app_agent_id: AppAgentId, ta_id: TransactionalAddressId
+    ) -> BlockchainAddress: ...
+    def encode_named_address(self, app_agent_id: AppAgentId, name: AddressName) -> BlockchainAddress: ...
+    def decode_address(self, blockchain_address: BlockchainAddress) -> BlockchainAddressInfo: ...
+    def preload_app_agent_addresses(self, app_agent_ids: Iterable[AppAgentId]) -> int: ...
+    def preload_transactional_addresses(
+        self, app_agent_id: AppAgentId, ta_ids: Iterable[TransactionalAddressId]
+    ) -> int: ...
+    def preload_named_addresses(self, app_agent_id: AppAgentId, names: Iterable[AddressName]) -> int: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
@@ -23,10 +23,141 @@
     https://github.com/paritytech/substrate/wiki/External-Address-Format-(SS58)
 
 """
-from typing import Optional, Union
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Union
 
-import base58
-from hashlib import blake2b
+try:
+    # `hashlib` loads OpenSSL for its other algorithms, and its `blake2b` is the one of `_blake2` anyway
+    from _blake2 import blake2b
+except ImportError:
+    from hashlib import blake2b
+from time import perf_counter
+
+from .metrics import BASE58_STAGE, HASHING_STAGE, _metrics
+
+SS58_CHECKSUM_PREFIX = b'SS58PRE'
+
+# Base58 codec specialized for addresses of 32 bytes account IDs, i.e. 1 or 2 bytes of SS58 format,
+# 32 bytes of account ID and 2 bytes of checksum. Other payloads are passed on to the `base58` package,
+# which is imported on its first use, so processes that handle only valid addresses never import it.
+B58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+B58_ACCOUNT_PAYLOAD_LENGTHS = (35, 36)
+B58_ACCOUNT_ADDRESS_LENGTHS = (47, 48, 49)
+
+# Values of the Base58 characters by their code, other characters are rejected before they are looked up
+_b58_index = bytes.maketrans(B58_ALPHABET.encode(), bytes(range(58)))
+_b58_alphabet_deletion = str.maketrans('', '', B58_ALPHABET)
+# Pairs of Base58 digits by their value, built on the first encoding, so that decoding processes don't build them
+_b58_pairs: List[str] = []
+
+
+def _b58_digit_pairs() -> List[str]:
+    """
+    Builds the pairs of Base58 digits by their value, once
+
+    Returns
+    -------
+    List[str]
+    """
+    global _b58_pairs
+    _b58_pairs = [first + second for first in B58_ALPHABET for second in B58_ALPHABET]
+
+    return _b58_pairs
+
+
+def b58encode(payload: bytes) -> str:
+    """
+    Encodes given payload to Base58, the same way as `base58.b58encode`
+
+    Parameters
+    ----------
+    payload
+
+    Returns
+    -------
+    str
+    """
+    started = perf_counter() if _metrics.enabled else 0.0
+
+    if len(payload) not in B58_ACCOUNT_PAYLOAD_LENGTHS:
+        import base58
+
+        encoded = base58.b58encode(payload).decode()
+    else:
+        # Convert the payload to a number and take out two Base58 digits at a time
+        b58_pairs = _b58_pairs or _b58_digit_pairs()
+        value = int.from_bytes(payload, byteorder='big')
+        digit_pairs = []
+        while value:
+            value, digit_pair = divmod(value, 3364)
+            digit_pairs.append(b58_pairs[digit_pair])
+        digit_pairs.reverse()
+
+        # Leading zero bytes are encoded with a leading '1' each
+        leading_zeros = len(payload) - len(payload.lstrip(b'\0'))
+        encoded = '1' * leading_zeros + ''.join(digit_pairs).lstrip('1')
+
+    if started:
+        _metrics.add_time(BASE58_STAGE, perf_counter() - started)
+
+    return encoded
+
+
+def b58decode(address: str) -> bytes:
+    """
+    Decodes given Base58 string, the same way as `base58.b58decode`
+
+    Parameters
+    ----------
+    address
+
+    Returns
+    -------
+    bytes
+    """
+    address_decoded = b58decode_account(address)
+    if address_decoded is None:
+        # Let the `base58` package handle other lengths, invalid characters and surrounding whitespace
+        import base58
+
+        started = perf_counter() if _metrics.enabled else 0.0
+        address_decoded = base58.b58decode(address)
+        if started:
+            _metrics.add_time(BASE58_STAGE, perf_counter() - started)
+
+    return address_decoded
+
+
+def b58decode_account(address: str) -> Optional[bytes]:
+    """
+    Decodes given Base58 string of an address of a 32 bytes account ID, without raising exceptions
+
+    Parameters
+    ----------
+    address
+
+    Returns
+    -------
+    Decoded bytes, or None if the address isn't of a length in `B58_ACCOUNT_ADDRESS_LENGTHS`
+    or contains characters outside of the Base58 alphabet
+    """
+    if len(address) not in B58_ACCOUNT_ADDRESS_LENGTHS or address.translate(_b58_alphabet_deletion):
+        return None
+
+    started = perf_counter() if _metrics.enabled else 0.0
+
+    value = 0
+    for char in address.encode():
+        value = value * 58 + _b58_index[char]
+
+    # Leading '1's are decoded to a leading zero byte each
+    leading_zeros = len(address) - len(address.lstrip('1'))
+    address_decoded = b'\0' * leading_zeros + value.to_bytes((value.bit_length() + 7) // 8, byteorder='big')
+
+    if started:
+        _metrics.add_time(BASE58_STAGE, perf_counter() - started)
+
+    return address_decoded
 
 
 def ss58_decode(address: str, valid_ss58_format: Optional[int] = None) -> str:
@@ -46,13 +177,106 @@ def ss58_decode(address: str, valid_ss58_format: Optional[int] = None) -> str:
     if address.startswith('0x'):
         return address
 
+    return "0x" + ss58_decode_bytes(address, valid_ss58_format).hex()
+
+
+def ss58_decode_bytes(address: str, valid_ss58_format: Optional[int] = None) -> bytes:
+    """
+    Decodes given SS58 encoded address to the bytes of an account ID, without a round-trip through a hex string
+    Parameters
+    ----------
+    address: e.g. EaG2CRhJWPb7qmdcJvy3LiWdh26Jreu9Dx6R1rXxPmYXoDk
+    valid_ss58_format
+
+    Returns
+    -------
+    Decoded bytes of AccountId
+    """
+
+    # Check if address is already decoded
+    if address.startswith('0x'):
+        return bytes.fromhex(address[2:])
+
     if address == '':
         raise ValueError("Empty address provided")
 
-    checksum_prefix = b'SS58PRE'
+    address_decoded = b58decode(address)
+    ss58_format, ss58_format_length = _decode_ss58_format(address_decoded)
 
-    address_decoded = base58.b58decode(address)
+    if valid_ss58_format is not None and ss58_format != valid_ss58_format:
+        raise ValueError("Invalid SS58 format")
+
+    checksum_length = _checksum_length(len(address_decoded), ss58_format_length)
+
+    started = perf_counter() if _metrics.enabled else 0.0
+    checksum = blake2b(SS58_CHECKSUM_PREFIX + address_decoded[0:-checksum_length]).digest()
+    if started:
+        _metrics.add_time(HASHING_STAGE, perf_counter() - started)
+
+    if checksum[0:checksum_length] != address_decoded[-checksum_length:]:
+        raise ValueError("Invalid checksum")
 
+    return address_decoded[ss58_format_length:len(address_decoded)-checksum_length]
+
+
+class ParsedSS58(NamedTuple):
+    """
+    SS58 encoded address parsed once, see `ss58_parse`
+    """
+    # SS58 format (network) of the address
+    ss58_format: int
+    # Payload between the SS58 format and the checksum, e.g. a 32 bytes account ID
+    payload: bytes
+    # Whether the checksum matches the payload, None if the checksum wasn't verified
+    checksum_valid: Optional[bool]
+
+
+def ss58_parse(address: str, verify_checksum: bool = True) -> ParsedSS58:
+    """
+    Parses given SS58 encoded address of any format with one Base58 decoding and at most one checksum,
+    instead of `get_ss58_format` followed by `ss58_decode`, which decode the address twice
+
+    Parameters
+    ----------
+    address: e.g. EaG2CRhJWPb7qmdcJvy3LiWdh26Jreu9Dx6R1rXxPmYXoDk
+    verify_checksum: if False, the checksum isn't computed and `checksum_valid` is None
+
+    Returns
+    -------
+    ParsedSS58 with the SS58 format, the payload and the status of the checksum. An invalid checksum is reported
+    in `checksum_valid`, other errors, i.e. invalid characters, length or SS58 format, raise ValueError
+    """
+    if address == '':
+        raise ValueError("Empty address provided")
+
+    address_decoded = b58decode(address)
+    ss58_format, ss58_format_length = _decode_ss58_format(address_decoded)
+    checksum_length = _checksum_length(len(address_decoded), ss58_format_length)
+    payload = address_decoded[ss58_format_length:len(address_decoded)-checksum_length]
+
+    if not verify_checksum:
+        return ParsedSS58(ss58_format, payload, None)
+
+    started = perf_counter() if _metrics.enabled else 0.0
+    checksum = blake2b(SS58_CHECKSUM_PREFIX + address_decoded[0:-checksum_length]).digest()
+    if started:
+        _metrics.add_time(HASHING_STAGE, perf_counter() - started)
+
+    return ParsedSS58(ss58_format, payload, checksum[0:checksum_length] == address_decoded[-checksum_length:])
+
+
+def _decode_ss58_format(address_decoded: bytes) -> tuple[int, int]:
+    """
+    Decodes the SS58 format a Base58 decoded address starts with
+
+    Parameters
+    ----------
+    address_decoded
+
+    Returns
+    -------
+    SS58 format and the number of bytes it is encoded with
+    """
     if address_decoded[0] & 0b0100_0000:
         ss58_format_length = 2
         ss58_format = ((address_decoded[0] & 0b0011_1111) << 2) | (address_decoded[1] >> 6) | \
@@ -64,35 +288,167 @@ def ss58_decode(address: str, valid_ss58_format: Optional[int] = None) -> str:
     if ss58_format in [46, 47]:
         raise ValueError(f"{ss58_format} is a reserved SS58 format")
 
-    if valid_ss58_format is not None and ss58_format != valid_ss58_format:
-        raise ValueError("Invalid SS58 format")
+    return ss58_format, ss58_format_length
+
+
+def _checksum_length(address_length: int, ss58_format_length: int) -> int:
+    """
+    Determines the checksum length of a Base58 decoded address according to its length
+
+    Parameters
+    ----------
+    address_length
+    ss58_format_length
 
+    Returns
+    -------
+    int
+    """
     # Determine checksum length according to length of address string
-    if len(address_decoded) in [3, 4, 6, 10]:
+    if address_length in [3, 4, 6, 10]:
         checksum_length = 1
-    elif len(address_decoded) in [5, 7, 11, 34 + ss58_format_length, 35 + ss58_format_length]:
+    elif address_length in [5, 7, 11, 34 + ss58_format_length, 35 + ss58_format_length]:
         checksum_length = 2
-    elif len(address_decoded) in [8, 12]:
+    elif address_length in [8, 12]:
         checksum_length = 3
-    elif len(address_decoded) in [9, 13]:
+    elif address_length in [9, 13]:
         checksum_length = 4
-    elif len(address_decoded) in [14]:
+    elif address_length in [14]:
         checksum_length = 5
-    elif len(address_decoded) in [15]:
+    elif address_length in [15]:
         checksum_length = 6
-    elif len(address_decoded) in [16]:
+    elif address_length in [16]:
         checksum_length = 7
-    elif len(address_decoded) in [17]:
+    elif address_length in [17]:
         checksum_length = 8
     else:
         raise ValueError("Invalid address length")
 
-    checksum = blake2b(checksum_prefix + address_decoded[0:-checksum_length]).digest()
+    return checksum_length
 
-    if checksum[0:checksum_length] != address_decoded[-checksum_length:]:
+
+def ss58_format_to_bytes(ss58_format: int) -> bytes:
+    """
+    Validates given SS58 format and returns the prefix bytes it is encoded with
+
+    Parameters
+    ----------
+    ss58_format
+
+    Returns
+    -------
+    bytes
+    """
+    if ss58_format < 0 or ss58_format > 16383 or ss58_format in [46, 47]:
+        raise ValueError("Invalid value for ss58_format")
+
+    if ss58_format < 64:
+        return bytes([ss58_format])
+
+    return bytes([
+        ((ss58_format & 0b0000_0000_1111_1100) >> 2) | 0b0100_0000,
+        (ss58_format >> 8) | ((ss58_format & 0b0000_0000_0000_0011) << 6)
+    ])
+
+
+def ss58_checksum_state(ss58_format_bytes: bytes) -> "blake2b":
+    """
+    Returns a Blake2b state already fed with the checksum prefix and the given SS58 format bytes.
+    The state is meant to be `.copy()`-ed for every address of that format.
+
+    Parameters
+    ----------
+    ss58_format_bytes: as returned by `ss58_format_to_bytes`
+
+    Returns
+    -------
+    blake2b
+    """
+    return blake2b(SS58_CHECKSUM_PREFIX + ss58_format_bytes)
+
+
+def blake2b_continue(prefix_state: "blake2b", data: bytes) -> bytes:
+    """
+    Returns the Blake2b digest of a common prefix followed by given data, using a state already fed with the prefix.
+    The state isn't modified.
+
+    Parameters
+    ----------
+    prefix_state: e.g. as returned by `ss58_checksum_state`
+    data
+
+    Returns
+    -------
+    bytes
+    """
+    started = perf_counter() if _metrics.enabled else 0.0
+
+    state = prefix_state.copy()
+    state.update(data)
+    digest = state.digest()
+
+    if started:
+        _metrics.add_time(HASHING_STAGE, perf_counter() - started)
+
+    return digest
+
+
+def ss58_encode_prepared(address_bytes: bytes, ss58_format_bytes: bytes, checksum_state: "blake2b") -> str:
+    """
+    Encodes a 32 or 33 bytes account ID using SS58 format bytes and checksum state prepared in advance,
+    see `ss58_format_to_bytes` and `ss58_checksum_state`
+
+    Parameters
+    ----------
+    address_bytes
+    ss58_format_bytes
+    checksum_state
+
+    Returns
+    -------
+    str
+    """
+    checksum = blake2b_continue(checksum_state, address_bytes)
+
+    return b58encode(ss58_format_bytes + address_bytes + checksum[:2])
+
+
+def ss58_decode_prepared(address: str, ss58_format: int, ss58_format_bytes: bytes, checksum_state: "blake2b",
+                         verify_checksum: bool = True) -> bytes:
+    """
+    Decodes given SS58 encoded address of a 32 bytes account ID using SS58 format bytes and checksum state prepared
+    in advance, see `ss58_format_to_bytes` and `ss58_checksum_state`.
+    Addresses of other lengths or formats are passed on to `ss58_decode_bytes`, so the result and the errors are
+    the same.
+
+    Parameters
+    ----------
+    address
+    ss58_format: the SS58 format the address must be valid for
+    ss58_format_bytes
+    checksum_state
+    verify_checksum: if False, the checksum of an address of a 32 bytes account ID isn't verified,
+        only for addresses that were verified before
+
+    Returns
+    -------
+    Decoded bytes of AccountId
+    """
+    if address.startswith('0x'):
+        return bytes.fromhex(address[2:])
+
+    address_decoded = b58decode(address)
+    ss58_format_length = len(ss58_format_bytes)
+
+    if len(address_decoded) != ss58_format_length + 34 or address_decoded[:ss58_format_length] != ss58_format_bytes:
+        return ss58_decode_bytes(address, ss58_format)
+
+    address_bytes = address_decoded[ss58_format_length:-2]
+
+    if verify_checksum and blake2b_continue(checksum_state, address_bytes)[:2] != address_decoded[-2:]:
         raise ValueError("Invalid checksum")
 
-    return "0x" + address_decoded[ss58_format_length:len(address_decoded)-checksum_length].hex()
+    return address_bytes
 
 
 def ss58_encode(address: Union[str, bytes], ss58_format: int = 42) -> str:
@@ -108,10 +464,7 @@ def ss58_encode(address: Union[str, bytes], ss58_format: int = 42) -> str:
     -------
     str
     """
-    checksum_prefix = b'SS58PRE'
-
-    if ss58_format < 0 or ss58_format > 16383 or ss58_format in [46, 47]:
-        raise ValueError("Invalid value for ss58_format")
+    ss58_format_bytes = ss58_format_to_bytes(ss58_format)
 
     if type(address) is bytes or type(address) is bytearray:
         address_bytes = address
@@ -127,18 +480,72 @@ def ss58_encode(address: Union[str, bytes], ss58_format: int = 42) -> str:
     else:
         raise ValueError("Invalid length for address")
 
-    if ss58_format < 64:
-        ss58_format_bytes = bytes([ss58_format])
-    else:
-        ss58_format_bytes = bytes([
-            ((ss58_format & 0b0000_0000_1111_1100) >> 2) | 0b0100_0000,
-            (ss58_format >> 8) | ((ss58_format & 0b0000_0000_0000_0011) << 6)
-        ])
-
     input_bytes = ss58_format_bytes + address_bytes
-    checksum = blake2b(checksum_prefix + input_bytes).digest()
+    started = perf_counter() if _metrics.enabled else 0.0
+    checksum = blake2b(SS58_CHECKSUM_PREFIX + input_bytes).digest()
+    if started:
+        _metrics.add_time(HASHING_STAGE, perf_counter() - started)
+
+    return b58encode(input_bytes + checksum[:checksum_length])
 
-    return base58.b58encode(input_bytes + checksum[:checksum_length]).decode()
+
+def transcode_addresses(addresses: Iterable[str], from_format: int, to_format: int,
+                        batch_size: int = 1024) -> Iterator[str]:
+    """
+    Re-encodes SS58 addresses of one format to another format, e.g. from 5335 to 42, lazily and in batches.
+
+    Account IDs are taken from the decoded bytes and encoded again without a round-trip through hex strings,
+    and the checksum states of both formats are prepared once. Addresses are read from the iterable
+    `batch_size` at a time, so sequences and endless streams are both handled with bounded memory.
+    Invalid addresses raise the same errors as `ss58_decode_bytes`, when they are reached.
+
+    Parameters
+    ----------
+    addresses: SS58 addresses in `from_format`
+    from_format: the SS58 format the addresses must be valid for
+    to_format: the SS58 format to encode the addresses with
+    batch_size: number of addresses transcoded at once
+
+    Returns
+    -------
+    Iterator of the addresses in `to_format`, in the order of the input
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be positive")
+
+    from_format_bytes = ss58_format_to_bytes(from_format)
+    from_checksum_state = ss58_checksum_state(from_format_bytes)
+    to_format_bytes = ss58_format_to_bytes(to_format)
+    to_checksum_state = ss58_checksum_state(to_format_bytes)
+
+    def transcode(address: str) -> str:
+        address_bytes = ss58_decode_prepared(address, from_format, from_format_bytes, from_checksum_state)
+        if len(address_bytes) != 32:
+            # Account indices and other payloads have checksums of other lengths
+            return ss58_encode(address_bytes, to_format)
+
+        return ss58_encode_prepared(address_bytes, to_format_bytes, to_checksum_state)
+
+    return _map_batches(transcode, addresses, batch_size)
+
+
+def _map_batches(function: Callable[[str], str], items: Iterable[str], batch_size: int) -> Iterator[str]:
+    """
+    Applies a function to the items of an iterable, a batch of items at a time
+
+    Parameters
+    ----------
+    function
+    items
+    batch_size
+
+    Returns
+    -------
+    Iterator of the results, in the order of the items
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield from [function(item) for item in batch]
 
 
 def is_valid_ss58_address(value: str, valid_ss58_format: Optional[int] = None) -> bool:
@@ -180,15 +587,7 @@ def get_ss58_format(ss58_address: str) -> int:
     -------
     int
     """
-    address_decoded = base58.b58decode(ss58_address)
-
-    if address_decoded[0] & 0b0100_0000:
-        ss58_format = ((address_decoded[0] & 0b0011_1111) << 2) | (address_decoded[1] >> 6) | \
-                      ((address_decoded[1] & 0b0011_1111) << 8)
-    else:
-        ss58_format = address_decoded[0]
-
-    if ss58_format in [46, 47]:
-        raise ValueError(f"{ss58_format} is a reserved SS58 format")
+    address_decoded = b58decode(ss58_address)
+    ss58_format, _ = _decode_ss58_format(address_decoded)
 
     return ss58_format
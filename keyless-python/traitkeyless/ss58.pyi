@@ -1,4 +1,36 @@
+from collections.abc import Iterable, Iterator
+from hashlib import blake2b as blake2b
+from typing import NamedTuple
+
+SS58_CHECKSUM_PREFIX: bytes
+B58_ALPHABET: str
+B58_ACCOUNT_PAYLOAD_LENGTHS: tuple[int, ...]
+B58_ACCOUNT_ADDRESS_LENGTHS: tuple[int, ...]
+
+def b58encode(payload: bytes) -> str: ...
+def b58decode(address: str) -> bytes: ...
+def b58decode_account(address: str) -> bytes | None: ...
 def ss58_decode(address: str, valid_ss58_format: int | None = None) -> str: ...
+def ss58_decode_bytes(address: str, valid_ss58_format: int | None = None) -> bytes: ...
+
+class ParsedSS58(NamedTuple):
+    ss58_format: int
+    payload: bytes
+    checksum_valid: bool | None
+
+def ss58_parse(address: str, verify_checksum: bool = True) -> ParsedSS58: ...
+def _decode_ss58_format(address_decoded: bytes) -> tuple[int, int]: ...
+def _checksum_length(address_length: int, ss58_format_length: int) -> int: ...
+def ss58_format_to_bytes(ss58_format: int) -> bytes: ...
+def ss58_checksum_state(ss58_format_bytes: bytes) -> blake2b: ...
+def blake2b_continue(prefix_state: blake2b, data: bytes) -> bytes: ...
+def ss58_encode_prepared(address_bytes: bytes, ss58_format_bytes: bytes, checksum_state: blake2b) -> str: ...
+def ss58_decode_prepared(
+    address: str, ss58_format: int, ss58_format_bytes: bytes, checksum_state: blake2b, verify_checksum: bool = True
+) -> bytes: ...
 def ss58_encode(address: str | bytes, ss58_format: int = 42) -> str: ...
+def transcode_addresses(
+    addresses: Iterable[str], from_format: int, to_format: int, batch_size: int = 1024
+) -> Iterator[str]: ...
 def is_valid_ss58_address(value: str, valid_ss58_format: int | None = None) -> bool: ...
 def get_ss58_format(ss58_address: str) -> int: ...
@@ -0,0 +1,281 @@
+"""store.py
+
+This module provides a binary file format for storing decoded addresses, and its writer and memory-mapped reader.
+
+Decoding text dumps of SS58 addresses on every start of a job is costly. An address store is written once
+from the results of `decode_address`, and then opened with `mmap`, so reading it doesn't decode anything,
+the file isn't loaded into memory at once, and processes that open the same store share its pages.
+
+File format, all integers little-endian:
+    header (16 bytes): magic `TKLSTORE`, format version (uint16), SS58 format (uint16), record size (uint16),
+        2 reserved bytes.
+    records (51 bytes each): account ID (32 bytes), address type (uint8), AppAgent ID (uint32),
+        Transactional address ID (uint32), address name (10 bytes). Fields that don't apply to the type
+        of an address are zero.
+
+Account IDs of records are copied out of the mapped pages as 32 bytes `bytes` rather than returned as `memoryview`
+slices of the map. A slice of 32 bytes is larger and slower to create than a copy, and it would keep the map
+from being closed as long as any record is referenced.
+
+Examples:
+    with AddressStoreWriter("addresses.tkl") as writer:
+        writer.write_many(decode_address(address) for address in addresses)
+
+    with AddressStoreReader("addresses.tkl") as reader:
+        record = reader[456]
+        for record in reader.records_of_app_agent(123):
+            print(record.ta_id)
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from os import PathLike
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, NamedTuple, Self
+
+from .keyless import (
+    NAMED_ADDRESS_LENGTH,
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AddressName,
+    AddressType,
+    AppAgentId,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    SS58Format,
+    TransactionalAddressId,
+    _prepared_ss58_format,
+)
+from .ss58 import ss58_encode_prepared
+
+STORE_MAGIC = b"TKLSTORE"
+STORE_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHH2x")
+_RECORD = struct.Struct(f"<32sBII{NAMED_ADDRESS_LENGTH}s")
+# AppAgent ID of a record, read without unpacking the whole record
+_RECORD_APP_AGENT_ID = struct.Struct("<I")
+_RECORD_APP_AGENT_ID_OFFSET = 33
+
+
+class AddressRecord(NamedTuple):
+    account_id: bytes
+    address_type: AddressType
+    app_agent_id: AppAgentId | None
+    ta_id: TransactionalAddressId | None
+    address_name: AddressName | None
+
+
+class AddressStoreWriter:
+    """
+    Writer of an address store file, to be used as a context manager.
+
+    Records are packed into a buffered file, so writing many addresses results in a few large writes.
+    """
+
+    def __init__(
+        self: "AddressStoreWriter",
+        path: str | PathLike[str],
+        ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB,
+    ) -> None:
+        # Validate the SS58 format before creating the file
+        _prepared_ss58_format(ss58_format)
+
+        self.ss58_format = ss58_format
+        self._file: BinaryIO = Path(path).open("wb")  # noqa: SIM115
+        self._file.write(_HEADER.pack(STORE_MAGIC, STORE_VERSION, ss58_format, _RECORD.size))
+
+    def __enter__(self: "AddressStoreWriter") -> Self:
+        return self
+
+    def __exit__(
+        self: "AddressStoreWriter",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self: "AddressStoreWriter", address_info: BlockchainAddressInfo) -> None:
+        """
+        Write a decoded address to the store.
+
+        Args:
+            address_info (BlockchainAddressInfo): Info about the address, as returned by `decode_address`.
+        """
+        self._file.write(_pack_record(address_info))
+
+    def write_many(self: "AddressStoreWriter", addresses_info: Iterable[BlockchainAddressInfo]) -> None:
+        """
+        Write many decoded addresses to the store.
+
+        Args:
+            addresses_info (Iterable[BlockchainAddressInfo]): Info about the addresses.
+        """
+        self._file.writelines(map(_pack_record, addresses_info))
+
+    def close(self: "AddressStoreWriter") -> None:
+        """Flush the records and close the file."""
+        self._file.close()
+
+
+def _pack_record(address_info: BlockchainAddressInfo) -> bytes:
+    """
+    Pack a decoded address into a record.
+
+    Args:
+        address_info (BlockchainAddressInfo): Info about the address.
+
+    Returns:
+        bytes: Packed record.
+    """
+    account_id_bytes = address_info._account_id_bytes  # noqa: SLF001
+    if account_id_bytes is None:
+        account_id_bytes = bytes.fromhex(address_info.account_id[2:])
+    if len(account_id_bytes) != 32:  # noqa: PLR2004
+        msg = "Only addresses of 32 bytes account IDs can be stored"
+        raise ValueError(msg)
+
+    return _RECORD.pack(
+        account_id_bytes,
+        address_info.address_type.value,
+        address_info.app_agent_id or 0,
+        address_info.ta_id or 0,
+        (address_info.address_name or "").encode(),
+    )
+
+
+class AddressStoreReader:
+    """
+    Memory-mapped reader of an address store file, to be used as a context manager.
+
+    Records are unpacked from the mapped pages on access, with random access by record number,
+    iteration and filtering by AppAgent.
+    """
+
+    def __init__(self: "AddressStoreReader", path: str | PathLike[str]) -> None:
+        with Path(path).open("rb") as file:
+            # The header is validated before the file is mapped, so an invalid file isn't mapped at all
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                msg = "Invalid address store file"
+                raise ValueError(msg)
+
+            magic, version, ss58_format, record_size = _HEADER.unpack(header)
+            if (
+                magic != STORE_MAGIC
+                or version != STORE_VERSION
+                or record_size != _RECORD.size
+                or (os.fstat(file.fileno()).st_size - _HEADER.size) % _RECORD.size
+            ):
+                msg = "Invalid address store file"
+                raise ValueError(msg)
+
+            self.ss58_format: SS58Format = ss58_format
+            self._ss58_format_bytes, self._checksum_state = _prepared_ss58_format(ss58_format)
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._length = (len(self._mmap) - _HEADER.size) // _RECORD.size
+
+    def __enter__(self: "AddressStoreReader") -> Self:
+        return self
+
+    def __exit__(
+        self: "AddressStoreReader",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self: "AddressStoreReader") -> int:
+        return self._length
+
+    def __getitem__(self: "AddressStoreReader", index: int) -> AddressRecord:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            msg = "Address store index out of range"
+            raise IndexError(msg)
+
+        return self._record(index)
+
+    def __iter__(self: "AddressStoreReader") -> Iterator[AddressRecord]:
+        for index in range(self._length):
+            yield self._record(index)
+
+    def _record(self: "AddressStoreReader", index: int) -> AddressRecord:
+        """Unpack the record of the given number, which must be in range."""
+        account_id_bytes, type_byte, app_agent_id, ta_id, name_bytes = _RECORD.unpack_from(
+            self._mmap, _HEADER.size + index * _RECORD.size
+        )
+        address_type = AddressType(type_byte)
+
+        return AddressRecord(
+            account_id=account_id_bytes,
+            address_type=address_type,
+            app_agent_id=app_agent_id if address_type is not AddressType.Regular else None,
+            ta_id=ta_id if address_type is AddressType.Transactional else None,
+            address_name=name_bytes.decode() if address_type is AddressType.Named else None,
+        )
+
+    def records_of_app_agent(self: "AddressStoreReader", app_agent_id: AppAgentId) -> Iterator[AddressRecord]:
+        """
+        Iterate over the records of keyless addresses of an AppAgent.
+
+        Only the AppAgent ID of a record is read until it matches, the other fields aren't unpacked.
+
+        Args:
+            app_agent_id (int): AppAgent ID.
+
+        Yields:
+            AddressRecord: Records of the AppAgent, in the order of the store.
+        """
+        for index in range(self._length):
+            offset = _HEADER.size + index * _RECORD.size + _RECORD_APP_AGENT_ID_OFFSET
+            if _RECORD_APP_AGENT_ID.unpack_from(self._mmap, offset)[0] != app_agent_id:
+                continue
+
+            record = self._record(index)
+            if record.address_type is not AddressType.Regular:
+                yield record
+
+    def address(self: "AddressStoreReader", index: int) -> BlockchainAddress:
+        """
+        Encode the address of a record in the SS58 format of the store.
+
+        Args:
+            index (int): Number of the record.
+
+        Returns:
+            str: Encoded address.
+        """
+        return ss58_encode_prepared(self[index].account_id, self._ss58_format_bytes, self._checksum_state)
+
+    def address_info(self: "AddressStoreReader", index: int) -> BlockchainAddressInfo:
+        """
+        Create info about the address of a record, same as returned by `decode_address`.
+
+        Args:
+            index (int): Number of the record.
+
+        Returns:
+            BlockchainAddressInfo: Info about the address.
+        """
+        record = self[index]
+
+        return BlockchainAddressInfo.from_account_id_bytes(
+            address=ss58_encode_prepared(record.account_id, self._ss58_format_bytes, self._checksum_state),
+            account_id_bytes=record.account_id,
+            address_type=record.address_type,
+            app_agent_id=record.app_agent_id,
+            ta_id=record.ta_id,
+            address_name=record.address_name,
+            ss58_format=self.ss58_format,
+        )
+
+    def close(self: "AddressStoreReader") -> None:
+        """Unmap the file."""
+        self._mmap.close()
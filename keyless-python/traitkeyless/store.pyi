@@ -0,0 +1,56 @@
+from collections.abc import Iterable, Iterator
+from os import PathLike
+from types import TracebackType
+from typing import NamedTuple, Self
+
+from .keyless import (
+    AddressName,
+    AddressType,
+    AppAgentId,
+    BlockchainAddress,
+    BlockchainAddressInfo,
+    SS58Format,
+    TransactionalAddressId,
+)
+
+STORE_MAGIC: bytes
+STORE_VERSION: int
+
+class AddressRecord(NamedTuple):
+    account_id: bytes
+    address_type: AddressType
+    app_agent_id: AppAgentId | None
+    ta_id: TransactionalAddressId | None
+    address_name: AddressName | None
+
+class AddressStoreWriter:
+    ss58_format: SS58Format
+    def __init__(self, path: str | PathLike[str], ss58_format: SS58Format = ...) -> None: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+    def write(self, address_info: BlockchainAddressInfo) -> None: ...
+    def write_many(self, addresses_info: Iterable[BlockchainAddressInfo]) -> None: ...
+    def close(self) -> None: ...
+
+class AddressStoreReader:
+    ss58_format: SS58Format
+    def __init__(self, path: str | PathLike[str]) -> None: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> AddressRecord: ...
+    def __iter__(self) -> Iterator[AddressRecord]: ...
+    def records_of_app_agent(self, app_agent_id: AppAgentId) -> Iterator[AddressRecord]: ...
+    def address(self, index: int) -> BlockchainAddress: ...
+    def address_info(self, index: int) -> BlockchainAddressInfo: ...
+    def close(self) -> None: ...
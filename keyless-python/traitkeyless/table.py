@@ -0,0 +1,185 @@
+"""table.py
+
+This module provides an opt-in precomputed table of AppAgent addresses.
+
+There are few AppAgents, but their addresses are encoded and decoded constantly by APIs and reports.
+`AppAgentAddressTable` encodes the AppAgent addresses of IDs 0 to `max_id` once, and then encodes
+by reading the address of an ID from the table, and decodes by looking the address up in a hash table,
+both without Base58 and Blake2b. The addresses are kept as ASCII bytes in one buffer with an array of
+offsets, and the hash table is an array of IDs with open addressing, so an entry takes about 60 bytes
+instead of a Python string and a dictionary entry. IDs above `max_id` grow the table on first use.
+
+Examples:
+    table = AppAgentAddressTable(max_id=10_000)
+    app_agent_address = table.encode_app_agent_address(123)
+    assert table.decode_app_agent_address(app_agent_address) == 123
+"""
+
+import sys
+from array import array
+from threading import Lock
+from typing import NamedTuple
+
+from .keyless import (
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AppAgentId,
+    BlockchainAddress,
+    KeylessCodec,
+    SS58Format,
+)
+
+# Maximal number of addresses in a table, IDs beyond it are encoded and decoded without the table
+MAX_TABLE_SIZE = 1 << 20
+
+
+class _Table(NamedTuple):
+    """Contents of a table, replaced as a whole when the table grows, so readers never see a partial table."""
+
+    # ASCII addresses of IDs 0 to size - 1, one after another
+    data: bytes
+    # Offsets of the addresses in `data`, the address of ID `i` ends where the address of ID `i + 1` starts
+    offsets: array
+    # Hash table of the addresses: ID + 1 of an address in the slot its hash points to, 0 in empty slots
+    slots: array
+
+
+class AppAgentAddressTable:
+    """
+    Precomputed AppAgent addresses of a range of IDs, bound to one SS58 format.
+
+    Encoding and decoding of an address in the table take constant time. Addresses that aren't in the table,
+    e.g. of other types, are decoded the same way as by `decode_app_agent_address`.
+    """
+
+    def __init__(
+        self: "AppAgentAddressTable", max_id: AppAgentId, ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+    ) -> None:
+        if not 0 <= max_id < MAX_TABLE_SIZE:
+            msg = "Invalid maximal AppAgent ID of address table"
+            raise ValueError(msg)
+
+        self.ss58_format = ss58_format
+        self._codec = KeylessCodec(ss58_format)
+        self._lock = Lock()
+        self._table = self._extended(_Table(b"", array("I", [0]), array("I")), max_id + 1)
+
+    def __repr__(self: "AppAgentAddressTable") -> str:
+        return f"AppAgentAddressTable(max_id={self.max_id}, ss58_format={self.ss58_format})"
+
+    def __len__(self: "AppAgentAddressTable") -> int:
+        return len(self._table.offsets) - 1
+
+    @property
+    def max_id(self: "AppAgentAddressTable") -> AppAgentId:
+        """Largest AppAgent ID in the table."""
+        return len(self._table.offsets) - 2
+
+    def _extended(self: "AppAgentAddressTable", table: _Table, size: int) -> _Table:
+        """
+        Encode the addresses missing in a table up to the given size, and build the extended table.
+
+        Args:
+            table (_Table): Current contents of the table.
+            size (int): Number of addresses of the extended table.
+
+        Returns:
+            _Table: Contents of the extended table.
+        """
+        data = bytearray(table.data)
+        offsets = array("I", table.offsets)
+        for app_agent_address in self._codec.encode_app_agent_addresses(range(len(offsets) - 1, size)):
+            data += app_agent_address.encode("ascii")
+            offsets.append(len(data))
+
+        # At most half of the slots are used, so probe sequences stay short
+        mask = (1 << (2 * size - 1).bit_length()) - 1
+        slots = array("I", [0]) * (mask + 1)
+        data_bytes = bytes(data)
+        for app_agent_id in range(size):
+            position = hash(data_bytes[offsets[app_agent_id] : offsets[app_agent_id + 1]]) & mask
+            while slots[position]:
+                position = (position + 1) & mask
+            slots[position] = app_agent_id + 1
+
+        return _Table(data_bytes, offsets, slots)
+
+    def _grow(self: "AppAgentAddressTable", app_agent_id: AppAgentId) -> None:
+        """Grow the table to include an ID, at least doubling its size, so growing costs amortized constant time."""
+        with self._lock:
+            size = len(self._table.offsets) - 1
+            if app_agent_id >= size:
+                self._table = self._extended(self._table, min(max(app_agent_id + 1, 2 * size), MAX_TABLE_SIZE))
+
+    def encode_app_agent_address(self: "AppAgentAddressTable", app_agent_id: AppAgentId) -> BlockchainAddress:
+        """
+        Encode an AppAgent address, growing the table if the ID is above `max_id`.
+
+        Args:
+            app_agent_id (int): AppAgent ID.
+
+        Returns:
+            str: Encoded AppAgent address.
+        """
+        data, offsets, _ = self._table
+        if 0 <= app_agent_id < len(offsets) - 1:
+            return data[offsets[app_agent_id] : offsets[app_agent_id + 1]].decode("ascii")
+
+        if not 0 <= app_agent_id < MAX_TABLE_SIZE:
+            return self._codec.encode_app_agent_address(app_agent_id)
+
+        self._grow(app_agent_id)
+
+        return self.encode_app_agent_address(app_agent_id)
+
+    def lookup(self: "AppAgentAddressTable", blockchain_address: BlockchainAddress) -> AppAgentId | None:
+        """
+        Look up an encoded address in the table, without decoding it.
+
+        Args:
+            blockchain_address (str): Encoded address of any type.
+
+        Returns:
+            int | None: AppAgent ID of the address if it's in the table, otherwise None.
+        """
+        try:
+            key = blockchain_address.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+
+        data, offsets, slots = self._table
+        mask = len(slots) - 1
+        position = hash(key) & mask
+        while entry := slots[position]:
+            app_agent_id = entry - 1
+            if data[offsets[app_agent_id] : offsets[app_agent_id + 1]] == key:
+                return app_agent_id
+            position = (position + 1) & mask
+
+        return None
+
+    def decode_app_agent_address(self: "AppAgentAddressTable", encoded_address: BlockchainAddress) -> AppAgentId:
+        """
+        Decode an encoded AppAgent address, looking it up in the table first.
+
+        Args:
+            encoded_address (str): Encoded AppAgent address.
+
+        Returns:
+            int: Decoded AppAgent ID.
+        """
+        app_agent_id = self.lookup(encoded_address)
+        if app_agent_id is not None:
+            return app_agent_id
+
+        return self._codec.decode_app_agent_address(encoded_address)
+
+    def memory_footprint(self: "AppAgentAddressTable") -> int:
+        """
+        Estimate the memory used by the table.
+
+        Returns:
+            int: Size of the addresses, the offsets and the hash table in bytes.
+        """
+        data, offsets, slots = self._table
+
+        return sys.getsizeof(data) + sys.getsizeof(offsets) + sys.getsizeof(slots)
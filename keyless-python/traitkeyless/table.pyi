@@ -0,0 +1,14 @@
+from .keyless import AppAgentId, BlockchainAddress, SS58Format
+
+MAX_TABLE_SIZE: int
+
+class AppAgentAddressTable:
+    ss58_format: SS58Format
+    def __init__(self, max_id: AppAgentId, ss58_format: SS58Format = ...) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def max_id(self) -> AppAgentId: ...
+    def encode_app_agent_address(self, app_agent_id: AppAgentId) -> BlockchainAddress: ...
+    def lookup(self, blockchain_address: BlockchainAddress) -> AppAgentId | None: ...
+    def decode_app_agent_address(self, encoded_address: BlockchainAddress) -> AppAgentId: ...
+    def memory_footprint(self) -> int: ...
@@ -0,0 +1,108 @@
+"""vectorized.py
+
+This module provides bulk decoding of keyless addresses into NumPy structured arrays.
+
+Base58 and the SS58 checksum are still handled address by address, but the dispatch on the type byte
+and the extraction of AppAgent IDs, Transactional address IDs and names run as array operations
+over the 32 bytes account IDs. No `BlockchainAddressInfo` object is created.
+
+The module requires the optional `numpy` dependency: `pip install traitkeyless[numpy]`.
+
+Examples:
+    addresses_info = decode_addresses_np(addresses)
+    app_agent_addresses = addresses_info[addresses_info["address_type"] == AddressType.AppAgent.value]
+"""
+
+from collections.abc import Iterable
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as error:
+    msg = "traitkeyless.vectorized requires numpy, install it with `pip install traitkeyless[numpy]`"
+    raise ImportError(msg) from error
+
+from .keyless import (
+    NAMED_ADDRESS_LENGTH,
+    SS58_FORMAT__TRAIT_ASSET_HUB,
+    AddressType,
+    BlockchainAddress,
+    SS58Format,
+    _has_keyless_checksum,
+    _open_part_sizes,
+)
+from .ss58 import ss58_checksum_state, ss58_decode_prepared, ss58_format_to_bytes
+
+# Value of `app_agent_id` and `ta_id` fields for addresses that don't have them,
+# check `address_type` to distinguish it from a real ID.
+MISSING_ID = 0xFFFF_FFFF
+
+# Account IDs are raw 32 bytes fields, `V32` rather than `S32`, since NumPy strips trailing zero bytes
+# of `S` fields when they are read, and an account ID may end with zero bytes
+ADDRESS_INFO_DTYPE = np.dtype(
+    [
+        ("address_type", np.uint8),
+        ("app_agent_id", np.uint32),
+        ("ta_id", np.uint32),
+        ("name", f"S{NAMED_ADDRESS_LENGTH}"),
+        ("account_id", "V32"),
+    ]
+)
+
+
+def decode_addresses_np(
+    addresses: Iterable[BlockchainAddress], ss58_format: SS58Format = SS58_FORMAT__TRAIT_ASSET_HUB
+) -> npt.NDArray[np.void]:
+    """
+    Decode many encoded blockchain addresses into a structured array.
+
+    Fields of the array:
+        address_type (uint8): Value of `AddressType` of the address.
+        app_agent_id (uint32): AppAgent ID of keyless addresses, `MISSING_ID` for Regular addresses.
+        ta_id (uint32): Transactional address ID of Transactional addresses, `MISSING_ID` for others.
+        name (S10): Address name of Named addresses, empty for others.
+        account_id (V32): Account ID of the address, `.tobytes()` of a field gives its 32 bytes.
+
+    Args:
+        addresses (Iterable[str]): Encoded addresses of any type.
+
+    Returns:
+        np.ndarray: Decoded addresses, in the order of the input, with dtype `ADDRESS_INFO_DTYPE`.
+    """
+    ss58_format_bytes = ss58_format_to_bytes(ss58_format)
+    checksum_state = ss58_checksum_state(ss58_format_bytes)
+
+    # Decode SS58 of every address into one contiguous buffer of account IDs
+    account_ids = []
+    for address in addresses:
+        account_id_bytes = ss58_decode_prepared(address, ss58_format, ss58_format_bytes, checksum_state)
+        if len(account_id_bytes) != 32:  # noqa: PLR2004
+            msg = "Invalid address length"
+            raise ValueError(msg)
+        account_ids.append(account_id_bytes)
+
+    accounts = np.frombuffer(b"".join(account_ids), dtype=np.uint8).reshape(-1, 32)
+
+    # Read the byte that encodes type of the address, and verify checksum of keyless candidates only
+    type_bytes = accounts[:, 4]
+    is_keyless = np.isin(type_bytes, list(_open_part_sizes))
+    for index in np.flatnonzero(is_keyless):
+        is_keyless[index] = _has_keyless_checksum(account_ids[index])
+
+    address_types = np.where(is_keyless, type_bytes, AddressType.Regular.value)
+    is_transactional = address_types == AddressType.Transactional.value
+    is_named = address_types == AddressType.Named.value
+
+    # Extract little-endian IDs and names from their positions in the account IDs
+    app_agent_ids = np.ascontiguousarray(accounts[:, :4]).view("<u4")[:, 0]
+    ta_ids = np.ascontiguousarray(accounts[:, 5:9]).view("<u4")[:, 0]
+    names = np.ascontiguousarray(accounts[:, 5:15]).view(f"S{NAMED_ADDRESS_LENGTH}")[:, 0]
+
+    result = np.empty(len(accounts), dtype=ADDRESS_INFO_DTYPE)
+    result["address_type"] = address_types
+    result["app_agent_id"] = np.where(is_keyless, app_agent_ids, MISSING_ID)
+    result["ta_id"] = np.where(is_transactional, ta_ids, MISSING_ID)
+    result["name"] = np.where(is_named, names, b"")
+    result["account_id"] = accounts.view("V32")[:, 0]
+
+    return result
@@ -0,0 +1,13 @@
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from .keyless import BlockchainAddress, SS58Format
+
+MISSING_ID: int
+ADDRESS_INFO_DTYPE: np.dtype[np.void]
+
+def decode_addresses_np(
+    addresses: Iterable[BlockchainAddress], ss58_format: SS58Format = ...
+) -> npt.NDArray[np.void]: ...